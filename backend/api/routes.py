@@ -1570,7 +1570,7 @@ def reset_legacy_metrics():
     """Reset das métricas dos serviços legacy"""
     try:
         # Limpar métricas do monitor
-        legacy_monitor.metrics.clear()
+        legacy_monitor.reset()
         
         return jsonify({
             "status": "success",
@@ -74,6 +74,7 @@ class Config:
     GLPI_URL = os.getenv('GLPI_URL', 'http://cau.ppiratini.intra.rs.gov.br/glpi/apirest.php')
     GLPI_USER_TOKEN = os.getenv('GLPI_USER_TOKEN')
     GLPI_APP_TOKEN = os.getenv('GLPI_APP_TOKEN')
+    GLPI_POOL_MAXSIZE = int(os.getenv("GLPI_POOL_MAXSIZE", "64"))  # Conexões keep-alive por host
 
     # Mock Data Mode - Para desenvolvimento e testes da interface
     USE_MOCK_DATA = os.getenv("USE_MOCK_DATA", "True").lower() == "true"
@@ -5,6 +5,7 @@ GLPI Authentication Service - Handles session management and authentication.
 Extracted from monolithic GLPIService for better separation of concerns.
 """
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional
@@ -15,6 +16,9 @@ from config.settings import active_config
 from utils.structured_logger import create_glpi_logger
 from utils.structured_logging import log_glpi_request
 
+# Default for authenticate(stale_token=...): treat the token current at call time as stale
+_CURRENT_TOKEN = object()
+
 
 class GLPIAuthenticationService:
     """Handles GLPI authentication and session management."""
@@ -46,6 +50,9 @@ class GLPIAuthenticationService:
         self.max_retries = 3
         self.retry_delay_base = 2
         
+        # Serializes token refresh so concurrent callers don't open parallel sessions
+        self._auth_lock = threading.RLock()
+        
     def _normalize_glpi_url(self, url: str) -> str:
         """Normalize GLPI URL ensuring it ends with /apirest.php."""
         if not url or not isinstance(url, str):
@@ -82,46 +89,72 @@ class GLPIAuthenticationService:
         if not self._is_token_expired():
             return True
             
-        return self.authenticate()
+        return self.authenticate(stale_token=self.session_token)
+        
+    def _token_replaced(self, stale_token: Optional[str]) -> bool:
+        """Whether another thread has stored a valid token other than ``stale_token``."""
+        return self.session_token is not None and self.session_token != stale_token and not self._is_token_expired()
+        
+    def authenticate(self, stale_token: Optional[str] = _CURRENT_TOKEN) -> bool:
+        """Authenticate with GLPI and store session token with retry logic and detailed logging.
         
-    def authenticate(self) -> bool:
-        """Authenticate with GLPI and store session token with retry logic and detailed logging."""
+        Args:
+            stale_token: Session token the caller found invalid (defaults to the current
+                one). If another thread has replaced it once the refresh lock is held, no
+                new session is opened. The lock is held per attempt, never while sleeping.
+        """
+        if stale_token is _CURRENT_TOKEN:
+            stale_token = self.session_token
         self.logger.info(f"[AUTH] Starting authentication process - URL: {self.glpi_url}")
         
         for attempt in range(self.max_retries):
-            try:
-                self.logger.info(f"[AUTH] Authentication attempt {attempt + 1}/{self.max_retries}")
-                
-                # Log current session state
-                self.logger.debug(f"[AUTH] Current session token: {'***' if self.session_token else 'None'}")
-                self.logger.debug(f"[AUTH] Current authenticated state: {not self._is_token_expired()}")
-                
-                success = self._perform_authentication()
-                if success:
-                    self.logger.info(f"[AUTH] Authentication successful on attempt {attempt + 1}")
-                    self.logger.debug(f"[AUTH] New session token obtained: {'***' if self.session_token else 'None'}")
+            with self._auth_lock:
+                # Another thread may have refreshed the token while we waited
+                if self._token_replaced(stale_token):
+                    self.logger.debug("[AUTH] Session refreshed by another caller, skipping login")
+                    return True
+                if self._authentication_attempt(attempt):
                     return True
-                else:
-                    self.logger.warning(f"[AUTH] Authentication failed on attempt {attempt + 1} - no exception thrown")
-                    
-            except requests.exceptions.ConnectionError as e:
-                self.logger.error(f"[AUTH] Connection error on attempt {attempt + 1}: {e}")
-            except requests.exceptions.Timeout as e:
-                self.logger.error(f"[AUTH] Timeout error on attempt {attempt + 1}: {e}")
-            except requests.exceptions.HTTPError as e:
-                self.logger.error(f"[AUTH] HTTP error on attempt {attempt + 1}: {e}")
-            except Exception as e:
-                self.logger.error(f"[AUTH] Unexpected error on attempt {attempt + 1}: {e}")
                 
             if attempt < self.max_retries - 1:
                 delay = self.retry_delay_base ** attempt
                 self.logger.info(f"[AUTH] Waiting {delay} seconds before retry...")
                 time.sleep(delay)
         
-        self.logger.error(f"[AUTH] All {self.max_retries} authentication attempts failed")
-        self.session_token = None
-        self.token_created_at = None
-        self.token_expires_at = None
+        with self._auth_lock:
+            if self._token_replaced(stale_token):
+                return True
+            self.logger.error(f"[AUTH] All {self.max_retries} authentication attempts failed")
+            self.session_token = None
+            self.token_created_at = None
+            self.token_expires_at = None
+            return False
+        
+    def _authentication_attempt(self, attempt: int) -> bool:
+        """One logged login attempt; must be called with the refresh lock held."""
+        try:
+            self.logger.info(f"[AUTH] Authentication attempt {attempt + 1}/{self.max_retries}")
+            
+            # Log current session state
+            self.logger.debug(f"[AUTH] Current session token: {'***' if self.session_token else 'None'}")
+            self.logger.debug(f"[AUTH] Current authenticated state: {not self._is_token_expired()}")
+            
+            success = self._perform_authentication()
+            if success:
+                self.logger.info(f"[AUTH] Authentication successful on attempt {attempt + 1}")
+                self.logger.debug(f"[AUTH] New session token obtained: {'***' if self.session_token else 'None'}")
+                return True
+            else:
+                self.logger.warning(f"[AUTH] Authentication failed on attempt {attempt + 1} - no exception thrown")
+                
+        except requests.exceptions.ConnectionError as e:
+            self.logger.error(f"[AUTH] Connection error on attempt {attempt + 1}: {e}")
+        except requests.exceptions.Timeout as e:
+            self.logger.error(f"[AUTH] Timeout error on attempt {attempt + 1}: {e}")
+        except requests.exceptions.HTTPError as e:
+            self.logger.error(f"[AUTH] HTTP error on attempt {attempt + 1}: {e}")
+        except Exception as e:
+            self.logger.error(f"[AUTH] Unexpected error on attempt {attempt + 1}: {e}")
         return False
         
     def _authenticate_with_retry(self) -> bool:
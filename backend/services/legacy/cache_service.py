@@ -4,8 +4,28 @@ GLPI Cache Service - Handles caching logic for GLPI data.
 
 Extracted from monolithic GLPIService for better separation of concerns.
 """
+import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Result TTLs by how recently the query window ended: closed periods only change
+# through late edits, yesterday still gets stragglers, today's window churns
+_CLOSED_WINDOW_TTL = 86400
+_RECENT_WINDOW_TTL = 3600
+_OPEN_WINDOW_TTL = 60
+
+# Sub-key maps are swept for expired entries once every this many writes to them
+_SUB_KEY_SWEEP_THRESHOLD = 512
+
+# Miss marker for lookups where cached falsy data must still count as a hit
+_MISSING = object()
 
 
 class GLPICacheService:
@@ -45,6 +65,12 @@ class GLPICacheService:
                 "ttl": 240,  # 4 minutes
             },
         }
+        # Stale-while-revalidate: background refreshers and the keys being refreshed
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        # Sub-key writes per cache key, driving the periodic expired-entry sweep
+        self._sub_key_writes = defaultdict(count)
         
     def _is_cache_valid(self, cache_key: str, sub_key: str = None) -> bool:
         """Check if cache entry is valid and not expired."""
@@ -77,25 +103,37 @@ class GLPICacheService:
         except Exception:
             return False
             
-    def _get_cache_data(self, cache_key: str, sub_key: str = None):
-        """Get data from cache if valid."""
+    def _get_cache_data(self, cache_key: str, sub_key: str = None, default: Any = None):
+        """Get data from cache if valid, or ``default`` on miss/expiry.
+        
+        Validity is checked in the same lookup, so a hit costs one probe.
+        Pass a sentinel as ``default`` to tell a miss apart from cached falsy data.
+        """
         try:
-            if not self._is_cache_valid(cache_key, sub_key):
-                return None
+            cache_entry = self._cache.get(cache_key)
+            if cache_entry is None:
+                return default
                 
-            cache_entry = self._cache[cache_key]
-            
             if sub_key:
-                if isinstance(cache_entry.get("data"), dict) and sub_key in cache_entry["data"]:
-                    sub_entry = cache_entry["data"][sub_key]
-                    if isinstance(sub_entry, dict):
-                        return sub_entry.get("data")
-                return None
+                sub_entries = cache_entry.get("data")
+                if not isinstance(sub_entries, dict):
+                    return default
+                entry = sub_entries.get(sub_key)
+                if not isinstance(entry, dict):
+                    return default
+                ttl = entry.get("ttl", cache_entry.get("ttl", 300))
             else:
-                return cache_entry.get("data")
+                entry = cache_entry
+                ttl = entry.get("ttl", 300)
+                
+            timestamp = entry.get("timestamp")
+            if not timestamp or time.time() - timestamp >= ttl:
+                return default
+                
+            return entry.get("data")
                 
         except Exception:
-            return None
+            return default
             
     def _set_cache_data(self, cache_key: str, data: Any, ttl: int = 300, sub_key: str = None):
         """Set data in cache with TTL."""
@@ -113,7 +151,12 @@ class GLPICacheService:
                 if not isinstance(self._cache[cache_key]["data"], dict):
                     self._cache[cache_key]["data"] = {}
                     
-                self._cache[cache_key]["data"][sub_key] = {
+                sub_entries = self._cache[cache_key]["data"]
+                # Every N-th write, however many entries are live, so the scan stays amortized
+                if next(self._sub_key_writes[cache_key]) % _SUB_KEY_SWEEP_THRESHOLD == _SUB_KEY_SWEEP_THRESHOLD - 1:
+                    self._sweep_expired(sub_entries, current_time)
+                    
+                sub_entries[sub_key] = {
                     "data": data,
                     "timestamp": current_time,
                     "ttl": ttl,
@@ -128,9 +171,147 @@ class GLPICacheService:
             # Log cache errors but don't fail the operation
             pass
             
-    def get_cached_data(self, cache_key: str, sub_key: str = None):
+    @staticmethod
+    def _sweep_expired(sub_entries: Dict[str, Any], now: float):
+        """Drop expired sub-key entries; versioned keys are never read again once superseded."""
+        # Snapshot the items: refresh threads may write to the map concurrently
+        for key, entry in list(sub_entries.items()):
+            if not isinstance(entry, dict) or now - (entry.get("timestamp") or 0) >= entry.get("ttl", 300):
+                sub_entries.pop(key, None)
+            
+    def get_with_swr(
+        self,
+        cache_key: str,
+        refresh: Optional[Callable[[], Any]] = None,
+        max_stale: int = 3600,
+    ) -> Tuple[Any, bool]:
+        """Get data with stale-while-revalidate semantics.
+        
+        Returns ``(data, is_stale)``. An expired entry younger than ``max_stale``
+        seconds is still served, and ``refresh`` is scheduled in the background
+        (at most once per key) to recompute it; a non-None result is cached with
+        the entry's TTL. Returns ``(None, False)`` on a miss.
+        """
+        try:
+            cache_entry = self._cache.get(cache_key)
+            if cache_entry is None:
+                return None, False
+                
+            timestamp = cache_entry.get("timestamp")
+            data = cache_entry.get("data")
+            if not timestamp or data is None:
+                return None, False
+                
+            elapsed = time.time() - timestamp
+            ttl = cache_entry.get("ttl", 300)
+            if elapsed < ttl:
+                return data, False
+            if elapsed >= max_stale:
+                return None, False
+                
+            if refresh is not None:
+                self._schedule_refresh(cache_key, refresh, ttl)
+            return data, True
+            
+        except Exception:
+            return None, False
+            
+    def get_revalidated(
+        self,
+        cache_key: str,
+        sub_key: str,
+        is_unchanged: Callable[[float], bool],
+        default: Any = None,
+    ):
+        """Get a sub-key entry, revalidating it instead of dropping it once expired.
+        
+        A valid entry is returned as is. An expired one is passed to
+        ``is_unchanged(stored_at)`` (a cheap probe against the source, given the
+        entry's epoch timestamp); if it confirms nothing changed, the entry gets a
+        fresh TTL window and is served. Otherwise ``default`` is returned.
+        """
+        try:
+            cache_entry = self._cache.get(cache_key)
+            sub_entries = cache_entry.get("data") if cache_entry else None
+            entry = sub_entries.get(sub_key) if isinstance(sub_entries, dict) else None
+            if not isinstance(entry, dict) or not entry.get("timestamp"):
+                return default
+                
+            stored_at = entry["timestamp"]
+            now = time.time()
+            if now - stored_at < entry.get("ttl", cache_entry.get("ttl", 300)):
+                return entry.get("data")
+                
+            if not is_unchanged(stored_at):
+                return default
+            entry["timestamp"] = now
+            return entry.get("data")
+            
+        except Exception:
+            return default
+            
+    def _schedule_refresh(self, cache_key: str, refresh: Callable[[], Any], ttl: int):
+        """Submit a background refresh for ``cache_key`` unless one is in flight."""
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="glpi-cache-refresh"
+                )
+                
+        def run():
+            try:
+                data = refresh()
+                if data is not None:
+                    self._set_cache_data(cache_key, data, ttl)
+            except Exception as e:
+                logger.warning("Falha ao revalidar cache %s: %s", cache_key, e)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(cache_key)
+                    
+        try:
+            self._refresh_executor.submit(run)
+        except RuntimeError:
+            # Executor encerrado (shutdown do processo): não revalida
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+        
+    @staticmethod
+    def ttl_for_window(end_date: str) -> int:
+        """TTL for results of a query window ending at ``end_date`` (YYYY-MM-DD).
+        
+        Unparseable dates get the shortest TTL.
+        """
+        try:
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return _OPEN_WINDOW_TTL
+        today = date.today()
+        if end >= today:
+            return _OPEN_WINDOW_TTL
+        if end == today - timedelta(days=1):
+            return _RECENT_WINDOW_TTL
+        return _CLOSED_WINDOW_TTL
+        
+    def get_cached_data(self, cache_key: str, sub_key: str = None, default: Any = None):
         """Public method to get cached data."""
-        return self._get_cache_data(cache_key, sub_key)
+        return self._get_cache_data(cache_key, sub_key, default)
+        
+    def get_cached_many(self, cache_key: str, sub_keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several sub-keys of ``cache_key`` in one call.
+        
+        Returns only the valid hits, keyed by sub-key; misses and expired
+        entries are left out so callers can fetch the remainder in one batch.
+        """
+        hits = {}
+        for sub_key in sub_keys:
+            data = self._get_cache_data(cache_key, sub_key, _MISSING)
+            if data is not _MISSING:
+                hits[sub_key] = data
+        return hits
         
     def set_cached_data(self, cache_key: str, data: Any, ttl: int = 300, sub_key: str = None):
         """Public method to set cached data."""
@@ -5,9 +5,18 @@ GLPI Service Facade - Maintains backward compatibility while using decomposed se
 This facade provides the same interface as the original monolithic GLPIService
 but internally uses the new decomposed services for better separation of concerns.
 """
+import heapq
 import logging
+import math
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import cached_property, lru_cache
+from itertools import chain, compress
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .authentication_service import GLPIAuthenticationService
 from .cache_service import GLPICacheService
@@ -17,6 +26,167 @@ from .metrics_service import GLPIMetricsService
 from .dashboard_service import GLPIDashboardService
 from .trends_service import GLPITrendsService
 
+# Sentinel returned by the cache on miss, so cached falsy values still count as hits
+_MISS = object()
+
+# Concurrent page requests issued once the first page reveals totalcount
+_PAGINATION_MAX_WORKERS = 8
+
+# Seconds a failed GLPI lookup is answered from cache instead of being retried
+_NEGATIVE_CACHE_TTL = 10
+
+# Minimum seconds between pagination progress log lines
+_PROGRESS_LOG_INTERVAL = 2.0
+
+# GLPI ticket status / priority IDs -> display names
+_STATUS_NAMES = {
+    '1': 'Novo',
+    '2': 'Processando (atribuído)',
+    '3': 'Processando (planejado)',
+    '4': 'Pendente',
+    '5': 'Solucionado',
+    '6': 'Fechado',
+}
+_PRIORITY_NAMES = {
+    '1': 'Muito baixa',
+    '2': 'Baixa',
+    '3': 'Normal',
+    '4': 'Alta',
+    '5': 'Muito alta',
+    '6': 'Crítica',
+}
+
+# Status IDs counted as resolved / pending by the filtered dashboard
+_RESOLVED_STATUS_IDS = ('5', '6')
+_PENDING_STATUS_IDS = ('1', '2', '3', '4')
+
+# Concurrent count-only searches for one filtered dashboard request
+_FILTERED_COUNT_MAX_WORKERS = 8
+
+# Sort key for technician ranking entries
+_BY_PERFORMANCE_SCORE = itemgetter("performance_score")
+
+# Level mentioned in a technician name (name heuristic used without GLPI groups)
+_LEVEL_IN_NAME = re.compile(r"N[1-4]")
+
+# Date parsing for ticket rows: ISO fast path, then the other formats GLPI may return
+_ISO_FAST = datetime.fromisoformat
+_FALLBACK_DATE_FORMATS = ('%d/%m/%Y %H:%M:%S', '%d/%m/%Y')
+
+# Ticket status / priority IDs counted as resolved (Solucionado, Fechado) and high priority (Alta, Muito alta)
+_RESOLVED_STATUSES = frozenset(_RESOLVED_STATUS_IDS)
+_HIGH_PRIORITIES = frozenset({"4", "5"})
+
+# Fixed sort/columns for the new-tickets search (most recent first)
+_NEW_TICKET_FORCEDISPLAY = {
+    'order': 'DESC',
+    'sort': '15',             # Creation date
+    'forcedisplay[0]': '2',   # ID
+    'forcedisplay[1]': '1',   # Name/Title
+    'forcedisplay[2]': '12',  # Status
+    'forcedisplay[3]': '15',  # Creation date
+    'forcedisplay[4]': '3',   # Priority
+    'forcedisplay[5]': '21',  # Content/Description
+    'forcedisplay[6]': '4',   # Requester
+}
+
+# Query-string key templates for a single GLPI search criterion
+_CRIT_KEYS = (
+    "criteria[%d][field]",
+    "criteria[%d][searchtype]",
+    "criteria[%d][value]",
+    "criteria[%d][link]",
+)
+
+# Base query for technician ranking: resolved/closed tickets with the ranking columns
+_RANKING_BASE_PARAMS = {
+    "criteria[0][field]": "12",  # Status field
+    "criteria[0][searchtype]": "equals",
+    "criteria[0][value]": "5",  # Solucionado - PRIORIDADE PARA RANKING
+    "criteria[1][field]": "12",
+    "criteria[1][searchtype]": "equals",
+    "criteria[1][value]": "6",  # Fechado - PRIORIDADE PARA RANKING
+    "criteria[1][link]": "OR",
+    "forcedisplay[0]": "2",   # ID
+    "forcedisplay[1]": "12",  # Status
+    "forcedisplay[2]": "5",   # Technician
+    "forcedisplay[3]": "15",  # Creation date
+    "forcedisplay[4]": "19",  # Modification date
+    "forcedisplay[5]": "3",   # Priority
+}
+
+
+class _LegacyMockResponse:
+    """Minimal ``requests.Response`` stand-in returned by the legacy request shim."""
+    
+    __slots__ = ("_data", "status_code", "ok")
+    
+    def __init__(self, data: Any, status_code: int):
+        self._data = data
+        self.status_code = status_code
+        self.ok = status_code < 400
+        
+    def json(self) -> Any:
+        return self._data
+        
+    @property
+    def text(self) -> str:
+        return str(self._data)
+
+
+def _criterion(index: int, field: str, searchtype: str, value: Any, link: Optional[str] = None) -> Dict[str, Any]:
+    """Build the flat query-string keys for one GLPI search criterion."""
+    field_key, searchtype_key, value_key, link_key = _CRIT_KEYS
+    criterion = {
+        field_key % index: field,
+        searchtype_key % index: searchtype,
+        value_key % index: value,
+    }
+    if link:
+        criterion[link_key % index] = link
+    return criterion
+
+
+def _build_criteria(*specs: Optional[Tuple[str, str, Any]]) -> Dict[str, Any]:
+    """Flatten ``(field, searchtype, value)`` specs into auto-indexed criteria joined by AND.
+    
+    ``None`` specs are skipped, so optional filters can be passed inline.
+    """
+    params: Dict[str, Any] = {}
+    for index, spec in enumerate(spec for spec in specs if spec):
+        params.update(_criterion(index, *spec, "AND" if index else None))
+    return params
+
+
+def _aggregate_ranking(
+    tech_ids: List[str], statuses: List[str], priorities: List[str]
+) -> Tuple[Counter, Counter, Counter]:
+    """Reduce parallel (technician, status, priority) columns to per-technician counts.
+    
+    Every pass runs inside C iterators (``Counter``, ``compress``, ``map``), so no
+    Python bytecode executes per row.
+    
+    Returns:
+        Tuple of Counters ``(total, resolved, high_priority)`` keyed by technician ID
+    """
+    total = Counter(tech_ids)
+    resolved = Counter(compress(tech_ids, map(_RESOLVED_STATUSES.__contains__, statuses)))
+    high = Counter(compress(tech_ids, map(_HIGH_PRIORITIES.__contains__, priorities)))
+    return total, resolved, high
+
+
+def _optimal_page_size(max_results: int, cap: int = 500) -> int:
+    """Smallest page size that covers ``max_results`` in the minimum number of round trips."""
+    pages = math.ceil(max_results / cap)
+    return math.ceil(max_results / pages)
+
+
+def _trunc(value: Any, limit: int = 200, default: str = "Sem descrição") -> str:
+    """Truncate a GLPI text field, skipping the slice copy for short strings."""
+    if not isinstance(value, str):
+        value = default if value is None else str(value)
+    return value if len(value) <= limit else value[:limit]
+
 
 class GLPIServiceFacade:
     """
@@ -52,7 +222,9 @@ class GLPIServiceFacade:
         # Expose common properties for backward compatibility
         self.service_levels = self.metrics_service.service_levels
         self.status_map = self.metrics_service.status_map
-        self.field_ids = {}
+        
+        # Requester names rarely change and repeat across rows; failed lookups are not cached
+        self._requester_names = lru_cache(maxsize=256)(self._fetch_requester_name)
         
         # Initialize field discovery
         self.discover_field_ids()
@@ -74,14 +246,20 @@ class GLPIServiceFacade:
     def discover_field_ids(self) -> bool:
         """Discover GLPI field IDs."""
         result = self.field_service.discover_field_ids()
-        # Update local field_ids for backward compatibility
-        self.field_ids = self.field_service.get_all_field_ids()
+        # Refresh the memoized field_ids on next access
+        self.__dict__.pop("field_ids", None)
+        self.metrics_service.invalidate_field_ids()
         return result
+    
+    @cached_property
+    def field_ids(self) -> Dict[str, int]:
+        """Field name -> ID map, memoized until rediscovery or ``invalidate_cache``."""
+        return self.field_service.get_all_field_ids()
         
     # Cache methods
-    def _get_cache_data(self, cache_key: str, sub_key: str = None):
+    def _get_cache_data(self, cache_key: str, sub_key: str = None, default: Any = None):
         """Get cached data."""
-        return self.cache_service.get_cached_data(cache_key, sub_key)
+        return self.cache_service.get_cached_data(cache_key, sub_key, default)
         
     def _set_cache_data(self, cache_key: str, data: Any, ttl: int = 300, sub_key: str = None):
         """Set cached data."""
@@ -158,17 +336,16 @@ class GLPIServiceFacade:
     ) -> Dict[str, Any]:
         """Get metrics by service level with detailed logging."""
         try:
-            self.logger.info(f"[METRICS_LEVEL] Starting metrics by level request - start_date: {start_date}, end_date: {end_date}")
+            self.logger.info("[METRICS_LEVEL] Starting metrics by level request - start_date: %s, end_date: %s", start_date, end_date)
             
             # Check cache first
             cache_key = f"metrics_level_{start_date}_{end_date}"
-            self.logger.debug(f"[METRICS_LEVEL] Checking cache with key: {cache_key}")
-            cached_result = self.cache_service.get_cached_data("metrics_level", cache_key)
-            if cached_result:
-                self.logger.info(f"[METRICS_LEVEL] Returning cached metrics for period {start_date} to {end_date}")
+            cached_result = self.cache_service.get_cached_data("metrics_level", cache_key, default=_MISS)
+            if cached_result is not _MISS:
+                self.logger.info("[METRICS_LEVEL] Returning cached metrics for period %s to %s", start_date, end_date)
                 return cached_result
             
-            self.logger.info(f"[METRICS_LEVEL] Cache miss, fetching fresh metrics from service")
+            self.logger.info("[METRICS_LEVEL] Cache miss, fetching fresh metrics from service")
             
             # Get metrics from the metrics service
             metrics_result = self.metrics_service.get_metrics_by_level(start_date, end_date)
@@ -182,7 +359,7 @@ class GLPIServiceFacade:
             
             # Cache the result
             self.cache_service.set_cached_data("metrics_level", metrics_result, ttl=300, sub_key=cache_key)
-            self.logger.debug(f"[METRICS_LEVEL] Cached metrics result with key: {cache_key}")
+            self.logger.debug("[METRICS_LEVEL] Cached metrics result with key: %s", cache_key)
             
             return metrics_result
             
@@ -212,6 +389,10 @@ class GLPIServiceFacade:
                     self.logger.error("Failed to authenticate with GLPI")
                     return self._get_enhanced_mock_tickets(limit, "Authentication failed")
             
+            # Snapshot the clock once per request
+            now = datetime.now()
+            since = (now - timedelta(days=30)).strftime('%Y-%m-%d')  # Last 30 days
+            
             # Enhanced search criteria for recent tickets
             search_criteria = {
                 'range': f'0-{limit-1}',  # Limit results
@@ -219,7 +400,7 @@ class GLPIServiceFacade:
                 'sort': '15',  # Sort by creation date (field 15)
                 'criteria[0][field]': '15',  # Creation date field
                 'criteria[0][searchtype]': 'morethan',
-                'criteria[0][value]': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),  # Last 30 days
+                'criteria[0][value]': since,
                 'forcedisplay[0]': '2',   # ID
                 'forcedisplay[1]': '1',   # Name/Title
                 'forcedisplay[2]': '12',  # Status
@@ -247,15 +428,16 @@ class GLPIServiceFacade:
             tickets_data = []
             if response_data and 'data' in response_data:
                 self.logger.info(f"Processing {len(response_data['data'])} tickets from GLPI")
+                default_created = now.isoformat()
                 for ticket_row in response_data['data']:
                     # GLPI returns data as arrays with numeric keys
                     ticket = {
                         'id': str(ticket_row.get('2', 'unknown')),  # Ensure string ID
                         'title': str(ticket_row.get('1', 'Sem título')),  # Name field
                         'status': self._get_status_name(ticket_row.get('12', '1')),  # Status field
-                        'created_date': self._format_date(ticket_row.get('15', datetime.now().isoformat())),  # Creation date
+                        'created_date': self._format_date(ticket_row.get('15', default_created)),  # Creation date
                         'priority': self._get_priority_name(ticket_row.get('3', '3')),  # Priority field
-                        'description': str(ticket_row.get('21', 'Sem descrição'))[:200],  # Truncated description
+                        'description': _trunc(ticket_row.get('21')),  # Truncated description
                         'requester': self._get_requester_name(ticket_row.get('4', '0'))  # Resolve requester name
                     }
                     tickets_data.append(ticket)
@@ -283,13 +465,14 @@ class GLPIServiceFacade:
         # Generate realistic mock ticket entries
         statuses = ['Novo', 'Processando (atribuído)', 'Pendente', 'Solucionado']
         priorities = ['Muito baixa', 'Baixa', 'Normal', 'Alta', 'Muito alta']
+        now = datetime.now()
         
         for i in range(min(limit, 10)):  # Limit mock data to 10 items
             ticket = {
                 'id': f'mock_{i+1:03d}',
                 'title': f'Ticket de Exemplo #{i+1} - Sistema Indisponível',
                 'status': statuses[i % len(statuses)],
-                'created_date': (datetime.now() - timedelta(hours=i*2)).strftime('%Y-%m-%d'),
+                'created_date': (now - timedelta(hours=i*2)).strftime('%Y-%m-%d'),
                 'priority': priorities[i % len(priorities)],
                 'description': f'Ticket mock gerado devido a falha na API GLPI: {error_context or "Erro desconhecido"}',
                 'requester': f'usuario.exemplo{i+1}@ppiratini.rs.gov.br'
@@ -314,13 +497,16 @@ class GLPIServiceFacade:
         """Format date string to ISO format."""
         try:
             if isinstance(date_str, str) and date_str:
-                # Try to parse and reformat the date
-                from datetime import datetime
-                # Handle different date formats from GLPI
-                for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d/%m/%Y %H:%M:%S', '%d/%m/%Y']:
+                # Fast path: GLPI dates are ISO ("YYYY-MM-DD HH:MM:SS")
+                iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+                try:
+                    return _ISO_FAST(iso_str).strftime('%Y-%m-%d')
+                except ValueError:
+                    pass
+                # Handle the remaining date formats from GLPI
+                for fmt in _FALLBACK_DATE_FORMATS:
                     try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        return parsed_date.strftime('%Y-%m-%d')
+                        return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
                     except ValueError:
                         continue
                 # If no format matches, return as-is
@@ -332,87 +518,145 @@ class GLPIServiceFacade:
     
     def _get_status_name(self, status_id: str) -> str:
         """Convert status ID to status name."""
-        status_names = {
-            '1': 'Novo',
-            '2': 'Processando (atribuído)',
-            '3': 'Processando (planejado)',
-            '4': 'Pendente',
-            '5': 'Solucionado',
-            '6': 'Fechado'
-        }
-        return status_names.get(str(status_id), 'Desconhecido')
+        return _STATUS_NAMES.get(str(status_id), 'Desconhecido')
     
     def _get_priority_name(self, priority_id: str) -> str:
         """Convert priority ID to priority name."""
-        priority_names = {
-            '1': 'Muito baixa',
-            '2': 'Baixa',
-            '3': 'Normal',
-            '4': 'Alta',
-            '5': 'Muito alta',
-            '6': 'Crítica'
-        }
-        return priority_names.get(str(priority_id), 'Normal')
+        return _PRIORITY_NAMES.get(str(priority_id), 'Normal')
     
     def _get_requester_name(self, requester_id: str) -> str:
-        """Get requester name from ID."""
+        """Get requester name from ID (memoized per facade; see ``invalidate_requester_names``)."""
+        if not requester_id or requester_id == '0':
+            self.logger.debug("Requester ID is empty or 0")
+            return 'Usuário desconhecido'
+        
         try:
-            self.logger.info(f"DEBUG: Getting requester name for ID: {requester_id}")
-            
-            if not requester_id or requester_id == '0':
-                self.logger.info("DEBUG: Requester ID is empty or 0")
-                return 'Usuário desconhecido'
-            
-            # Try to get user info from GLPI API
-            self.logger.info(f"DEBUG: Making API request for User/{requester_id}")
-            success, user_data, error_msg, status_code = self.http_client._make_authenticated_request(
-                "GET", f"User/{requester_id}"
-            )
-            
-            self.logger.info(f"DEBUG: API response - success: {success}, status: {status_code}, error: {error_msg}")
-            
-            if success and user_data:
-                self.logger.info(f"DEBUG: User data received: {user_data}")
-                # Get the user's real name or login
-                real_name = user_data.get('realname', '')
-                first_name = user_data.get('firstname', '')
-                login = user_data.get('name', '')
-                
-                self.logger.info(f"DEBUG: Names - real: '{real_name}', first: '{first_name}', login: '{login}'")
-                
-                # Build full name
-                if real_name and first_name:
-                    result = f"{first_name} {real_name}"
-                elif real_name:
-                    result = real_name
-                elif first_name:
-                    result = first_name
-                elif login:
-                    result = login
-                else:
-                    result = f"Usuário #{requester_id}"
-                
-                self.logger.info(f"DEBUG: Final requester name: '{result}'")
-                return result
-            else:
-                self.logger.warning(f"Could not get user info for ID {requester_id}: {error_msg}")
-                return f"Usuário #{requester_id}"
-                
+            return self._requester_names(str(requester_id))
+        except LookupError as e:
+            self.logger.warning(f"Could not get user info for ID {requester_id}: {e}")
         except Exception as e:
             self.logger.error(f"Error getting requester name for ID {requester_id}: {e}")
-            return f"Usuário #{requester_id}"
+        return f"Usuário #{requester_id}"
+    
+    def _fetch_requester_name(self, requester_id: str) -> str:
+        """Look up a requester name in GLPI; raises LookupError so failures are not memoized."""
+        success, user_data, error_msg, status_code = self.http_client._make_authenticated_request(
+            "GET", f"User/{requester_id}"
+        )
+        
+        self.logger.debug("User %s lookup - success: %s, status: %s, error: %s", requester_id, success, status_code, error_msg)
+        
+        if not success or not user_data:
+            raise LookupError(error_msg)
+        
+        result = self._compose_user_name(
+            requester_id, user_data.get('firstname'), user_data.get('realname'), user_data.get('name')
+        )
+        self.logger.debug("Requester %s resolved to '%s'", requester_id, result)
+        return result
+    
+    @staticmethod
+    def _compose_user_name(user_id: str, first_name: Any, real_name: Any, login: Any) -> str:
+        """Build a display name from the user's first name, real name or login."""
+        if real_name and first_name:
+            return f"{first_name} {real_name}"
+        return real_name or first_name or login or f"Usuário #{user_id}"
+    
+    def _get_requester_names(self, requester_ids: List[str]) -> Dict[str, str]:
+        """Resolve several requester IDs with a single GLPI User search.
+        
+        Falls back to per-ID lookups (``_get_requester_name``) if the search fails.
+        """
+        ids = list(dict.fromkeys(rid for rid in requester_ids if rid and rid != '0'))
+        if not ids:
+            return {}
+        
+        params = {
+            'range': f'0-{len(ids) - 1}',
+            'forcedisplay[0]': '2',   # ID
+            'forcedisplay[1]': '1',   # Login
+            'forcedisplay[2]': '9',   # First name
+            'forcedisplay[3]': '34',  # Real name
+        }
+        for index, requester_id in enumerate(ids):
+            params.update(_criterion(index, '2', 'equals', requester_id, 'OR' if index else None))
+        
+        success, response_data, error_msg, status_code = self.http_client.search('User', params)
+        if not success or not isinstance(response_data, dict):
+            self.logger.warning(f"Batch requester lookup failed ({error_msg}); resolving {len(ids)} IDs individually")
+            return {requester_id: self._get_requester_name(requester_id) for requester_id in ids}
+        
+        names = {requester_id: f"Usuário #{requester_id}" for requester_id in ids}
+        for row in response_data.get('data', []):
+            user_id = str(row.get('2', ''))
+            if user_id in names:
+                names[user_id] = self._compose_user_name(user_id, row.get('9'), row.get('34'), row.get('1'))
+        return names
+    
+    def invalidate_requester_names(self):
+        """Drop memoized requester names (e.g. after users are edited in GLPI)."""
+        self._requester_names.cache_clear()
         
     def _get_technician_name(self, tech_id: str) -> str:  
         """Get technician name from ID."""
         return self.metrics_service.get_technician_name(tech_id)
         
-    def get_technician_performance(self, limit: int = 10) -> Dict[str, Any]:
-        """Get technician performance data for ranking."""
+    def _get_technician_names(self, tech_ids: Iterable[str]) -> Dict[str, str]:
+        """Resolve technician names in one batch lookup."""
+        return self.metrics_service.get_technician_names(list(tech_ids))
+        
+    @staticmethod
+    def _parse_technician_ids(tech_field: Any) -> List[str]:
+        """Normalize the GLPI technician field (scalar or list) into valid IDs."""
+        if tech_field is None:
+            return []
+        if isinstance(tech_field, list):
+            # Multiple technicians assigned
+            return [str(tid) for tid in tech_field if tid and str(tid) != "0"]
+        # Single technician
+        tech_id = str(tech_field)
+        if tech_id != "0" and tech_id != "None":
+            return [tech_id]
+        return []
+        
+    def _count_technician_tickets(self, tickets: Iterable[Dict[str, Any]]):
+        """Count total, resolved and high-priority tickets per technician.
+        
+        Builds (technician, status, priority) columns in one pass over the rows
+        and reduces them with ``_aggregate_ranking``; technicians keep first-seen order.
+        
+        Returns:
+            Tuple of Counters ``(total, resolved, high_priority)`` keyed by technician ID
+        """
+        arr_tech: List[str] = []
+        arr_status: List[str] = []
+        arr_prio: List[str] = []
+        
+        for ticket in tickets:
+            tech_ids = self._parse_technician_ids(ticket.get("5"))  # Technician field
+            if not tech_ids:
+                continue  # Skip tickets without valid technicians
+            
+            status = ticket.get("12", "1")
+            priority = ticket.get("3", "3")
+            for tech_id in tech_ids:
+                arr_tech.append(tech_id)
+                arr_status.append(status)
+                arr_prio.append(priority)
+        
+        return _aggregate_ranking(arr_tech, arr_status, arr_prio)
+        
+    def get_technician_performance(self, limit: int = 50) -> Dict[str, Any]:
+        """Get technician performance data for ranking.
+        
+        Args:
+            limit: Scales the ticket sample (``limit * 3`` tickets are paginated)
+        """
         try:
             self.logger.info("Obtendo dados de performance dos técnicos")
             
             # Check cache first
-            cache_key = "technician_performance"
+            cache_key = f"technician_performance_{limit}"
             cached_data = self.cache_service.get_cached_data("technician_ranking", cache_key)
             if cached_data:
                 self.logger.info("Dados de performance obtidos do cache")
@@ -423,105 +667,56 @@ class GLPIServiceFacade:
                 }
             
             # Get tickets assigned to technicians using multiple OR criteria
-            params = {
-                "range": "0-999",
-                "criteria[0][field]": "12",  # Status field
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": "5",  # Solucionado
-                "criteria[1][field]": "12",
-                "criteria[1][searchtype]": "equals",
-                "criteria[1][value]": "6",  # Fechado
-                "criteria[1][link]": "OR",
-                "forcedisplay[0]": "2",   # ID
-                "forcedisplay[1]": "12",  # Status
-                "forcedisplay[2]": "5",   # Technician
-                "forcedisplay[3]": "15",  # Creation date
-                "forcedisplay[4]": "19",  # Modification date
-                "forcedisplay[5]": "3",   # Priority
-            }
+            params = _RANKING_BASE_PARAMS.copy()
+            
+            # Para de paginar assim que houver técnicos suficientes para o ranking
+            seen_techs = set()
             
-            # Usa paginação iterativa para obter todos os tickets
-            all_tickets = self._paginated_search("search/Ticket", params, max_results=limit * 3)
+            def enough_technicians(page: List[Dict[str, Any]]) -> bool:
+                for ticket in page:
+                    seen_techs.update(self._parse_technician_ids(ticket.get("5")))
+                return len(seen_techs) >= limit
             
-            if not all_tickets:
+            # Usa paginação iterativa e agrega página a página, sem reter todas as linhas
+            failed_at = []
+            pages = self._paginated_search_iter(
+                "search/Ticket", params, max_results=limit * 3, early_stop=enough_technicians,
+                on_failure=failed_at.append,
+            )
+            total, resolved, high = self._count_technician_tickets(chain.from_iterable(pages))
+            
+            # Só a falha da primeira página é erro; nas seguintes, agrega o que chegou
+            if failed_at and failed_at[0] == 0:
                 self.logger.error("Falha ao obter tickets via paginação")
                 return {
                     "success": False,
                     "data": [],
-                    "error": error or "Falha ao obter dados dos tickets"
+                    "error": "Falha ao obter dados dos tickets"
                 }
             
-            # Process tickets data
-            tickets = all_tickets
-            technician_stats = {}
-            
-            for ticket in tickets:
-                tech_field = ticket.get("5")  # Technician field
-                
-                # Handle different technician field formats
-                tech_ids = []
-                if tech_field is None:
-                    continue  # Skip tickets without technicians
-                elif isinstance(tech_field, list):
-                    # Multiple technicians assigned
-                    tech_ids = [str(tid) for tid in tech_field if tid and str(tid) != "0"]
-                else:
-                    # Single technician
-                    tech_id = str(tech_field)
-                    if tech_id != "0" and tech_id != "None":
-                        tech_ids = [tech_id]
-                
-                if not tech_ids:
-                    continue  # Skip if no valid technicians found
-                
-                # Process each technician for this ticket
-                for tech_id in tech_ids:
-                    
-                    if tech_id not in technician_stats:
-                        technician_stats[tech_id] = {
-                            "id": tech_id,
-                            "name": self._get_technician_name(tech_id),
-                            "total_tickets": 0,
-                            "resolved_tickets": 0,
-                            "pending_tickets": 0,
-                            "high_priority_tickets": 0,
-                            "avg_resolution_time": 0
-                        }
-                    
-                    stats = technician_stats[tech_id]
-                    stats["total_tickets"] += 1
-                    
-                    # Count by status
-                    status = ticket.get("12", "1")
-                    if status in ["5", "6"]:  # Resolved/Closed
-                        stats["resolved_tickets"] += 1
-                    else:
-                        stats["pending_tickets"] += 1
-                    
-                    # Count high priority
-                    priority = ticket.get("3", "3")
-                    if priority in ["4", "5"]:  # High/Very High priority
-                        stats["high_priority_tickets"] += 1
+            # Resolve all technician names in one batch lookup
+            names = self._get_technician_names(total)
             
-            # Convert to list and calculate performance metrics
             performance_data = []
-            for tech_id, stats in technician_stats.items():
-                if stats["total_tickets"] > 0:
-                    stats["resolution_rate"] = round(
-                        (stats["resolved_tickets"] / stats["total_tickets"]) * 100, 2
-                    )
-                    stats["performance_score"] = (
-                        stats["resolution_rate"] * 0.6 +  # 60% weight on resolution rate
-                        min(stats["total_tickets"] * 2, 40) * 0.4  # 40% weight on volume (capped at 40)
-                    )
-                else:
-                    stats["resolution_rate"] = 0
-                    stats["performance_score"] = 0
-                
-                performance_data.append(stats)
+            for tech_id, total_tickets in total.items():
+                resolution_rate = round((resolved[tech_id] / total_tickets) * 100, 2)
+                performance_data.append({
+                    "id": tech_id,
+                    "name": names[tech_id],
+                    "total_tickets": total_tickets,
+                    "resolved_tickets": resolved[tech_id],
+                    "pending_tickets": total_tickets - resolved[tech_id],
+                    "high_priority_tickets": high[tech_id],
+                    "avg_resolution_time": 0,
+                    "resolution_rate": resolution_rate,
+                    "performance_score": (
+                        resolution_rate * 0.6 +  # 60% weight on resolution rate
+                        min(total_tickets * 2, 40) * 0.4  # 40% weight on volume (capped at 40)
+                    ),
+                })
             
             # Sort by performance score
-            performance_data.sort(key=lambda x: x["performance_score"], reverse=True)
+            performance_data.sort(key=_BY_PERFORMANCE_SCORE, reverse=True)
             
             # Cache the result
             self.cache_service.set_cached_data("technician_ranking", performance_data, ttl=300, sub_key=cache_key)
@@ -575,47 +770,29 @@ class GLPIServiceFacade:
                 return cached_data[:limit] if limit else cached_data
             
             # Build search criteria with filters - PRIORIZAR APENAS TICKETS RESOLVIDOS/FECHADOS
-            base_params = {
-                "criteria[0][field]": "12",  # Status field
-                "criteria[0][searchtype]": "equals",
-                "criteria[0][value]": "5",  # Solucionado - PRIORIDADE PARA RANKING
-                "criteria[1][field]": "12",
-                "criteria[1][searchtype]": "equals",
-                "criteria[1][value]": "6",  # Fechado - PRIORIDADE PARA RANKING
-                "criteria[1][link]": "OR",
-                "forcedisplay[0]": "2",   # ID
-                "forcedisplay[1]": "12",  # Status
-                "forcedisplay[2]": "5",   # Technician
-                "forcedisplay[3]": "15",  # Creation date
-                "forcedisplay[4]": "19",  # Modification date
-                "forcedisplay[5]": "3",   # Priority
-            }
-            
-            # Copy base params to working params
-            params = base_params.copy()
+            params = _RANKING_BASE_PARAMS.copy()
             
             # Add date filters if provided
             criteria_index = 2  # Ajustado para nova estrutura com apenas 2 critérios de status
             if start_date:
-                params[f"criteria[{criteria_index}][field]"] = "15"  # Creation date
-                params[f"criteria[{criteria_index}][searchtype]"] = "morethan"
-                params[f"criteria[{criteria_index}][value]"] = start_date
-                params[f"criteria[{criteria_index}][link]"] = "AND"
+                params.update(_criterion(criteria_index, "15", "morethan", start_date, "AND"))  # Creation date
                 criteria_index += 1
                 
             if end_date:
-                params[f"criteria[{criteria_index}][field]"] = "15"  # Creation date
-                params[f"criteria[{criteria_index}][searchtype]"] = "lessthan"
-                params[f"criteria[{criteria_index}][value]"] = end_date
-                params[f"criteria[{criteria_index}][link]"] = "AND"
+                params.update(_criterion(criteria_index, "15", "lessthan", end_date, "AND"))  # Creation date
                 criteria_index += 1
             
             # Add entity filter if provided
             if entity_id:
-                params[f"criteria[{criteria_index}][field]"] = "80"  # Entity field
-                params[f"criteria[{criteria_index}][searchtype]"] = "equals"
-                params[f"criteria[{criteria_index}][value]"] = str(entity_id)
-                params[f"criteria[{criteria_index}][link]"] = "AND"
+                params.update(_criterion(criteria_index, "80", "equals", str(entity_id), "AND"))  # Entity field
+                criteria_index += 1
+            
+            # Filter by level server-side through the technician group (N1-N4 -> GLPI group IDs)
+            level_group_id = self.service_levels.get(level.upper()) if level else None
+            if level_group_id:
+                group_field_id = self.field_ids.get("groups_id_tech") or 8
+                params.update(_criterion(criteria_index, str(group_field_id), "equals", str(level_group_id), "AND"))
+                criteria_index += 1
             
             success, tickets_data, error, status_code = self.http_client._make_authenticated_request(
                 "GET", "search/Ticket", params=params
@@ -625,91 +802,51 @@ class GLPIServiceFacade:
                 self.logger.error(f"Falha ao obter tickets: {error}")
                 return []
             
-            # Process tickets data
-            tickets = tickets_data.get("data", [])
-            technician_stats = {}
+            total, resolved, high = self._count_technician_tickets(tickets_data.get("data", []))
             
-            for ticket in tickets:
-                tech_field = ticket.get("5")  # Technician field
-                
-                # Handle different technician field formats
-                tech_ids = []
-                if tech_field is None:
-                    continue  # Skip tickets without technicians
-                elif isinstance(tech_field, list):
-                    # Multiple technicians assigned
-                    tech_ids = [str(tid) for tid in tech_field if tid and str(tid) != "0"]
-                else:
-                    # Single technician
-                    tech_id = str(tech_field)
-                    if tech_id != "0" and tech_id != "None":
-                        tech_ids = [tech_id]
-                
-                if not tech_ids:
-                    continue  # Skip if no valid technicians found
-                
-                # Process each technician for this ticket
-                for tech_id in tech_ids:
-                    tech_name = self._get_technician_name(tech_id)
-                    
-                    # Apply level filter if specified
-                    if level and not self._technician_matches_level(tech_name, level):
-                        continue
-                    
-                    if tech_id not in technician_stats:
-                        technician_stats[tech_id] = {
-                            "id": tech_id,
-                            "name": tech_name,
-                            "level": self._extract_technician_level(tech_name),
-                            "total_tickets": 0,
-                            "resolved_tickets": 0,
-                            "pending_tickets": 0,
-                            "high_priority_tickets": 0,
-                            "avg_resolution_time": 0,
-                            "data_source": "glpi",
-                            "is_mock_data": False
-                        }
-                    
-                    stats = technician_stats[tech_id]
-                    stats["total_tickets"] += 1
-                    
-                    # Count by status
-                    status = ticket.get("12", "1")
-                    if status in ["5", "6"]:  # Resolved/Closed
-                        stats["resolved_tickets"] += 1
-                    else:
-                        stats["pending_tickets"] += 1
-                    
-                    # Count high priority
-                    priority = ticket.get("3", "3")
-                    if priority in ["4", "5"]:  # High/Very High priority
-                        stats["high_priority_tickets"] += 1
+            if level and not level_group_id:
+                self.logger.warning(
+                    "Nível %s sem grupo GLPI mapeado; filtrando técnicos pelo nome (heurística obsoleta)", level
+                )
             
-            # Convert to list and calculate performance metrics
+            # Build ranking entries, resolving all technician names in one batch lookup
+            names = self._get_technician_names(total)
+            level_upper = level.upper() if level else None
             ranking_data = []
-            for tech_id, stats in technician_stats.items():
-                if stats["total_tickets"] > 0:
-                    stats["resolution_rate"] = round(
-                        (stats["resolved_tickets"] / stats["total_tickets"]) * 100, 2
-                    )
-                    stats["performance_score"] = round(
-                        stats["resolution_rate"] * 0.6 +  # 60% weight on resolution rate
-                        min(stats["total_tickets"] * 2, 40) * 0.4, 2  # 40% weight on volume (capped at 40)
-                    )
-                    stats["ticket_count"] = stats["total_tickets"]
-                else:
-                    stats["resolution_rate"] = 0
-                    stats["performance_score"] = 0
-                    stats["ticket_count"] = 0
+            for tech_id, total_tickets in total.items():
+                tech_name = names[tech_id]
                 
-                ranking_data.append(stats)
-            
-            # Sort by performance score
-            ranking_data.sort(key=lambda x: x["performance_score"], reverse=True)
+                # Name heuristic only when the level has no GLPI group to filter on
+                if level and not level_group_id and not self._technician_matches_level(tech_name, level_upper):
+                    continue
+                
+                resolution_rate = round((resolved[tech_id] / total_tickets) * 100, 2)
+                ranking_data.append({
+                    "id": tech_id,
+                    "name": tech_name,
+                    "level": level_upper if level_group_id else self._extract_technician_level(tech_name),
+                    "total_tickets": total_tickets,
+                    "resolved_tickets": resolved[tech_id],
+                    "pending_tickets": total_tickets - resolved[tech_id],
+                    "high_priority_tickets": high[tech_id],
+                    "avg_resolution_time": 0,
+                    "data_source": "glpi",
+                    "is_mock_data": False,
+                    "resolution_rate": resolution_rate,
+                    "performance_score": round(
+                        resolution_rate * 0.6 +  # 60% weight on resolution rate
+                        min(total_tickets * 2, 40) * 0.4, 2  # 40% weight on volume (capped at 40)
+                    ),
+                    "ticket_count": total_tickets,
+                })
             
-            # Apply limit
-            if limit:
-                ranking_data = ranking_data[:limit]
+            # Sort by performance score and apply limit; a heap is cheaper for a small top-k
+            if limit and limit < len(ranking_data) // 4:
+                ranking_data = heapq.nlargest(limit, ranking_data, key=_BY_PERFORMANCE_SCORE)
+            else:
+                ranking_data.sort(key=_BY_PERFORMANCE_SCORE, reverse=True)
+                if limit:
+                    ranking_data = ranking_data[:limit]
             
             # Cache the result
             self.cache_service.set_cached_data("technician_ranking", ranking_data, ttl=300, sub_key=cache_key)
@@ -723,36 +860,40 @@ class GLPIServiceFacade:
             self.logger.error(f"Erro ao obter ranking de técnicos: {e}")
             return []
     
-    def _technician_matches_level(self, tech_name: str, level: str) -> bool:
-        """Check if technician matches the specified level."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _technician_matches_level(tech_name: str, level: str) -> bool:
+        """Check if technician matches the specified level.
+        
+        Obsoleto: heurística por substring no nome, usada apenas quando o nível não
+        tem grupo GLPI em ``service_levels``; o filtro normal é o critério de grupo.
+        Memoizado por (nome, nível): poucos técnicos e quatro níveis.
+        """
         if not level or not tech_name:
             return True
         
-        tech_name_upper = tech_name.upper()
-        level_upper = level.upper()
-        
         # Simple level matching - can be enhanced based on naming conventions
-        return level_upper in tech_name_upper
+        return level.upper() in tech_name.upper()
     
-    def _group_tickets_by_status(self, tickets: List[Dict]) -> Dict[str, int]:
+    def _group_tickets_by_status(self, tickets: Iterable[Dict]) -> Dict[str, int]:
         """Group tickets by status and return counts."""
-        status_counts = {}
-        for ticket in tickets:
-            status_id = str(ticket.get('12', '1'))  # field 12 = status
-            status_name = self._get_status_name(status_id)
-            status_counts[status_name] = status_counts.get(status_name, 0) + 1
-        return status_counts
+        # Conta por ID (field 12 = status) e resolve cada nome uma única vez
+        status_counts = Counter()
+        for status_id, count in Counter(str(t.get('12', '1')) for t in tickets).items():
+            status_counts[self._get_status_name(status_id)] += count
+        return dict(status_counts)
     
-    def _group_tickets_by_priority(self, tickets: List[Dict]) -> Dict[str, int]:
+    def _group_tickets_by_priority(self, tickets: Iterable[Dict]) -> Dict[str, int]:
         """Group tickets by priority and return counts."""
-        priority_counts = {}
-        for ticket in tickets:
-            priority_id = str(ticket.get('3', '1'))  # field 3 = priority
-            priority_name = self._get_priority_name(priority_id)
-            priority_counts[priority_name] = priority_counts.get(priority_name, 0) + 1
-        return priority_counts
+        # Conta por ID (field 3 = priority) e resolve cada nome uma única vez
+        priority_counts = Counter()
+        for priority_id, count in Counter(str(t.get('3', '1')) for t in tickets).items():
+            priority_counts[self._get_priority_name(priority_id)] += count
+        return dict(priority_counts)
 
-    def _extract_technician_level(self, tech_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_technician_level(tech_name: str) -> str:
         """Extract technician level from name.
         
         NOTA: Este é um método heurístico baseado em substring no nome.
@@ -765,32 +906,103 @@ class GLPIServiceFacade:
         if not tech_name:
             return "N1"
         
-        tech_name_upper = tech_name.upper()
-        
-        if "N4" in tech_name_upper:
-            return "N4"
-        elif "N3" in tech_name_upper:
-            return "N3"
-        elif "N2" in tech_name_upper:
-            return "N2"
-        else:
-            return "N1"
+        # Maior nível citado no nome (N4 > N3 > N2); sem menção, N1
+        return max(_LEVEL_IN_NAME.findall(tech_name.upper()), default="N1")
     
-    def _paginated_search(self, endpoint: str, base_params: Dict[str, Any], page_size: int = 500, max_results: int = None) -> List[Dict[str, Any]]:
+    def _fetch_page(
+        self, endpoint: str, params: Dict[str, Any], start: int, end: int
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """Busca uma página ``start-end`` e retorna ``(linhas, resposta)``; linhas é None em falha.
+        
+        Uma busca sem resultados retorna ``([], resposta)``, distinta de uma falha.
+        Sobrescreve ``params["range"]``: o chamador passa um dict próprio da paginação.
+        """
+        params["range"] = f"{start}-{end}"
+        
+        success, data, error, status_code = self.http_client._make_authenticated_request(
+            "GET", endpoint, params=params
+        )
+        
+        if not success or not data:
+            self.logger.warning(f"Paginação parou em {start}: {error}")
+            return None, None
+            
+        if isinstance(data, dict) and "data" in data:
+            return data["data"], data
+        if isinstance(data, dict) and data.get("totalcount") == 0:
+            return [], data  # O GLPI omite "data" quando nada corresponde à busca
+        if isinstance(data, list):
+            return data, None
+            
+        self.logger.warning(f"Formato de dados inesperado na página {start}: {type(data)}")
+        return None, None
+        
+    def _fetch_pages_parallel(
+        self,
+        endpoint: str,
+        base_params: Dict[str, Any],
+        start: int,
+        total_count: int,
+        page_size: int,
+        max_results: int = None,
+        on_failure: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Busca as páginas restantes em paralelo, com concorrência limitada, e as entrega em ordem."""
+        stop = min(total_count, max_results) if max_results else total_count
+        ranges = [(page_start, min(page_start + page_size, stop) - 1) for page_start in range(start, stop, page_size)]
+        if not ranges:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_PAGINATION_MAX_WORKERS, len(ranges))) as executor:
+            for (page_start, _), page in zip(ranges, executor.map(
+                # Uma cópia por página: as requisições concorrentes não compartilham params
+                lambda page_range: self._fetch_page(endpoint, dict(base_params), *page_range)[0], ranges
+            )):
+                if not page:
+                    if page is None and on_failure:
+                        on_failure(page_start)
+                    break  # Mantém apenas o prefixo contíguo, como no modo sequencial
+                yield page
+        
+    def _paginated_search_iter(
+        self,
+        endpoint: str,
+        base_params: Dict[str, Any],
+        page_size: int = 500,
+        max_results: int = None,
+        early_stop: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+        on_failure: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
         Implementa paginação iterativa para evitar perda de dados em grandes consultas.
         
+        Entrega uma página por vez, para que o chamador agregue os resultados sem
+        manter todas as linhas em memória. A primeira página funciona como sonda:
+        se o GLPI informar ``totalcount``, as páginas restantes são buscadas em
+        paralelo. Sem ``totalcount`` (ou com ``early_stop``), a paginação segue sequencial.
+        
         Args:
             endpoint: Endpoint da API GLPI (ex: 'search/Ticket')
             base_params: Parâmetros base da consulta (sem range)
-            page_size: Tamanho da página (padrão 500, máximo recomendado)
+            page_size: Tamanho máximo da página (padrão 500, máximo recomendado); com
+                max_results conhecido, é reduzido para dividir o total em páginas iguais
             max_results: Limite máximo de resultados (None = sem limite)
+            early_stop: Chamado com cada página recebida; retornar True encerra a paginação
+            on_failure: Chamado com o início da página cuja busca falhou, antes de
+                encerrar a paginação; uma busca vazia não é falha
             
-        Returns:
-            Lista completa de resultados paginados
+        Yields:
+            Páginas de resultados, na ordem da consulta
         """
-        all_results = []
+        if max_results:
+            # Mesmo número de round trips, com a menor página possível
+            page_size = _optimal_page_size(max_results, page_size)
+        
+        # Um único dict para as páginas sequenciais; só o range muda a cada página
+        params = dict(base_params)
+        collected = 0
         start = 0
+        last_log = time.monotonic()
         
         while True:
             # Calcula o range atual
@@ -802,48 +1014,88 @@ class GLPIServiceFacade:
             if max_results and end >= max_results:
                 end = max_results - 1
             
-            # Cria parâmetros com paginação
-            params = base_params.copy()
-            params["range"] = f"{start}-{end}"
-            
-            # Faz a requisição
-            success, data, error, status_code = self.http_client._make_authenticated_request(
-                "GET", endpoint, params=params
-            )
+            page_results, data = self._fetch_page(endpoint, params, start, end)
             
-            if not success or not data:
-                self.logger.warning(f"Paginação parou em {start}: {error}")
-                break
-                
-            # Processa os dados retornados
-            if isinstance(data, dict) and "data" in data:
-                page_results = data["data"]
-            elif isinstance(data, list):
-                page_results = data
-            else:
-                self.logger.warning(f"Formato de dados inesperado na página {start}: {type(data)}")
+            # Se não há mais resultados (ou houve falha), para
+            if not page_results:
+                if page_results is None and on_failure:
+                    on_failure(start)
                 break
             
-            # Se não há mais resultados, para
-            if not page_results or len(page_results) == 0:
-                break
+            if not max_results:
+                self.logger.debug("Paginação: página %d-%d retornou %d resultados", start, end, len(page_results))
                 
-            all_results.extend(page_results)
+            collected += len(page_results)
+            yield page_results
             
             # Se retornou menos que o page_size, chegou ao fim
             if len(page_results) < page_size:
                 break
+            
+            # Para quando o totalcount informado pelo GLPI já foi coletado
+            total_count = data.get("totalcount") if isinstance(data, dict) else None
+            if isinstance(total_count, int) and collected >= total_count:
+                break
+            
+            # Critério de parada antecipada definido pelo chamador
+            if early_stop and early_stop(page_results):
+                self.logger.debug("Paginação encerrada antecipadamente com %d resultados", collected)
+                break
                 
             start += page_size
             
-            # Log de progresso
-            if len(all_results) % 1000 == 0:
-                self.logger.info(f"Paginação: {len(all_results)} resultados coletados")
+            # Com o total conhecido pela sonda, busca o restante em paralelo
+            if early_stop is None and isinstance(total_count, int):
+                yield from self._fetch_pages_parallel(
+                    endpoint, base_params, start, total_count, page_size, max_results, on_failure
+                )
+                break
+            
+            # Log de progresso, no máximo a cada _PROGRESS_LOG_INTERVAL segundos
+            now = time.monotonic()
+            if now - last_log > _PROGRESS_LOG_INTERVAL and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Paginação: %d resultados coletados", collected)
+                last_log = now
         
+    def _paginated_search(
+        self,
+        endpoint: str,
+        base_params: Dict[str, Any],
+        page_size: int = 500,
+        max_results: int = None,
+        early_stop: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Lista completa de resultados paginados; ver ``_paginated_search_iter``."""
+        all_results = list(chain.from_iterable(self._paginated_search_iter(
+            endpoint, base_params, page_size, max_results, early_stop
+        )))
         self.logger.info(f"Paginação concluída: {len(all_results)} resultados totais")
         return all_results
         
     # Dashboard methods
+    def get_dashboard_bundle(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Fetch level metrics, recent tickets and technician performance concurrently.
+        
+        The three workflows are independent and I/O-bound, so running them on a
+        small thread pool makes the wall-clock cost the slowest call instead of
+        the sum of all three.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fut_metrics = executor.submit(self.get_metrics_by_level, start_date, end_date)
+            fut_tickets = executor.submit(self.get_recent_tickets, limit)
+            fut_performance = executor.submit(self.get_technician_performance)
+            
+            return {
+                "metrics": fut_metrics.result(),
+                "tickets": fut_tickets.result(),
+                "performance": fut_performance.result(),
+            }
+        
     def get_dashboard_metrics(
         self, 
         start_date: str = None, 
@@ -882,89 +1134,91 @@ class GLPIServiceFacade:
         
         Filtra tickets por data de modificação (campo 19) em vez de data de criação (campo 15).
         """
+        cache_key = f"dashboard_metrics_mod_date_{start_date}_{end_date}"
         try:
-            cache_key = f"dashboard_metrics_mod_date_{start_date}_{end_date}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                cached_data = self._get_cache_data(cache_key)
-                if cached_data:
-                    return cached_data
-            
-            # Build search criteria with modification date filter (field 19)
-            criteria = []
-            criteria_index = 0
-            
-            if start_date:
-                criteria.append({
-                    f"criteria[{criteria_index}][field]": "19",  # modification date
-                    f"criteria[{criteria_index}][searchtype]": "morethan",
-                    f"criteria[{criteria_index}][value]": start_date
-                })
-                criteria_index += 1
-                
-            if end_date:
-                if criteria_index > 0:
-                    criteria.append({f"criteria[{criteria_index}][link]": "AND"})
-                criteria.append({
-                    f"criteria[{criteria_index}][field]": "19",  # modification date
-                    f"criteria[{criteria_index}][searchtype]": "lessthan", 
-                    f"criteria[{criteria_index}][value]": end_date
-                })
-            
-            # Flatten criteria for request
-            search_params = {}
-            for criterion in criteria:
-                search_params.update(criterion)
-            
-            # Add standard parameters
-            search_params.update({
-                "range": "0-999",
-                "order": "DESC",
-                "sort": "19"  # sort by modification date
-            })
-            
-            # Make request
-            response = self._make_authenticated_request(
-                "GET", 
-                "/search/Ticket", 
-                params=search_params
+            # Recent failure for this range: answer from the negative cache without calling GLPI
+            failed_result = self._get_cache_data("negative_lookups", cache_key)
+            if failed_result is not None:
+                return failed_result
+            
+            # Stale-while-revalidate: an expired entry is served immediately while
+            # a background thread recomputes it
+            cached_data, _ = self.cache_service.get_with_swr(
+                cache_key,
+                refresh=lambda: self._search_modification_date_metrics(start_date, end_date),
             )
+            if cached_data:
+                return cached_data
             
-            if response and response.get("data"):
-                tickets = response["data"]
-                
-                # Process metrics from filtered tickets
-                result = {
-                    "total_tickets": len(tickets),
-                    "filter_type": "modification_date",
-                    "date_field": "modification_date",
-                    "date_range": {
-                        "start": start_date,
-                        "end": end_date
-                    },
-                    "tickets_by_status": self._group_tickets_by_status(tickets),
-                    "tickets_by_priority": self._group_tickets_by_priority(tickets)
-                }
-                
+            result = self._search_modification_date_metrics(start_date, end_date)
+            if result is not None:
                 # Cache result
                 self._set_cache_data(cache_key, result, ttl=300)
                 return result
-            else:
-                # Fallback to dashboard service if search fails
-                result = self.dashboard_service.get_dashboard_metrics_with_date_filter(
-                    start_date, end_date, include_trends=False
-                )
+            
+            # Fallback to dashboard service if search fails
+            result = self.dashboard_service.get_dashboard_metrics_with_date_filter(
+                start_date, end_date, include_trends=False
+            )
+            
+            if result and isinstance(result, dict):
+                result["filter_type"] = "modification_date"
+                result["date_field"] = "modification_date"
+                self._set_cache_data("negative_lookups", result, ttl=_NEGATIVE_CACHE_TTL, sub_key=cache_key)
                 
-                if result and isinstance(result, dict):
-                    result["filter_type"] = "modification_date"
-                    result["date_field"] = "modification_date"
-                    
-                return result
+            return result
                 
         except Exception as e:
             self.logger.error(f"Error in get_dashboard_metrics_with_modification_date_filter: {e}")
-            return {"error": str(e), "filter_type": "modification_date"}
+            result = {"error": str(e), "filter_type": "modification_date"}
+            self._set_cache_data("negative_lookups", result, ttl=_NEGATIVE_CACHE_TTL, sub_key=cache_key)
+            return result
+    
+    def _search_modification_date_metrics(
+        self, start_date: Optional[str], end_date: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Query GLPI for tickets modified in the range and aggregate them.
+        
+        Returns None when the search fails or finds nothing, so callers can fall back.
+        """
+        # Build search criteria with modification date filter (field 19)
+        search_params = _build_criteria(
+            ("19", "morethan", start_date) if start_date else None,
+            ("19", "lessthan", end_date) if end_date else None,
+        )
+        
+        # Add standard parameters
+        search_params.update({
+            "range": "0-999",
+            "order": "DESC",
+            "sort": "19"  # sort by modification date
+        })
+        
+        # Make request
+        response = self._make_authenticated_request(
+            "GET", 
+            "/search/Ticket", 
+            params=search_params
+        )
+        
+        payload = response.json() if response else None
+        if not payload or not payload.get("data"):
+            return None
+            
+        tickets = payload["data"]
+        
+        # Process metrics from filtered tickets
+        return {
+            "total_tickets": len(tickets),
+            "filter_type": "modification_date",
+            "date_field": "modification_date",
+            "date_range": {
+                "start": start_date,
+                "end": end_date
+            },
+            "tickets_by_status": self._group_tickets_by_status(tickets),
+            "tickets_by_priority": self._group_tickets_by_priority(tickets)
+        }
         
     def get_dashboard_metrics_with_filters(
         self,
@@ -977,33 +1231,41 @@ class GLPIServiceFacade:
         category: str = None,
         correlation_id: str = None
     ) -> Dict[str, Any]:
-        """Get dashboard metrics with advanced filters."""
+        """Get dashboard metrics with advanced filters.
+        
+        Filters are pushed into the GLPI search criteria so only matching tickets
+        are returned. If a filter cannot be expressed as a criterion, or the
+        filtered search fails, the unfiltered dashboard is post-filtered instead.
+        """
         try:
-            # Start with base dashboard metrics
-            result = self.dashboard_service.get_dashboard_metrics(start_date, end_date)
+            result = None
+            if any([status, priority, level, technician, category]):
+                result = self._get_server_filtered_metrics(
+                    start_date, end_date, status, priority, level, technician, category
+                )
             
-            if not result or result.get("error"):
-                return result
-                
-            # Apply filtering logic to the result
-            # In a full implementation, this would be done at the data source level
-            # For now, we'll apply basic filtering to maintain functionality
-            
-            # Filter by service level if specified
-            if level and "by_level" in result:
-                filtered_levels = {}
-                for level_key, level_data in result["by_level"].items():
-                    if level.upper() in level_key.upper() or level_key.upper() == level.upper():
-                        filtered_levels[level_key] = level_data
-                result["by_level"] = filtered_levels
+            if result is None:
+                # Fallback: base dashboard metrics filtered in Python
+                result = self.dashboard_service.get_dashboard_metrics(start_date, end_date)
                 
-            # Filter by status if specified
-            if status and "by_status" in result:
-                filtered_status = {}
-                for status_key, status_data in result["by_status"].items():
-                    if status.lower() in status_key.lower() or status_key.lower() == status.lower():
-                        filtered_status[status_key] = status_data
-                result["by_status"] = filtered_status
+                if not result or result.get("error"):
+                    return result
+                    
+                # Filter by service level if specified
+                if level and "by_level" in result:
+                    filtered_levels = {}
+                    for level_key, level_data in result["by_level"].items():
+                        if level.upper() in level_key.upper() or level_key.upper() == level.upper():
+                            filtered_levels[level_key] = level_data
+                    result["by_level"] = filtered_levels
+                    
+                # Filter by status if specified
+                if status and "by_status" in result:
+                    filtered_status = {}
+                    for status_key, status_data in result["by_status"].items():
+                        if status.lower() in status_key.lower() or status_key.lower() == status.lower():
+                            filtered_status[status_key] = status_data
+                    result["by_status"] = filtered_status
                 
             # Add comprehensive filter metadata
             result["applied_filters"] = {
@@ -1040,6 +1302,134 @@ class GLPIServiceFacade:
                 }
             }
         
+    def _get_server_filtered_metrics(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        status: Optional[str],
+        priority: Optional[str],
+        level: Optional[str],
+        technician: Optional[str],
+        category: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Compute dashboard metrics from count-only GLPI searches with the filters as criteria.
+        
+        Every count comes from ``totalcount``, so results are exact however many
+        tickets match. The payload has the same shape as
+        ``dashboard_service.get_dashboard_metrics`` after post-filtering, including
+        the 30-day default window.
+        
+        Returns:
+            Metrics dict, or None when a filter has no criterion mapping or a search fails
+        """
+        now = datetime.now()
+        start_date = start_date or (now - timedelta(days=30)).strftime('%Y-%m-%d')
+        end_date = end_date or now.strftime('%Y-%m-%d')
+        
+        status_ids = list(_STATUS_NAMES)
+        if status:
+            status_id = status if status.isdigit() else next(
+                (sid for sid, name in _STATUS_NAMES.items() if name.lower() == status.lower()), None
+            )
+            if status_id not in _STATUS_NAMES:
+                return None
+            status_ids = [status_id]
+            
+        specs = [
+            ("15", "morethan", f"{start_date} 00:00:00"),  # Creation date
+            ("15", "lessthan", f"{end_date} 23:59:59"),
+        ]
+        if priority:
+            priority_id = priority if priority.isdigit() else next(
+                (pid for pid, name in _PRIORITY_NAMES.items() if name.lower() == priority.lower()), None
+            )
+            if not priority_id:
+                return None
+            specs.append(("3", "equals", priority_id))
+        if technician:
+            specs.append(("5", "equals" if technician.isdigit() else "contains", technician))
+        if category:
+            specs.append(("7", "equals" if category.isdigit() else "contains", category))
+            
+        group_field_id = str(self.field_ids.get("groups_id_tech") or 8)
+        levels = dict(self.service_levels)
+        if level:
+            group_id = self.service_levels.get(level.upper())
+            if not group_id:
+                return None
+            levels = {level.upper(): group_id}
+            specs.append((group_field_id, "equals", str(group_id)))
+            
+        base = [
+            {"link": "AND", "field": field, "searchtype": searchtype, "value": value}
+            for field, searchtype, value in specs
+        ]
+        
+        def status_in(ids: List[str]) -> Dict[str, Any]:
+            return {
+                "link": "AND",
+                "criteria": [{"link": "OR", "field": "12", "searchtype": "equals", "value": sid} for sid in ids],
+            }
+            
+        # One count per status, plus resolved / pending per level; a level's bucket
+        # with no status left after the status filter is simply zero
+        searches = {
+            ("status", sid): base + [{"link": "AND", "field": "12", "searchtype": "equals", "value": sid}]
+            for sid in status_ids
+        }
+        for level_name, group_id in levels.items():
+            level_criteria = base + [{"link": "AND", "field": group_field_id, "searchtype": "equals", "value": str(group_id)}]
+            for bucket, bucket_ids in (("resolved", _RESOLVED_STATUS_IDS), ("pending", _PENDING_STATUS_IDS)):
+                ids = [sid for sid in bucket_ids if sid in status_ids]
+                if ids:
+                    searches[(level_name, bucket)] = level_criteria + [status_in(ids)]
+                    
+        def count(criteria: List[Dict[str, Any]]) -> Optional[int]:
+            success, data, error_msg, status_code = self.http_client.search(
+                "Ticket", {"criteria": criteria, "range": "0-0", "only_id": "true"}
+            )
+            if not success or not isinstance(data, dict):
+                self.logger.warning(f"Filtered GLPI count failed, falling back to post-filtering: {error_msg} (status: {status_code})")
+                return None
+            return int(data.get("totalcount") or 0)
+            
+        with ThreadPoolExecutor(max_workers=_FILTERED_COUNT_MAX_WORKERS) as executor:
+            counts = dict(zip(searches, executor.map(count, searches.values())))
+        if None in counts.values():
+            return None
+            
+        by_status = {_STATUS_NAMES[sid]: counts[("status", sid)] for sid in status_ids}
+        by_level = {
+            level_name: {
+                "total": counts.get((level_name, "resolved"), 0) + counts.get((level_name, "pending"), 0),
+                "resolved": counts.get((level_name, "resolved"), 0),
+                "pending": counts.get((level_name, "pending"), 0),
+                "group_id": group_id,
+            }
+            for level_name, group_id in levels.items()
+        }
+        total = sum(by_status.values())
+        resolved = sum(counts[("status", sid)] for sid in _RESOLVED_STATUS_IDS if sid in status_ids)
+        
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "timestamp": now.isoformat(),
+            "totals": {
+                "total_tickets": total,
+                "resolved_tickets": resolved,
+                "pending_tickets": total - resolved,
+                "new_tickets": by_status.get('Novo', 0),
+            },
+            "by_level": by_level,
+            "by_status": by_status,
+            "performance": {
+                "resolution_rate": resolved / total * 100 if total else 0.0,
+                "avg_resolution_time": self.dashboard_service._calculate_avg_resolution_time(start_date, end_date),
+            },
+            "success": True,
+        }
+        
     # Trends methods
     def _calculate_trends(
         self, 
@@ -1070,21 +1460,8 @@ class GLPIServiceFacade:
         )
         
         if success:
-            # Create mock response object for backward compatibility
-            class MockResponse:
-                def __init__(self, data, status_code):
-                    self._data = data
-                    self.status_code = status_code
-                    self.ok = status_code < 400
-                    
-                def json(self):
-                    return self._data
-                    
-                @property
-                def text(self):
-                    return str(self._data)
-                    
-            return MockResponse(response_data, status_code)
+            # Response-like wrapper for backward compatibility
+            return _LegacyMockResponse(response_data, status_code)
         else:
             return None
             
@@ -1112,6 +1489,11 @@ class GLPIServiceFacade:
     def invalidate_cache(self, cache_key: str = None):
         """Invalidate cache."""
         self.cache_service.invalidate_cache(cache_key)
+        if cache_key in (None, "field_ids"):
+            self.__dict__.pop("field_ids", None)
+            self.metrics_service.invalidate_field_ids()
+        if cache_key is None:
+            self.invalidate_requester_names()
         
     def get_new_tickets_with_filters(
         self,
@@ -1146,45 +1528,15 @@ class GLPIServiceFacade:
                     self.logger.error("Failed to authenticate with GLPI")
                     return self._get_enhanced_mock_tickets(limit, "Authentication failed")
             
-            # Build search criteria for NEW tickets (status = 1)
-            search_criteria = {
-                'range': f'0-{limit-1}',  # Limit results
-                'order': 'DESC',  # Most recent first
-                'sort': '15',  # Sort by creation date (field 15)
-                'criteria[0][field]': '12',  # Status field
-                'criteria[0][searchtype]': 'equals',
-                'criteria[0][value]': '1',  # Status "Novo" (New)
-                'forcedisplay[0]': '2',   # ID
-                'forcedisplay[1]': '1',   # Name/Title
-                'forcedisplay[2]': '12',  # Status
-                'forcedisplay[3]': '15',  # Creation date
-                'forcedisplay[4]': '3',   # Priority
-                'forcedisplay[5]': '21',  # Content/Description
-                'forcedisplay[6]': '4',   # Requester
-            }
-            
-            # Add additional filters if provided
-            criteria_index = 1
-            if priority:
-                search_criteria[f'criteria[{criteria_index}][field]'] = '3'  # Priority field
-                search_criteria[f'criteria[{criteria_index}][searchtype]'] = 'equals'
-                search_criteria[f'criteria[{criteria_index}][value]'] = priority
-                search_criteria[f'criteria[{criteria_index}][link]'] = 'AND'
-                criteria_index += 1
-            
-            if start_date:
-                search_criteria[f'criteria[{criteria_index}][field]'] = '15'  # Creation date field
-                search_criteria[f'criteria[{criteria_index}][searchtype]'] = 'morethan'
-                search_criteria[f'criteria[{criteria_index}][value]'] = start_date
-                search_criteria[f'criteria[{criteria_index}][link]'] = 'AND'
-                criteria_index += 1
-            
-            if end_date:
-                search_criteria[f'criteria[{criteria_index}][field]'] = '15'  # Creation date field
-                search_criteria[f'criteria[{criteria_index}][searchtype]'] = 'lessthan'
-                search_criteria[f'criteria[{criteria_index}][value]'] = end_date
-                search_criteria[f'criteria[{criteria_index}][link]'] = 'AND'
-                criteria_index += 1
+            # Build search criteria for NEW tickets (status = 1) plus the optional filters
+            search_criteria = _build_criteria(
+                ('12', 'equals', '1'),  # Status "Novo" (New)
+                ('3', 'equals', priority) if priority else None,  # Priority field
+                ('15', 'morethan', start_date) if start_date else None,  # Creation date field
+                ('15', 'lessthan', end_date) if end_date else None,  # Creation date field
+            )
+            search_criteria.update(_NEW_TICKET_FORCEDISPLAY)
+            search_criteria['range'] = f'0-{limit-1}'  # Limit results
             
             # Log the search attempt
             self.logger.info(f"Searching for NEW tickets with limit: {limit}")
@@ -1204,10 +1556,13 @@ class GLPIServiceFacade:
             tickets_data = []
             if response_data and 'data' in response_data:
                 self.logger.info(f"Processing {len(response_data['data'])} NEW tickets from GLPI")
+                # Resolve all requester names in one User search instead of one request per ticket
+                requester_names = self._get_requester_names(
+                    [str(ticket_row.get('4', '0')) for ticket_row in response_data['data']]
+                )
                 for ticket_row in response_data['data']:
                     # Get requester name instead of just ID
-                    requester_id = ticket_row.get('4', '0')
-                    requester_name = self._get_requester_name(requester_id) if requester_id != '0' else 'Usuário desconhecido'
+                    requester_name = requester_names.get(str(ticket_row.get('4', '0')), 'Usuário desconhecido')
                     
                     # GLPI returns data as arrays with numeric keys
                     ticket = {
@@ -1216,7 +1571,7 @@ class GLPIServiceFacade:
                         'status': self._get_status_name(ticket_row.get('12', '1')),  # Status field
                         'created_date': self._format_date(ticket_row.get('15', datetime.now().isoformat())),  # Creation date
                         'priority': self._get_priority_name(ticket_row.get('3', '3')),  # Priority field
-                        'description': str(ticket_row.get('21', 'Sem descrição'))[:200],  # Truncated description
+                        'description': _trunc(ticket_row.get('21')),  # Truncated description
                         'requester': requester_name  # Requester name instead of ID
                     }
                     tickets_data.append(ticket)
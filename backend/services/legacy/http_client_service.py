@@ -4,21 +4,260 @@ GLPI HTTP Client Service - Handles HTTP requests to GLPI API.
 
 Extracted from monolithic GLPIService for better separation of concerns.
 """
+import asyncio
+import json
 import logging
 import random
+import re
+import threading
 import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
-from utils.prometheus_metrics import monitor_glpi_request
+try:  # Faster JSON decoding of (large) search responses when orjson is installed
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:  # HTTP/2 for the async client needs the optional "h2" package
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from config.settings import active_config
+from utils.prometheus_metrics import PROMETHEUS_AVAILABLE, prometheus_metrics
 from utils.structured_logging import log_glpi_request
 from .authentication_service import GLPIAuthenticationService
 
+# Keep-alive pool per GLPI host; sized above the concurrent page/bundle fetches so
+# parallel requests reuse connections instead of opening (and discarding) extra ones.
+# The per-host size is tunable through GLPI_POOL_MAXSIZE.
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+
+# Proactive rate limiting: when the server reports this many requests (or fewer) left
+# in the window, wait for the reset instead of spending a round trip on a 429
+_RATE_LIMIT_MIN_REMAINING = 2
+_RATE_LIMIT_MAX_WAIT = 60.0
+
+# get_items: IDs per request and parallel requests for large ID lists
+_GET_ITEMS_CHUNK = 50
+_GET_ITEMS_MAX_WORKERS = 8
+
+# Retry backoff bounds in seconds (decorrelated jitter)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# Bytes of an error response body kept in the error message
+_ERROR_BODY_LIMIT = 512
+
+# Unread streamed bodies up to this size are drained so the connection returns to the pool
+_DRAIN_BODY_LIMIT = 64 * 1024
+
+# Param names masked in debug logs
+_SENSITIVE_RE = re.compile(r"token|password|secret|key|auth|session", re.IGNORECASE)
+
+
+def _noop_record_glpi_request(endpoint: str, status_code: int, duration: float) -> None:
+    """Stand-in used when prometheus_client is not installed."""
+
+
+# Chosen once at import: no per-request availability check or try/except
+_record_glpi_request = (
+    prometheus_metrics.record_glpi_request if PROMETHEUS_AVAILABLE else _noop_record_glpi_request
+)
+
+# Numeric path segments (item IDs) collapsed in metric labels to bound cardinality
+_ID_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay seconds or HTTP-date).
+    
+    Capped at ``_RATE_LIMIT_MAX_WAIT``; None when absent or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), _RATE_LIMIT_MAX_WAIT)
+
+
+def _flatten_query(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode nested search params as the PHP-style keys GLPI parses.
+    
+    ``{"criteria": [{"field": 12}]}`` becomes ``{"criteria[0][field]": 12}``; already
+    flat keys pass through unchanged. requests would otherwise send a list of dicts
+    as repeated ``criteria=<key>`` pairs and drop the values.
+    """
+    flat: Dict[str, Any] = {}
+    
+    def add(key: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                add(f"{key}[{sub_key}]", sub_value)
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                add(f"{key}[{index}]", item)
+        else:
+            flat[key] = value
+            
+    for key, value in params.items():
+        add(key, value)
+    return flat
+
+
+class _LazySanitize:
+    """Log argument that sanitizes request params only when formatted."""
+    
+    __slots__ = ("client", "params")
+    
+    def __init__(self, client: "GLPIHttpClientService", params: Dict[str, Any]):
+        self.client = client
+        self.params = params
+        
+    def __str__(self) -> str:
+        return str(self.client._sanitize_params_for_logging(self.params))
+
+
+# Returned by a status handler to retry the request after ``ctx.retry_delay`` seconds
+_RETRY = object()
+# Returned by a status handler to re-authenticate, then retry the request
+_REAUTH = object()
+
+
+class _RequestContext:
+    """Per-call state shared with the status handlers, sync and async.
+    
+    Handlers only decide: they return the result tuple, ``_RETRY`` or ``_REAUTH``
+    and never block, so each request loop does the sleeping and the login its own way.
+    """
+    
+    __slots__ = (
+        "method", "endpoint", "headers", "parse_json", "attempt", "prev_sleep", "retry_delay", "reauth_attempts"
+    )
+    
+    def __init__(self, method: str, endpoint: str, headers, parse_json: bool):
+        self.method = method
+        self.endpoint = endpoint
+        self.headers = headers  # Sent with every attempt; updated in place after re-authentication
+        self.parse_json = parse_json
+        self.attempt = 0
+        self.prev_sleep = _BACKOFF_BASE
+        self.retry_delay = 0.0
+        self.reauth_attempts = 0
+
+
+# How often async callers re-check the concurrency limit while it is saturated
+_ASYNC_LIMIT_POLL = 0.01
+
+
+class _AIMDLimiter:
+    """Concurrency limit for GLPI requests with additive increase / multiplicative decrease.
+    
+    The limit grows by ``increase`` while the recent mean latency stays under
+    ``target_latency`` and is halved on overload signals (429, 5xx, timeouts), so
+    concurrent callers back off together instead of piling retries onto GLPI.
+    """
+    
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = _POOL_CONNECTIONS,
+        target_latency: float = 2.0,
+        window: int = 20,
+        increase: float = 0.5,
+    ):
+        self.limit = float(initial)
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+        self.target_latency = target_latency
+        self.increase = increase
+        self._latencies = deque(maxlen=window)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        
+    def __enter__(self):
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+        return False
+        
+    def _try_acquire(self) -> bool:
+        with self._cond:
+            if self._in_flight >= int(self.limit):
+                return False
+            self._in_flight += 1
+            return True
+            
+    async def __aenter__(self):
+        # Polls instead of waiting on the condition, which would block the event loop;
+        # a cancelled waiter never holds a slot
+        while not self._try_acquire():
+            await asyncio.sleep(_ASYNC_LIMIT_POLL)
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+        
+    def on_success(self, latency: float) -> None:
+        """Additive increase while the rolling mean latency is within target."""
+        with self._cond:
+            self._latencies.append(latency)
+            if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+                previous = int(self.limit)
+                self.limit = min(self.maximum, self.limit + self.increase)
+                if int(self.limit) > previous:
+                    self._cond.notify()
+                    
+    def on_overload(self) -> None:
+        """Multiplicative decrease on throttling, server errors or timeouts."""
+        with self._cond:
+            self.limit = max(self.minimum, self.limit * 0.5)
+            self._latencies.clear()
+
 
 class GLPIHttpClientService:
     """Handles HTTP communication with GLPI API with enhanced robustness and performance."""
     
+    __slots__ = (
+        "auth_service",
+        "logger",
+        "max_retries",
+        "retry_delay_base",
+        "session",
+        "_cached_headers",
+        "_headers_token",
+        "_aclients",
+        "_limiter",
+        "_rate_remaining",
+        "_rate_reset_at",
+        "_max_reauth_attempts",
+    )
+    
     def __init__(self, auth_service: GLPIAuthenticationService):
         """Initialize HTTP client service with session reuse and enhanced retry logic."""
         self.auth_service = auth_service
@@ -28,18 +267,101 @@ class GLPIHttpClientService:
         
         # Session reuse for better performance (keep-alive)
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=getattr(active_config, "GLPI_POOL_MAXSIZE", _POOL_MAXSIZE),
+            pool_block=False,
+            max_retries=0,  # Retries are handled by _make_authenticated_request
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Headers for the current session token, rebuilt only when the token changes
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._headers_token: Optional[str] = None
+        
+        # Async clients per event loop: an AsyncClient's connections are bound to the
+        # loop that opened them, and callers may run a new loop per request (asyncio.run)
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        # Shared concurrency limit adapted to GLPI's health (AIMD)
+        self._limiter = _AIMDLimiter()
         
-        # Track re-authentication attempts to prevent loops
-        self._reauth_attempts = 0
+        # Last rate-limit hints seen (X-RateLimit-Remaining / X-RateLimit-Reset)
+        self._rate_remaining: Optional[int] = None
+        self._rate_reset_at = 0.0
+        
+        # Re-authentications allowed per request (counted on its _RequestContext) to prevent loops
         self._max_reauth_attempts = 2
         
-    def _sleep_with_jitter(self, attempt: int) -> None:
-        """Sleep with exponential backoff and jitter to reduce thundering herd."""
-        base_delay = self.retry_delay_base ** attempt
-        jitter = random.uniform(0, 0.5)  # Add up to 500ms jitter
-        total_delay = base_delay + jitter
-        self.logger.debug(f"Sleeping {total_delay:.2f}s (base: {base_delay}s, jitter: {jitter:.2f}s)")
-        time.sleep(total_delay)
+    def _next_backoff(self, prev_sleep: float) -> float:
+        """Decorrelated jitter: uniform between the base delay and 3x the previous sleep, capped."""
+        return min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, prev_sleep * 3))
+        
+    def _jitter_delay(self, ctx: "_RequestContext") -> float:
+        """Next decorrelated jitter backoff for the request, to spread retries and reduce thundering herd."""
+        delay = ctx.prev_sleep = self._next_backoff(ctx.prev_sleep)
+        self.logger.debug("Sleeping %.2fs before retry", delay)
+        return delay
+        
+    def _valid_cached_headers(self) -> Optional[Dict[str, str]]:
+        """Cached API headers while the session token is unchanged and not expired; never blocks."""
+        if (
+            self._cached_headers is not None
+            and self._headers_token == self.auth_service.session_token
+            and self.auth_service.is_authenticated()
+        ):
+            return self._cached_headers
+        return None
+        
+    def _headers(self) -> Optional[Dict[str, str]]:
+        """API headers, reused while the session token is unchanged and not expired."""
+        cached = self._valid_cached_headers()
+        if cached is not None:
+            return cached
+        headers = self.auth_service.get_api_headers()
+        self._cached_headers = headers
+        self._headers_token = self.auth_service.session_token if headers else None
+        return headers
+        
+    def _update_rate_state(self, headers) -> None:
+        """Record the rate-limit quota reported by the server, if any."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            self._rate_remaining = int(remaining)
+            reset = float(headers.get("X-RateLimit-Reset", 0))
+        except (TypeError, ValueError):
+            return
+        # Reset may be an epoch timestamp or a delay in seconds
+        self._rate_reset_at = reset if reset > 1e9 else time.time() + reset
+        
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait for the rate-limit window to reset, if the remaining quota is nearly exhausted."""
+        if self._rate_remaining is None or self._rate_remaining > _RATE_LIMIT_MIN_REMAINING:
+            return 0.0
+        delay = min(self._rate_reset_at - time.time(), _RATE_LIMIT_MAX_WAIT)
+        if delay > 0:
+            self.logger.warning(
+                "Rate limit quota low (%d remaining), waiting %.2fs for reset", self._rate_remaining, delay
+            )
+        self._rate_remaining = None
+        return max(delay, 0.0)
+        
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate-limit window resets when the remaining quota is nearly exhausted."""
+        delay = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
+            
+    async def _await_rate_limit(self) -> None:
+        """Async counterpart of ``_wait_for_rate_limit``."""
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
         
     def _sanitize_params_for_logging(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Sanitize parameters for logging, masking sensitive data."""
@@ -47,11 +369,9 @@ class GLPIHttpClientService:
             return {}
             
         sanitized = {}
-        sensitive_keys = {'token', 'password', 'secret', 'key', 'auth', 'session'}
         
         for key, value in params.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in sensitive_keys):
+            if _SENSITIVE_RE.search(key):
                 sanitized[key] = '***'
             elif isinstance(value, str) and len(value) > 100:
                 sanitized[key] = f"{value[:50]}...({len(value)} chars)"
@@ -72,40 +392,45 @@ class GLPIHttpClientService:
     ) -> Tuple[bool, Optional[Dict], Optional[str], int]:
         """Make authenticated request to GLPI API with retry logic."""
         
-        headers = self.auth_service.get_api_headers()
+        headers = self._headers()
         if not headers:
             return False, None, "Authentication failed", 401
             
         url = f"{self.auth_service.glpi_url}/{endpoint.lstrip('/')}"
         
-        # Log the constructed URL for debugging with sanitized params
-        sanitized_params = self._sanitize_params_for_logging(params)
-        self.logger.debug(f"Making {method} request to: {url}")
-        if sanitized_params:
-            self.logger.debug(f"Request params: {sanitized_params}")
-        
-        # Prepare request arguments
-        request_args = {
-            "headers": headers,
-            "timeout": timeout,
-        }
-        
+        # Log the constructed URL for debugging; params are only sanitized if the record is emitted
+        self.logger.debug("Making %s request to: %s", method, url)
         if params:
-            request_args["params"] = params
-        if data:
-            request_args["json"] = data
+            self.logger.debug("Request params: %s", _LazySanitize(self, params))
+        
+        # Prepare the request once (URL, query string, body); retries resend it as is
+        prepared = self.session.prepare_request(requests.Request(
+            method, url, headers=headers, params=params or None, json=data or None
+        ))
+        # Body is read on demand for JSON GETs: fully on success, only a prefix for error messages
+        stream = method == "GET" and parse_json
+        send_args = self.session.merge_environment_settings(prepared.url, {}, stream, None, None)
+        send_args["timeout"] = timeout
             
-        # Reset re-auth attempts for new request
-        self._reauth_attempts = 0
+        metric_endpoint = _ID_SEGMENT_RE.sub("/{id}", endpoint.lstrip("/"))
+            
+        ctx = _RequestContext(method, endpoint, prepared.headers, parse_json)
         
         for attempt in range(self.max_retries):
             try:
-                start_time = time.time()
+                self._wait_for_rate_limit()
+                start_time = time.perf_counter()
                 
-                # Make the request using session for connection reuse
-                response = self.session.request(method, url, **request_args)
+                # Make the request using session for connection reuse, within the adaptive limit
+                with self._limiter:
+                    response = self.session.send(prepared, **send_args)
                 
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
+                self._update_rate_state(response.headers)
+                if response.status_code == 429 or response.status_code >= 500:
+                    self._limiter.on_overload()
+                else:
+                    self._limiter.on_success(response_time)
                 
                 # Log request if structured logger available
                 if self.auth_service.structured_logger:
@@ -116,42 +441,11 @@ class GLPIHttpClientService:
                     )
                 
                 # Integrate observability metrics
-                try:
-                    monitor_glpi_request(
-                        method=method,
-                        endpoint=endpoint,
-                        status=response.status_code,
-                        duration_seconds=response_time
-                    )
-                except Exception as e:
-                    self.logger.debug(f"Failed to record metrics: {e}")
-                
-                # Handle authentication expiry (401) and forbidden (403 - some GLPIs return this for invalid session)
-                if response.status_code in (401, 403):
-                    if self._reauth_attempts < self._max_reauth_attempts:
-                        self._reauth_attempts += 1
-                        self.logger.warning(f"Session invalid (HTTP {response.status_code}), re-authenticating (attempt {self._reauth_attempts}/{self._max_reauth_attempts})...")
-                        if self.auth_service.authenticate():
-                            headers = self.auth_service.get_api_headers()
-                            if headers:
-                                request_args["headers"] = headers
-                                continue
-                        self.logger.error("Re-authentication failed")
-                    return False, None, f"Authentication failed after {self._reauth_attempts} attempts", response.status_code
-                
-                # Handle rate limiting (429)
-                if response.status_code == 429:
-                    if attempt < self.max_retries - 1:
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after and retry_after.isdigit():
-                            delay = float(retry_after)
-                            self.logger.warning(f"Rate limited (429), respecting Retry-After: {delay}s")
-                        else:
-                            delay = self.retry_delay_base ** attempt
-                            self.logger.warning(f"Rate limited (429), using exponential backoff: {delay}s")
-                        time.sleep(delay)
-                        continue
-                    return False, None, "Rate limited (429) - max retries exceeded", 429
+                _record_glpi_request(
+                    endpoint=metric_endpoint,
+                    status_code=response.status_code,
+                    duration=response_time,
+                )
                 
                 # Log response details if requested
                 if log_response:
@@ -160,64 +454,34 @@ class GLPIHttpClientService:
                         f"({response_time:.2f}s)"
                     )
                 
-                # Handle successful responses
-                if response.status_code in [200, 201, 206]:
-                    if parse_json:
-                        try:
-                            response_data = response.json()
-                            return True, response_data, None, response.status_code
-                        except ValueError as e:
-                            # Fallback for non-JSON responses when JSON was expected
-                            content_type = response.headers.get("content-type", "").lower()
-                            if content_type.startswith(("text/", "application/xml", "text/html")):
-                                self.logger.debug(f"JSON parse failed, returning text content (Content-Type: {content_type})")
-                                return True, {"text": response.text, "content_type": content_type}, None, response.status_code
-                            # Log the raw response content for debugging
-                            self.logger.error(
-                                f"JSON parse error for {method} {endpoint}: {e}. "
-                                f"Status: {response.status_code}, "
-                                f"Content-Type: {response.headers.get('content-type', 'unknown')}, "
-                                f"Content-Length: {len(response.text)}, "
-                                f"Raw response: '{response.text[:200]}'"
-                            )
-                            return False, None, f"JSON parse error: {e}", response.status_code
-                    else:
-                        return True, {"text": response.text}, None, response.status_code
-                
-                # Handle client errors (don't retry)
-                elif 400 <= response.status_code < 500:
-                    error_msg = f"Client error {response.status_code}: {response.text}"
-                    return False, None, error_msg, response.status_code
-                
-                # Handle server errors (retry)
-                elif response.status_code >= 500:
-                    if attempt < self.max_retries - 1:
-                        self.logger.warning(
-                            f"Server error {response.status_code}, retrying (attempt {attempt + 1}/{self.max_retries})"
-                        )
-                        self._sleep_with_jitter(attempt)
+                ctx.attempt = attempt
+                try:
+                    result = self._handle_status(response, ctx)
+                finally:
+                    self._release(response)
+                if result is _RETRY:
+                    time.sleep(ctx.retry_delay)
+                    continue
+                if result is _REAUTH:
+                    if self._reauthenticate(ctx):
                         continue
-                    else:
-                        error_msg = f"Server error {response.status_code}: {response.text}"
-                        return False, None, error_msg, response.status_code
-                
-                # Handle unexpected status codes
-                else:
-                    error_msg = f"Unexpected status {response.status_code}: {response.text}"
-                    return False, None, error_msg, response.status_code
+                    return self._reauth_failed(ctx, response.status_code)
+                return result
                     
             except requests.exceptions.Timeout:
+                self._limiter.on_overload()
                 if attempt < self.max_retries - 1:
                     self.logger.warning(f"Request timeout, retrying (attempt {attempt + 1}/{self.max_retries})")
-                    self._sleep_with_jitter(attempt)
+                    time.sleep(self._jitter_delay(ctx))
                     continue
                 else:
                     return False, None, "Request timeout", 408
                     
             except requests.exceptions.ConnectionError as e:
+                self._limiter.on_overload()
                 if attempt < self.max_retries - 1:
                     self.logger.warning(f"Connection error, retrying (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    self._sleep_with_jitter(attempt)
+                    time.sleep(self._jitter_delay(ctx))
                     continue
                 else:
                     return False, None, f"Connection error: {e}", 503
@@ -231,6 +495,254 @@ class GLPIHttpClientService:
                 
         return False, None, "Max retries exceeded", 500
         
+    def _handle_ok(self, response, ctx: "_RequestContext"):
+        """200/201/206: decode the body (JSON, or text as fallback)."""
+        if not ctx.parse_json:
+            return True, {"text": response.text}, None, response.status_code
+        try:
+            return True, _json_loads(response.content), None, response.status_code
+        except ValueError as e:
+            # Fallback for non-JSON responses when JSON was expected
+            content_type = response.headers.get("content-type", "").lower()
+            if content_type.startswith(("text/", "application/xml", "text/html")):
+                self.logger.debug(f"JSON parse failed, returning text content (Content-Type: {content_type})")
+                return True, {"text": response.text, "content_type": content_type}, None, response.status_code
+            # Log the raw response content for debugging
+            self.logger.error(
+                f"JSON parse error for {ctx.method} {ctx.endpoint}: {e}. "
+                f"Status: {response.status_code}, "
+                f"Content-Type: {response.headers.get('content-type', 'unknown')}, "
+                f"Content-Length: {len(response.text)}, "
+                f"Raw response: '{response.text[:200]}'"
+            )
+            return False, None, f"JSON parse error: {e}", response.status_code
+            
+    def _handle_reauth(self, response, ctx: "_RequestContext"):
+        """401/403 (some GLPIs return 403 for an invalid session): re-authenticate and retry."""
+        if ctx.reauth_attempts < self._max_reauth_attempts:
+            ctx.reauth_attempts += 1
+            self.logger.warning(f"Session invalid (HTTP {response.status_code}), re-authenticating (attempt {ctx.reauth_attempts}/{self._max_reauth_attempts})...")
+            return _REAUTH
+        return self._reauth_failed(ctx, response.status_code)
+        
+    def _reauth_failed(self, ctx: "_RequestContext", status_code: int):
+        """Result tuple once re-authentication is exhausted or fails."""
+        return False, None, f"Authentication failed after {ctx.reauth_attempts} attempts", status_code
+        
+    def _reauthenticate(self, ctx: "_RequestContext") -> bool:
+        """Log in again and put the new session headers on the request; blocking (the async path runs it in a thread)."""
+        self._cached_headers = None
+        # The token this request was sent with: skip the login if another thread already replaced it
+        if self.auth_service.authenticate(stale_token=ctx.headers.get("Session-Token")):
+            headers = self._headers()
+            if headers:
+                ctx.headers.update(headers)
+                return True
+        self.logger.error("Re-authentication failed")
+        return False
+        
+    def _handle_rate(self, response, ctx: "_RequestContext"):
+        """429: wait (Retry-After or exponential backoff) and retry."""
+        if ctx.attempt < self.max_retries - 1:
+            delay = _parse_retry_after(response.headers.get("Retry-After"))
+            if delay is not None:
+                self.logger.warning(f"Rate limited (429), respecting Retry-After: {delay}s")
+            else:
+                delay = self.retry_delay_base ** ctx.attempt
+                self.logger.warning(f"Rate limited (429), using exponential backoff: {delay}s")
+            ctx.retry_delay = delay
+            return _RETRY
+        return False, None, "Rate limited (429) - max retries exceeded", 429
+        
+    def _handle_5xx(self, response, ctx: "_RequestContext"):
+        """Server errors: retry with backoff."""
+        if ctx.attempt < self.max_retries - 1:
+            self.logger.warning(
+                f"Server error {response.status_code}, retrying (attempt {ctx.attempt + 1}/{self.max_retries})"
+            )
+            ctx.retry_delay = self._jitter_delay(ctx)
+            return _RETRY
+        return False, None, f"Server error {response.status_code}: {self._error_body(response)}", response.status_code
+        
+    def _handle_other(self, response, ctx: "_RequestContext"):
+        """Client errors (not retried) and unexpected status codes."""
+        if 400 <= response.status_code < 500:
+            return False, None, f"Client error {response.status_code}: {self._error_body(response)}", response.status_code
+        return False, None, f"Unexpected status {response.status_code}: {self._error_body(response)}", response.status_code
+        
+    def _handle_status(self, response, ctx: "_RequestContext"):
+        """Dispatch on status code; handlers return the result tuple, ``_RETRY`` or ``_REAUTH``.
+        
+        Works on ``requests`` and ``httpx`` responses alike.
+        """
+        handler = self._STATUS_HANDLERS.get(response.status_code)
+        if handler is None:
+            handler = GLPIHttpClientService._handle_5xx if response.status_code >= 500 else GLPIHttpClientService._handle_other
+        return handler(self, response, ctx)
+        
+    @staticmethod
+    def _error_body(response, limit: int = _ERROR_BODY_LIMIT) -> str:
+        """First ``limit`` bytes of the body for error messages, without reading the rest."""
+        iter_content = getattr(response, "iter_content", None)
+        # httpx responses are read in full already; streamed requests responses are read up to the limit
+        chunk = next(iter_content(limit), b"") if iter_content else response.content[:limit]
+        return chunk.decode(response.encoding or "utf-8", errors="replace")
+        
+    @staticmethod
+    def _release(response) -> None:
+        """Close a streamed response, draining a small unread body first.
+        
+        Closing with unread bytes drops the socket; once drained, the connection goes
+        back to the pool, so retries and re-authentication don't open a new one.
+        """
+        try:
+            length = int(response.headers.get("Content-Length", ""))
+        except (TypeError, ValueError):
+            length = None
+        if length is not None and length <= _DRAIN_BODY_LIMIT:
+            try:
+                response.content  # Reads the rest of the body
+            except (RuntimeError, requests.exceptions.RequestException):
+                pass  # Already consumed, or the read failed: close() drops the socket
+        response.close()
+        
+    # Status code -> handler; codes not listed fall back to _handle_5xx / _handle_other
+    _STATUS_HANDLERS = {
+        200: _handle_ok,
+        201: _handle_ok,
+        206: _handle_ok,
+        401: _handle_reauth,
+        403: _handle_reauth,
+        429: _handle_rate,
+    }
+        
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """AsyncClient (HTTP/2 when available) for the running event loop, with keep-alive limits."""
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None or client.is_closed:
+            client = self._aclients[loop] = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return client
+        
+    async def _make_authenticated_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        log_response: bool = False,
+        parse_json: bool = True,
+    ) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Async counterpart of ``_make_authenticated_request`` over a shared ``httpx.AsyncClient``.
+        
+        Same return tuple and retry policy; concurrent calls are multiplexed over
+        the client's connections instead of blocking a thread each.
+        """
+        # Header refresh may log in (blocking, under the auth lock): keep it off the event loop
+        headers = self._valid_cached_headers() or await asyncio.to_thread(self._headers)
+        if not headers:
+            return False, None, "Authentication failed", 401
+            
+        url = f"{self.auth_service.glpi_url}/{endpoint.lstrip('/')}"
+        client = self._get_async_client()
+        metric_endpoint = _ID_SEGMENT_RE.sub("/{id}", endpoint.lstrip("/"))
+        # A copy: re-authentication updates it in place, and the cached dict is shared
+        ctx = _RequestContext(method, endpoint, dict(headers), parse_json)
+        
+        for attempt in range(self.max_retries):
+            try:
+                await self._await_rate_limit()
+                start_time = time.perf_counter()
+                
+                # Same adaptive limit as the sync path, so async fan-out is throttled too
+                async with self._limiter:
+                    response = await client.request(
+                        method, url, params=params or None, json=data or None, headers=ctx.headers, timeout=timeout
+                    )
+                    
+                response_time = time.perf_counter() - start_time
+                self._update_rate_state(response.headers)
+                if response.status_code == 429 or response.status_code >= 500:
+                    self._limiter.on_overload()
+                else:
+                    self._limiter.on_success(response_time)
+                    
+                if self.auth_service.structured_logger:
+                    log_glpi_request(url, response.status_code, response_time)
+                _record_glpi_request(
+                    endpoint=metric_endpoint,
+                    status_code=response.status_code,
+                    duration=response_time,
+                )
+                
+                if log_response:
+                    self.logger.info(f"{method} {endpoint} -> {response.status_code} ({response_time:.2f}s)")
+                    
+                # Same status handlers as the sync path; only the waiting differs
+                ctx.attempt = attempt
+                result = self._handle_status(response, ctx)
+                if result is _RETRY:
+                    await asyncio.sleep(ctx.retry_delay)
+                    continue
+                if result is _REAUTH:
+                    if await asyncio.to_thread(self._reauthenticate, ctx):
+                        continue
+                    return self._reauth_failed(ctx, response.status_code)
+                return result
+                
+            except httpx.TimeoutException:
+                self._limiter.on_overload()
+                if attempt < self.max_retries - 1:
+                    self.logger.warning(f"Request timeout, retrying (attempt {attempt + 1}/{self.max_retries})")
+                    await asyncio.sleep(self._jitter_delay(ctx))
+                    continue
+                return False, None, "Request timeout", 408
+                
+            except httpx.TransportError as e:
+                self._limiter.on_overload()
+                if attempt < self.max_retries - 1:
+                    self.logger.warning(f"Connection error, retrying (attempt {attempt + 1}/{self.max_retries}): {e}")
+                    await asyncio.sleep(self._jitter_delay(ctx))
+                    continue
+                return False, None, f"Connection error: {e}", 503
+                
+            except Exception as e:
+                self.logger.error(f"Unexpected error in async request: {e}")
+                return False, None, f"Unexpected error: {e}", 500
+                
+        return False, None, "Max retries exceeded", 500
+        
+    async def aget(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Make async GET request to GLPI API."""
+        return await self._make_authenticated_request_async("GET", endpoint, params=params, **kwargs)
+        
+    async def apost(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Make async POST request to GLPI API."""
+        return await self._make_authenticated_request_async("POST", endpoint, data=data, **kwargs)
+        
+    async def aput(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Make async PUT request to GLPI API."""
+        return await self._make_authenticated_request_async("PUT", endpoint, data=data, **kwargs)
+        
+    async def adelete(self, endpoint: str, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Make async DELETE request to GLPI API."""
+        return await self._make_authenticated_request_async("DELETE", endpoint, **kwargs)
+        
+    async def asearch(self, itemtype: str, criteria: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
+        """Async counterpart of ``search``."""
+        params = _flatten_query(criteria) if criteria else None
+        return await self.aget(f"search/{itemtype}", params=params, **kwargs)
+        
+    async def aclose(self) -> None:
+        """Close the running event loop's async client and its connections."""
+        client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
         """Make GET request to GLPI API."""
         return self._make_authenticated_request("GET", endpoint, params=params, **kwargs)
@@ -250,13 +762,8 @@ class GLPIHttpClientService:
     def search(self, itemtype: str, criteria: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
         """Search GLPI items using the search API."""
         endpoint = f"search/{itemtype}"
-        params = {}
-        
-        if criteria:
-            # Convert criteria to GLPI search format
-            for key, value in criteria.items():
-                params[key] = value
-                
+        # Flattened into a new dict, so callers keep theirs
+        params = _flatten_query(criteria) if criteria else None
         return self.get(endpoint, params=params, **kwargs)
         
     def get_item(self, itemtype: str, item_id: int, **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
@@ -265,7 +772,28 @@ class GLPIHttpClientService:
         return self.get(endpoint, **kwargs)
         
     def get_items(self, itemtype: str, ids: List[int], **kwargs) -> Tuple[bool, Optional[Dict], Optional[str], int]:
-        """Get multiple items from GLPI."""
+        """Get multiple items from GLPI.
+        
+        Large ID lists are split into chunks of ``_GET_ITEMS_CHUNK`` fetched in parallel
+        over the session pool; chunk results are concatenated in order and the first
+        failing chunk's result is returned as is.
+        """
         endpoint = f"{itemtype}"
-        params = {"ids": ids}
-        return self.get(endpoint, params=params, **kwargs)
\ No newline at end of file
+        if len(ids) <= _GET_ITEMS_CHUNK:
+            return self.get(endpoint, params={"ids": ids}, **kwargs)
+            
+        chunks = [ids[i:i + _GET_ITEMS_CHUNK] for i in range(0, len(ids), _GET_ITEMS_CHUNK)]
+        with ThreadPoolExecutor(max_workers=min(_GET_ITEMS_MAX_WORKERS, len(chunks))) as executor:
+            results = list(executor.map(lambda chunk: self.get(endpoint, params={"ids": chunk}, **kwargs), chunks))
+            
+        items = []
+        status_code = 200
+        for result in results:
+            success, data, error, status_code = result
+            if not success:
+                return result
+            if isinstance(data, list):
+                items.extend(data)
+            elif data is not None:
+                items.append(data)
+        return True, items, None, status_code
\ No newline at end of file
@@ -4,8 +4,18 @@ GLPI Metrics Service - Handles ticket metrics and aggregations.
 
 Extracted from monolithic GLPIService for better separation of concerns.
 """
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 
 from utils.date_validator import DateValidator
@@ -13,10 +23,144 @@ from .http_client_service import GLPIHttpClientService
 from .cache_service import GLPICacheService
 from .field_discovery_service import GLPIFieldDiscoveryService
 
+# Status IDs reported per level (Novo .. Fechado)
+_LEVEL_STATUS_IDS = ("1", "2", "3", "4", "5", "6")
+_LEVEL_PAGE_SIZE = 1000
+
+# Matches the HTTP client's pool (16 connections) with room for other callers
+_LEVEL_FETCH_MAX_WORKERS = 8
+
+# How long a polled ticket data version is trusted before GLPI is asked again
+_TICKETS_VERSION_TTL = 30
+_REVALIDATE_CLOCK_SKEW = 60
+
+
+def _make_key(prefix: str, **kwargs: Any) -> str:
+    """Build a fixed-length, namespaced cache key from query parameters.
+    
+    Parameters are serialized with sorted keys, so the digest doesn't depend on
+    argument order, and the prefix keeps different queries from colliding.
+    """
+    payload = json.dumps(kwargs, sort_keys=True, default=str).encode()
+    return f"{prefix}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+@lru_cache(maxsize=32)
+def _any_of(field_id: str, values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Nested criteria subgroup matching ``field_id`` equal to any of ``values``.
+    
+    The subgroups are constant per (field, values) pair, so one shared instance
+    is built and reused by every search; callers must treat it as read-only.
+    """
+    return {
+        "link": "AND",
+        "criteria": [
+            {"link": "OR", "field": field_id, "searchtype": "equals", "value": str(value)}
+            for value in values
+        ]
+    }
+
+
+def _date_range_criteria(date_field_id: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+    """AND criteria for ``date_field_id`` within ``start_date``..``end_date``, both days included."""
+    return [
+        {"link": "AND", "field": date_field_id, "searchtype": "morethan", "value": f"{start_date} 00:00:00"},
+        {"link": "AND", "field": date_field_id, "searchtype": "lessthan", "value": f"{end_date} 23:59:59"}
+    ]
+
+
+def _equals_criterion(field_id: str, value: Any) -> Dict[str, Any]:
+    """AND criterion matching ``field_id`` equal to ``value``."""
+    return {"link": "AND", "field": field_id, "searchtype": "equals", "value": str(value)}
+
+
+def _count_params(criteria: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Search parameters for a count-only query: only totalcount is read."""
+    return {"criteria": criteria, "range": "0-0", "only_id": "true"}
+
+
+def _stamped(result: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Copy of a (possibly cached) result carrying the time it is being served.
+    
+    Timestamps are kept out of cached payloads so a cache hit never reports the
+    time of the original fetch; the copy keeps the cached entry untouched.
+    """
+    return {**result, "timestamp": (now or datetime.now()).isoformat()}
+
+
+class LevelMetrics:
+    """Ticket counters for one service level (or the totals) while a window is tallied.
+    
+    Serialized to the plain dicts of the public payloads only once the window is
+    complete; ``group_id`` is None for totals.
+    """
+    
+    __slots__ = ("total", "resolved", "pending", "group_id")
+    
+    def __init__(self, group_id: Optional[int] = None):
+        self.total = 0
+        self.resolved = 0
+        self.pending = 0
+        self.group_id = group_id
+        
+    def add(self, total: int = 0, resolved: int = 0, pending: int = 0):
+        self.total += total
+        self.resolved += resolved
+        self.pending += pending
+        
+    def counts(self) -> Dict[str, int]:
+        return {"total": self.total, "resolved": self.resolved, "pending": self.pending}
+        
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self.counts(), "group_id": self.group_id}
+
+
+class _LevelTally:
+    """Per-level counters, running totals and failed levels for one window being tallied."""
+    
+    __slots__ = ("levels", "totals", "failed_levels")
+    
+    def __init__(self, levels: Dict[str, LevelMetrics]):
+        self.levels = levels
+        self.totals = LevelMetrics()
+        self.failed_levels = set()
+        
+    def add(self, level_name: str, **counts: int):
+        """Add counts to a level and, as they arrive, to the totals; no second pass over levels."""
+        self.levels[level_name].add(**counts)
+        self.totals.add(**counts)
+
 
 class GLPIMetricsService:
     """Handles GLPI ticket metrics and aggregations."""
     
+    # Service level mappings (read-only, shared by all instances)
+    service_levels = MappingProxyType({
+        "N1": 89,  # CC-SE-SUBADM-DTIC > N1
+        "N2": 90,  # CC-SE-SUBADM-DTIC > N2
+        "N3": 91,  # CC-SE-SUBADM-DTIC > N3
+        "N4": 92,  # CC-SE-SUBADM-DTIC > N4
+    })
+    
+    # Status mappings
+    status_map = MappingProxyType({
+        "Novo": 1,
+        "Processando (atribuído)": 2,
+        "Processando (planejado)": 3,
+        "Pendente": 4,
+        "Solucionado": 5,
+        "Fechado": 6,
+    })
+    
+    # Status groups counted as resolved / pending, resolved to IDs once at class creation
+    RESOLVED_STATUSES = ("Solucionado", "Fechado")
+    PENDING_STATUSES = ("Novo", "Processando (atribuído)", "Processando (planejado)", "Pendente")
+    RESOLVED_STATUS_IDS = tuple(map(status_map.__getitem__, RESOLVED_STATUSES))
+    PENDING_STATUS_IDS = tuple(map(status_map.__getitem__, PENDING_STATUSES))
+    # Same IDs as they appear in search rows
+    _RESOLVED_STATUS_KEYS = tuple(map(str, RESOLVED_STATUS_IDS))
+    _PENDING_STATUS_KEYS = tuple(map(str, PENDING_STATUS_IDS))
+    
     def __init__(
         self, 
         http_client: GLPIHttpClientService, 
@@ -29,24 +173,34 @@ class GLPIMetricsService:
         self.field_service = field_service
         self.logger = logging.getLogger("glpi_metrics")
         
-        # Service level mappings
-        self.service_levels = {
-            "N1": 89,  # CC-SE-SUBADM-DTIC > N1
-            "N2": 90,  # CC-SE-SUBADM-DTIC > N2
-            "N3": 91,  # CC-SE-SUBADM-DTIC > N3
-            "N4": 92,  # CC-SE-SUBADM-DTIC > N4
-        }
+        # Ticket data version embedded in count cache keys (see _tickets_version)
+        self._tickets_version_token = ""
+        self._tickets_version_expires = 0.0
+        self._tickets_version_refreshing = False
+        self._tickets_version_lock = threading.Lock()
         
-        # Status mappings
-        self.status_map = {
-            "Novo": 1,
-            "Processando (atribuído)": 2,
-            "Processando (planejado)": 3,
-            "Pendente": 4,
-            "Solucionado": 5,
-            "Fechado": 6,
-        }
+    # Field IDs don't change at runtime; resolve them once per service instance
+    @cached_property
+    def _date_field_id(self) -> str:
+        return str(self.field_service.get_field_id("date") or "15")
+        
+    @cached_property
+    def _status_field_id(self) -> str:
+        return str(self.field_service.get_field_id("status") or "12")
+        
+    @cached_property
+    def _group_field_id(self) -> str:
+        return str(self.field_service.get_field_id("groups_id_tech") or "8")
         
+    @cached_property
+    def _date_mod_field_id(self) -> str:
+        return str(self.field_service.get_field_id("date_mod") or "19")
+        
+    def invalidate_field_ids(self) -> None:
+        """Drop the memoized field IDs so the next query re-reads them from field discovery."""
+        for name in ("_date_field_id", "_status_field_id", "_group_field_id", "_date_mod_field_id"):
+            self.__dict__.pop(name, None)
+            
     def get_ticket_count_by_hierarchy(
         self,
         start_date: str = None,
@@ -56,75 +210,48 @@ class GLPIMetricsService:
         use_cache: bool = True,
     ) -> Dict[str, Any]:
         """Get ticket count by service hierarchy level."""
+        now = datetime.now()
         try:
             # Validate dates
             if start_date:
                 if not DateValidator.is_valid_date(start_date):
                     return {"error": "Invalid start_date format", "count": 0}
             else:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+                start_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
                 
             if end_date:
                 if not DateValidator.is_valid_date(end_date):
                     return {"error": "Invalid end_date format", "count": 0}
             else:
-                end_date = datetime.now().strftime('%Y-%m-%d')
+                end_date = now.strftime('%Y-%m-%d')
                 
             # Check cache if enabled
-            cache_key = f"ticket_count_{level}_{status}_{start_date}_{end_date}"
+            cache_key = _make_key(
+                "ticket_count", level=level, status=status, start_date=start_date, end_date=end_date,
+                version=self._count_version(start_date, end_date, use_cache)
+            )
             if use_cache:
-                cached_result = self.cache_service.get_cached_data("ticket_metrics", cache_key)
+                cached_result = self._get_cached_count(cache_key, start_date, end_date)
                 if cached_result:
-                    self.logger.debug(f"Returning cached ticket count for {cache_key}")
+                    self.logger.debug("Returning cached ticket count for %s", cache_key)
                     return cached_result
                     
-            # Get field IDs
-            group_field_id = self.field_service.get_field_id("groups_id_tech") or "8"
-            status_field_id = self.field_service.get_field_id("status") or "12"
-            date_field_id = self.field_service.get_field_id("date") or "15"
-            
             # Build search criteria
-            criteria = []
+            criteria = _date_range_criteria(self._date_field_id, start_date, end_date)
             metacriteria = []
             
-            # Date range criteria
-            criteria.extend([
-                {
-                    "link": "AND",
-                    "field": date_field_id,
-                    "searchtype": "morethan",
-                    "value": f"{start_date} 00:00:00"
-                },
-                {
-                    "link": "AND", 
-                    "field": date_field_id,
-                    "searchtype": "lessthan",
-                    "value": f"{end_date} 23:59:59"
-                }
-            ])
-            
             # Level/group criteria
             if level and level in self.service_levels:
-                criteria.append({
-                    "link": "AND",
-                    "field": group_field_id,
-                    "searchtype": "equals",
-                    "value": str(self.service_levels[level])
-                })
+                criteria.append(_equals_criterion(self._group_field_id, self.service_levels[level]))
                 
             # Status criteria  
             if status and status in self.status_map:
-                criteria.append({
-                    "link": "AND",
-                    "field": status_field_id,
-                    "searchtype": "equals", 
-                    "value": str(self.status_map[status])
-                })
+                criteria.append(_equals_criterion(self._status_field_id, self.status_map[status]))
                 
             # Prepare search parameters
             search_params = {
                 "criteria": criteria,
-                "range": "0-1",  # Just get count
+                "range": "0-0",  # Only totalcount is read; fetch at most one ID row
                 "only_id": "true"
             }
             
@@ -154,7 +281,7 @@ class GLPIMetricsService:
             
             # Cache result
             if use_cache:
-                self.cache_service.set_cached_data("ticket_metrics", result, ttl=300, sub_key=cache_key)
+                self.cache_service.set_cached_data("ticket_metrics", result, ttl=self.cache_service.ttl_for_window(end_date), sub_key=cache_key)
                 
             return result
             
@@ -171,8 +298,26 @@ class GLPIMetricsService:
         use_cache: bool = True,
     ) -> Dict[str, Any]:
         """Get general ticket count with filters and enhanced validation."""
+        now = datetime.now()
         try:
-            self.logger.debug(f"Getting ticket count with filters - status: {status}, group_id: {group_id}, start_date: {start_date}, end_date: {end_date}")
+            # Probe the cache before any validation or logging work; only validated
+            # windows are ever cached, so a hit can be returned as is
+            window_start = start_date or (now - timedelta(days=30)).strftime('%Y-%m-%d')
+            window_end = end_date or now.strftime('%Y-%m-%d')
+            cache_key = _make_key(
+                "general_count", status=status, group_id=group_id, start_date=window_start, end_date=window_end,
+                version=self._count_version(window_start, window_end, use_cache)
+            )
+            if use_cache:
+                cached_result = self._get_cached_count(cache_key, window_start, window_end)
+                if cached_result:
+                    self.logger.debug("Returning cached result for %s", cache_key)
+                    return _stamped(cached_result, now)
+                    
+            self.logger.debug(
+                "Getting ticket count with filters - status: %s, group_id: %s, start_date: %s, end_date: %s",
+                status, group_id, start_date, end_date
+            )
             
             # Validate dates
             if start_date and not DateValidator.is_valid_date(start_date):
@@ -182,7 +327,7 @@ class GLPIMetricsService:
                     "count": 0,
                     "success": False,
                     "filters": {"status": status, "group_id": group_id, "start_date": start_date, "end_date": end_date},
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now.isoformat()
                 }
             if end_date and not DateValidator.is_valid_date(end_date):
                 self.logger.error(f"Invalid end_date format: {end_date}")
@@ -191,79 +336,38 @@ class GLPIMetricsService:
                     "count": 0,
                     "success": False,
                     "filters": {"status": status, "group_id": group_id, "start_date": start_date, "end_date": end_date},
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now.isoformat()
                 }
                 
             # Set defaults
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
+            start_date, end_date = window_start, window_end
                 
-            # Check cache
-            cache_key = f"general_count_{status}_{group_id}_{start_date}_{end_date}"
-            if use_cache:
-                cached_result = self.cache_service.get_cached_data("ticket_metrics", cache_key)
-                if cached_result:
-                    self.logger.debug(f"Returning cached result for {cache_key}")
-                    return cached_result
-                    
             # Build search criteria
-            criteria = []
-            
-            # Date field
-            date_field_id = self.field_service.get_field_id("date") or "15"
-            criteria.extend([
-                {
-                    "link": "AND",
-                    "field": date_field_id,
-                    "searchtype": "morethan",
-                    "value": f"{start_date} 00:00:00"
-                },
-                {
-                    "link": "AND",
-                    "field": date_field_id, 
-                    "searchtype": "lessthan",
-                    "value": f"{end_date} 23:59:59"
-                }
-            ])
+            criteria = _date_range_criteria(self._date_field_id, start_date, end_date)
             
             # Status filter
             if status:
-                status_field_id = self.field_service.get_field_id("status") or "12"
                 if status in self.status_map:
-                    criteria.append({
-                        "link": "AND",
-                        "field": status_field_id,
-                        "searchtype": "equals",
-                        "value": str(self.status_map[status])
-                    })
+                    criteria.append(_equals_criterion(self._status_field_id, self.status_map[status]))
                 else:
                     self.logger.warning(f"Unknown status: {status}. Available: {list(self.status_map.keys())}")
                     
             # Group filter
             if group_id:
-                group_field_id = self.field_service.get_field_id("groups_id_tech") or "8"
-                criteria.append({
-                    "link": "AND", 
-                    "field": group_field_id,
-                    "searchtype": "equals",
-                    "value": str(group_id)
-                })
+                criteria.append(_equals_criterion(self._group_field_id, group_id))
                 
             # Execute search
             search_params = {
                 "criteria": criteria,
-                "range": "0-1",
-                "only_id": "true",
-                "forcedisplay": ["2"]  # Minimal fields for performance
+                "range": "0-0",  # Only totalcount is read; fetch at most one ID row
+                "only_id": "true"
             }
             
-            self.logger.debug(f"Executing search with params: {search_params}")
+            self.logger.debug("Executing search with params: %s", search_params)
             
             success, data, error, status_code = self.http_client.search("Ticket", search_params)
             
-            self.logger.debug(f"Search result - Success: {success}, Status: {status_code}, Error: {error}")
+            self.logger.debug("Search result - Success: %s, Status: %s, Error: %s", success, status_code, error)
             
             if not success:
                 self.logger.error(f"Failed to get ticket count: {error}")
@@ -273,7 +377,7 @@ class GLPIMetricsService:
                     "success": False,
                     "filters": {"status": status, "group_id": group_id, "start_date": start_date, "end_date": end_date},
                     "data_source": "glpi",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now.isoformat()
                 }
                 
             # Extract count with validation
@@ -302,17 +406,16 @@ class GLPIMetricsService:
                     "start_date": start_date,
                     "end_date": end_date
                 },
-                "data_source": "glpi",
-                "timestamp": datetime.now().isoformat()
+                "data_source": "glpi"
             }
             
             self.logger.info(f"Successfully retrieved {total_count} tickets with filters")
             
             # Cache result
             if use_cache:
-                self.cache_service.set_cached_data("ticket_metrics", result, ttl=300, sub_key=cache_key)
+                self.cache_service.set_cached_data("ticket_metrics", result, ttl=self.cache_service.ttl_for_window(end_date), sub_key=cache_key)
                 
-            return result
+            return _stamped(result, now)
             
         except Exception as e:
             self.logger.error(f"Error getting ticket count: {e}")
@@ -322,87 +425,325 @@ class GLPIMetricsService:
                 "success": False,
                 "filters": {"status": status, "group_id": group_id, "start_date": start_date, "end_date": end_date},
                 "data_source": "error",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
+            }
+            
+    def get_ticket_count_multi_status(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        statuses: List[Any] = None,
+        group_id: int = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """Count tickets whose status is any of ``statuses`` with a single search.
+        
+        ``statuses`` takes status names (keys of ``status_map``) or numeric IDs; the
+        set is sent as one nested OR group instead of one count per status.
+        """
+        now = datetime.now()
+        try:
+            start_date = start_date or (now - timedelta(days=30)).strftime('%Y-%m-%d')
+            end_date = end_date or now.strftime('%Y-%m-%d')
+            if not DateValidator.is_valid_date(start_date) or not DateValidator.is_valid_date(end_date):
+                return {"error": "Invalid date format", "count": 0, "success": False, "timestamp": now.isoformat()}
+                
+            status_ids = []
+            for status in statuses or ():
+                status_id = self.status_map.get(status, status)
+                if str(status_id) not in _LEVEL_STATUS_IDS:
+                    return {"error": f"Unknown status: {status}", "count": 0, "success": False, "timestamp": now.isoformat()}
+                status_ids.append(int(status_id))
+            status_ids = tuple(sorted(set(status_ids)))
+            
+            cache_key = _make_key(
+                "multi_status_count", status_ids=status_ids, group_id=group_id, start_date=start_date, end_date=end_date,
+                version=self._count_version(start_date, end_date, use_cache)
+            )
+            if use_cache:
+                cached_result = self._get_cached_count(cache_key, start_date, end_date)
+                if cached_result:
+                    return _stamped(cached_result, now)
+                    
+            criteria = self._window_criteria(start_date, end_date, group_id)
+            if status_ids:
+                criteria.append(self._status_in_criterion(status_ids))
+            success, count, error = self._search_count(criteria)
+            if not success:
+                self.logger.error(f"Failed to get ticket count for statuses {status_ids}: {error}")
+                return {"error": error, "count": 0, "success": False, "data_source": "glpi", "timestamp": now.isoformat()}
+                
+            result = {
+                "count": count,
+                "status_ids": list(status_ids),
+                "group_id": group_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "success": True,
+                "data_source": "glpi"
             }
+            if use_cache:
+                self.cache_service.set_cached_data(
+                    "ticket_metrics", result, ttl=self.cache_service.ttl_for_window(end_date), sub_key=cache_key
+                )
+            return _stamped(result, now)
+            
+        except Exception as e:
+            self.logger.error(f"Error getting multi-status ticket count: {e}")
+            return {"error": str(e), "count": 0, "success": False, "data_source": "error", "timestamp": now.isoformat()}
+            
+    def _window_criteria(self, start_date: str, end_date: str, group_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Criteria for tickets opened within ``start_date``..``end_date``, optionally in one group."""
+        criteria = _date_range_criteria(self._date_field_id, start_date, end_date)
+        if group_id:
+            criteria.append(_equals_criterion(self._group_field_id, group_id))
+        return criteria
+        
+    def _status_in_criterion(self, status_ids: Tuple[int, ...]) -> Dict[str, Any]:
+        """Nested OR subgroup matching any of ``status_ids`` in a single search."""
+        return _any_of(self._status_field_id, status_ids)
+        
+    def _window_unchanged_since(
+        self, start_date: str, end_date: str, since: float, service_levels_only: bool = True
+    ) -> bool:
+        """Whether no ticket opened in the window was modified after ``since``.
+        
+        Count-only probe used to revalidate expired window results: any status,
+        group or date edit bumps the ticket's modification date. Level metrics only
+        look at service-level groups; counts pass ``service_levels_only=False``.
+        """
+        # Small margin for clock skew between this host and the GLPI server
+        modified_after = datetime.fromtimestamp(since - _REVALIDATE_CLOCK_SKEW).strftime('%Y-%m-%d %H:%M:%S')
+        criteria = _date_range_criteria(self._date_field_id, start_date, end_date) + [
+            {"link": "AND", "field": self._date_mod_field_id, "searchtype": "morethan", "value": modified_after}
+        ]
+        if service_levels_only:
+            criteria.append(_any_of(self._group_field_id, tuple(self.service_levels.values())))
+        success, count, error = self._search_count(criteria)
+        if not success:
+            self.logger.debug("Revalidation probe failed for %s..%s: %s", start_date, end_date, error)
+        return success and count == 0
+        
+    def _scan_status_buckets(
+        self, criteria: List[Dict[str, Any]]
+    ) -> Tuple[bool, int, Optional[Tuple[int, int]], Optional[str]]:
+        """Count the matches of ``criteria`` and, when they fit in one page, tally their statuses.
+        
+        Returns ``(success, total, buckets, error)``. ``buckets`` is ``(resolved,
+        pending)`` when the page holds every match, or None when the window is
+        larger than a page and the caller has to count the buckets server-side.
+        The count-only probe comes first, so an oversized window never downloads rows.
+        """
+        success, total_count, error = self._search_count(criteria)
+        if not success or total_count > _LEVEL_PAGE_SIZE:
+            return success, total_count, None, error
+        if not total_count:
+            return True, 0, (0, 0), None
+        try:
+            return self._status_buckets(*self.http_client.search("Ticket", self._status_scan_params(criteria)))
+        except Exception as e:
+            return False, 0, None, str(e)
+            
+    async def _ascan_status_buckets(
+        self, criteria: List[Dict[str, Any]]
+    ) -> Tuple[bool, int, Optional[Tuple[int, int]], Optional[str]]:
+        """Async counterpart of ``_scan_status_buckets``."""
+        success, total_count, error = await self._asearch_count(criteria)
+        if not success or total_count > _LEVEL_PAGE_SIZE:
+            return success, total_count, None, error
+        if not total_count:
+            return True, 0, (0, 0), None
+        try:
+            return self._status_buckets(*await self.http_client.asearch("Ticket", self._status_scan_params(criteria)))
+        except Exception as e:
+            return False, 0, None, str(e)
+            
+    def _status_scan_params(self, criteria: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "criteria": criteria,
+            "range": f"0-{_LEVEL_PAGE_SIZE - 1}",
+            "forcedisplay": [self._status_field_id]
+        }
+        
+    def _status_buckets(
+        self, success: bool, data: Optional[Dict[str, Any]], error: Optional[str], status_code: int
+    ) -> Tuple[bool, int, Optional[Tuple[int, int]], Optional[str]]:
+        """Tally a status scan response (``http_client.search`` tuple) into buckets."""
+        if not success:
+            return False, 0, None, error or "Unknown GLPI error"
+            
+        total_count = int(data.get("totalcount") or 0)
+        rows = data.get("data") or []
+        if len(rows) < total_count:
+            return True, total_count, None, None
+            
+        tally = Counter(map(str, map(itemgetter(self._status_field_id), rows)))
+        resolved = sum(map(tally.__getitem__, self._RESOLVED_STATUS_KEYS))
+        pending = sum(map(tally.__getitem__, self._PENDING_STATUS_KEYS))
+        return True, total_count, (resolved, pending), None
+            
+    def _count_version(self, start_date: str, end_date: str, use_cache: bool = True) -> str:
+        """Data version for a count cache key; empty for closed windows and invalid dates.
+        
+        The version is global, so embedding it everywhere would orphan every cached
+        count on any ticket edit. Only windows that still take new tickets (ending
+        yesterday or later) carry it; closed windows keep their long TTL and are
+        revalidated per window on expiry instead (see ``_get_cached_count``).
+        Invalid windows are rejected by the caller, so they never cost a poll.
+        """
+        if not use_cache or not DateValidator.is_valid_date(start_date) or not DateValidator.is_valid_date(end_date):
+            return ""
+        try:
+            if date.fromisoformat(end_date) < date.today() - timedelta(days=1):
+                return ""
+        except (TypeError, ValueError):
+            return ""
+        return self._tickets_version()
+        
+    def _get_cached_count(self, cache_key: str, start_date: str, end_date: str):
+        """Cached count for the window, revalidated with a window-scoped probe once expired."""
+        return self.cache_service.get_revalidated(
+            "ticket_metrics",
+            cache_key,
+            lambda stored_at: self._window_unchanged_since(start_date, end_date, stored_at, service_levels_only=False)
+        )
+        
+    def _tickets_version(self) -> str:
+        """Token that changes whenever a ticket is created, modified or deleted.
+        
+        Built from the latest modification date and the ticket count, polled with a
+        one-row search at most every ``_TICKETS_VERSION_TTL`` seconds. Count cache
+        keys of open windows embed it (see ``_count_version``), so edits make stale
+        entries unreachable instead of waiting out their TTL. Empty when the poll fails, which leaves TTL-only expiry.
+        
+        One caller polls, outside the lock; the others keep the previous token meanwhile.
+        """
+        if time.monotonic() < self._tickets_version_expires:
+            return self._tickets_version_token
+            
+        with self._tickets_version_lock:
+            if self._tickets_version_refreshing or time.monotonic() < self._tickets_version_expires:
+                return self._tickets_version_token
+            self._tickets_version_refreshing = True
+            
+        version = ""
+        try:
+            version = self._poll_tickets_version()
+        finally:
+            with self._tickets_version_lock:
+                self._tickets_version_token = version
+                self._tickets_version_expires = time.monotonic() + _TICKETS_VERSION_TTL
+                self._tickets_version_refreshing = False
+        return version
+        
+    def _poll_tickets_version(self) -> str:
+        """Poll GLPI for the latest modification date and ticket count; empty on failure."""
+        date_mod_field_id = self._date_mod_field_id
+        try:
+            success, data, error, _ = self.http_client.search("Ticket", {
+                "range": "0-0",
+                "sort": date_mod_field_id,
+                "order": "DESC",
+                "forcedisplay": [date_mod_field_id]
+            })
+            if success and isinstance(data, dict):
+                rows = data.get("data") or [{}]
+                return f"{rows[0].get(date_mod_field_id, '')}|{data.get('totalcount', 0)}"
+            self.logger.debug("Ticket version poll failed: %s", error)
+        except Exception as e:
+            self.logger.debug("Ticket version poll failed: %s", e)
+        return ""
+        
+    def _search_count(self, criteria: List[Dict[str, Any]]) -> Tuple[bool, int, Optional[str]]:
+        """Run a count-only ticket search.
+        
+        Internal fast path for aggregators: no date validation, caching or result
+        envelope, just ``(success, count, error)``.
+        """
+        try:
+            success, data, error, _ = self.http_client.search("Ticket", _count_params(criteria))
+            if not success:
+                return False, 0, error or "Unknown GLPI error"
+            return True, int(data.get("totalcount") or 0), None
+        except Exception as e:
+            return False, 0, str(e)
+            
+    async def _asearch_count(self, criteria: List[Dict[str, Any]]) -> Tuple[bool, int, Optional[str]]:
+        """Async counterpart of ``_search_count``."""
+        try:
+            success, data, error, _ = await self.http_client.asearch("Ticket", _count_params(criteria))
+            if not success:
+                return False, 0, error or "Unknown GLPI error"
+            return True, int(data.get("totalcount") or 0), None
+        except Exception as e:
+            return False, 0, str(e)
             
     def _get_level_metrics(self, level_id: str, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """Get metrics for a specific service level with enhanced error handling."""
+        """Get metrics for a specific service level with enhanced error handling.
+        
+        A single paged search returns the status column of every ticket in the level,
+        and the per-status counters are tallied locally instead of issuing one count
+        query per status.
+        """
         try:
-            self.logger.debug(f"Getting metrics for level {level_id} from {start_date} to {end_date}")
+            self.logger.debug("Getting metrics for level %s from %s to %s", level_id, start_date, end_date)
+            
+            group_field_id = self._group_field_id
+            status_field_id = self._status_field_id
+            date_field_id = self._date_field_id
             
             # Build search criteria
             criteria = [
-                {'field': 2, 'searchtype': 'equals', 'value': level_id}  # Group ID
+                {'field': group_field_id, 'searchtype': 'equals', 'value': level_id}
             ]
             
             if start_date:
                 criteria.append({
-                    'field': 15,  # Date field
+                    'link': 'AND',
+                    'field': date_field_id,
                     'searchtype': 'morethan',
                     'value': start_date
                 })
             
             if end_date:
                 criteria.append({
-                    'field': 15,  # Date field
+                    'link': 'AND',
+                    'field': date_field_id,
                     'searchtype': 'lessthan',
                     'value': end_date
                 })
             
-            # Get total tickets with timeout and retry
-            total_response = self.http_client.search('Ticket', {
-                'criteria': criteria,
-                'range': '0-0',  # Just get count
-                'forcedisplay': [2]  # Minimal fields for performance
-            })
-            
-            if not total_response or not total_response.get('success'):
-                error_msg = total_response.get('error', 'Unknown error') if total_response else 'No response'
-                self.logger.error(f"Failed to get total tickets for level {level_id}: {error_msg}")
-                return {
-                    'total': 0,
-                    'by_status': {},
-                    'error': f"Failed to fetch data: {error_msg}",
-                    'level_id': level_id
-                }
-            
-            total_count = total_response.get('totalcount', 0)
-            self.logger.debug(f"Level {level_id} has {total_count} total tickets")
-            
-            # Get tickets by status with better error handling
-            status_counts = {}
-            status_names = {
-                '1': 'new',
-                '2': 'assigned', 
-                '3': 'planned',
-                '4': 'waiting',
-                '5': 'solved',
-                '6': 'closed'
-            }
+            status_tally = Counter()
+            # GLPI always returns forced display columns, so rows can be indexed directly
+            status_of = itemgetter(status_field_id)
+            total_count = 0
+            offset = 0
+            while True:
+                success, data, error, _ = self.http_client.search('Ticket', {
+                    'criteria': criteria,
+                    'range': f"{offset}-{offset + _LEVEL_PAGE_SIZE - 1}",
+                    'forcedisplay': [status_field_id]
+                })
+                
+                if not success or not isinstance(data, dict):
+                    error_msg = error or 'No response'
+                    self.logger.error(f"Failed to get tickets for level {level_id}: {error_msg}")
+                    return {
+                        'total': 0,
+                        'by_status': {},
+                        'error': f"Failed to fetch data: {error_msg}",
+                        'level_id': level_id
+                    }
+                
+                total_count = int(data.get('totalcount') or 0)
+                rows = data.get('data') or []
+                status_tally.update(map(str, map(status_of, rows)))
+                offset += len(rows)
+                if not rows or offset >= total_count:
+                    break
             
-            for status_id, status_name in status_names.items():
-                try:
-                    status_criteria = criteria + [
-                        {'field': 12, 'searchtype': 'equals', 'value': status_id}
-                    ]
-                    
-                    status_response = self.http_client.search('Ticket', {
-                        'criteria': status_criteria,
-                        'range': '0-0',
-                        'forcedisplay': [2]
-                    })
-                    
-                    if status_response and status_response.get('success'):
-                        count = status_response.get('totalcount', 0)
-                        status_counts[status_id] = count
-                        self.logger.debug(f"Level {level_id} status {status_name}: {count} tickets")
-                    else:
-                        status_counts[status_id] = 0
-                        self.logger.warning(f"Failed to get status {status_name} count for level {level_id}")
-                        
-                except Exception as status_error:
-                    self.logger.error(f"Error getting status {status_name} for level {level_id}: {status_error}")
-                    status_counts[status_id] = 0
+            self.logger.debug("Level %s has %s total tickets", level_id, total_count)
+            status_counts = {status_id: status_tally[status_id] for status_id in _LEVEL_STATUS_IDS}
             
             # Validate data consistency
             status_sum = sum(status_counts.values())
@@ -420,7 +761,7 @@ class GLPIMetricsService:
                 }
             }
             
-            self.logger.debug(f"Successfully retrieved metrics for level {level_id}: {result}")
+            self.logger.debug("Successfully retrieved metrics for level %s: %s", level_id, result)
             return result
             
         except Exception as e:
@@ -432,157 +773,397 @@ class GLPIMetricsService:
                 'level_id': level_id
             }
             
-    def get_metrics_by_level(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """Get metrics aggregated by service level with enhanced validation."""
+    def _new_level_metrics(self) -> Dict[str, LevelMetrics]:
+        """Zeroed counters for every service level."""
+        return {level_name: LevelMetrics(group_id) for level_name, group_id in self.service_levels.items()}
+        
+    @staticmethod
+    def _level_result(
+        start_date: str,
+        end_date: str,
+        levels: Dict[str, LevelMetrics],
+        totals: LevelMetrics,
+        failed_levels: Optional[set] = None,
+    ) -> Dict[str, Any]:
+        """``get_metrics_by_level`` payload for a tallied window.
+        
+        Levels whose searches failed keep partial counts; they are listed under
+        ``failed_levels`` and the payload is flagged ``partial``.
+        """
+        result = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "levels": {level_name: level_metrics.as_dict() for level_name, level_metrics in levels.items()},
+            "totals": totals.counts(),
+            "data_source": "glpi",
+            "is_mock_data": False
+        }
+        if failed_levels:
+            result["partial"] = True
+            result["failed_levels"] = sorted(failed_levels)
+        return result
+        
+    def _cache_level_result(self, cache_key: str, result: Dict[str, Any]):
+        """Cache a window's level metrics unless some level failed to load.
+        
+        A partial result would otherwise be served (and revalidated) for the
+        window's full TTL; leaving it out makes the next call retry GLPI.
+        """
+        if result.get("partial"):
+            self.logger.warning(
+                f"Not caching partial metrics for {result['start_date']} to {result['end_date']}: "
+                f"failed levels {result['failed_levels']}"
+            )
+            return
+        self.cache_service.set_cached_data(
+            "ticket_metrics", result, ttl=self.cache_service.ttl_for_window(result["end_date"]), sub_key=cache_key
+        )
+        
+    def _scan_period_buckets(
+        self, criteria: List[Dict[str, Any]], split_date: str
+    ) -> Tuple[bool, Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]], Optional[str]]:
+        """Fetch one page of status and opening date for ``criteria``, split at ``split_date``.
+        
+        Returns ``(success, buckets, error)`` where ``buckets`` is ``((total, resolved,
+        pending) before split_date, (total, resolved, pending) from split_date on)``, or
+        None when the window is larger than a page. As in ``_scan_status_buckets``, a
+        count-only probe runs first so an oversized window never downloads rows.
+        """
+        success, total_count, error = self._search_count(criteria)
+        if not success or total_count > _LEVEL_PAGE_SIZE:
+            return success, None, error
+        if not total_count:
+            return True, ((0, 0, 0), (0, 0, 0)), None
         try:
-            # Set date defaults
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
+            status_field_id = self._status_field_id
+            date_field_id = self._date_field_id
+            success, data, error, _ = self.http_client.search("Ticket", {
+                "criteria": criteria,
+                "range": f"0-{_LEVEL_PAGE_SIZE - 1}",
+                "forcedisplay": [status_field_id, date_field_id]
+            })
+            if not success:
+                return False, None, error or "Unknown GLPI error"
                 
-            # Validate dates
-            if start_date and not DateValidator.is_valid_date(start_date):
-                self.logger.error(f"Invalid start_date format: {start_date}")
-                return {"error": "Invalid start_date format", "levels": {}, "totals": {"total": 0, "resolved": 0, "pending": 0}}
-            if end_date and not DateValidator.is_valid_date(end_date):
-                self.logger.error(f"Invalid end_date format: {end_date}")
-                return {"error": "Invalid end_date format", "levels": {}, "totals": {"total": 0, "resolved": 0, "pending": 0}}
+            rows = data.get("data") or []
+            if len(rows) < int(data.get("totalcount") or 0):
+                return True, None, None
                 
+            # Dates come back as "YYYY-MM-DD HH:MM:SS", so the ISO prefix orders as text
+            tallies = (Counter(), Counter())
+            for row in rows:
+                tallies[str(row.get(date_field_id) or "")[:10] >= split_date][str(row.get(status_field_id))] += 1
+            buckets = tuple(
+                (
+                    sum(tally.values()),
+                    sum(map(tally.__getitem__, self._RESOLVED_STATUS_KEYS)),
+                    sum(map(tally.__getitem__, self._PENDING_STATUS_KEYS))
+                )
+                for tally in tallies
+            )
+            return True, buckets, None
+        except Exception as e:
+            return False, None, str(e)
+            
+    def get_adjacent_period_metrics(
+        self, previous_start: str, current_start: str, current_end: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Level metrics for two back-to-back windows, fetched together.
+        
+        The previous window runs from ``previous_start`` to the day before
+        ``current_start``. Each level is scanned once over the combined range and
+        its rows are split by opening date, halving the searches of two separate
+        ``get_metrics_by_level`` calls. Both results are cached under the same keys
+        ``get_metrics_by_level`` uses. A level that doesn't fit in one page is counted
+        per window with count-only searches; the other levels keep their scan.
+        
+        Returns ``(previous_metrics, current_metrics)``.
+        """
+        now = datetime.now()
+        previous_end = (date.fromisoformat(current_start) - timedelta(days=1)).isoformat()
+        windows = ((previous_start, previous_end), (current_start, current_end))
+        cache_keys = [_make_key("metrics_by_level", start_date=start, end_date=end) for start, end in windows]
+        
+        # Fresh entries for both windows come back from one batched lookup; only
+        # expired ones pay for a revalidation probe
+        fresh = self.cache_service.get_cached_many("ticket_metrics", cache_keys)
+        cached = [
+            fresh.get(cache_key) or self.cache_service.get_revalidated(
+                "ticket_metrics",
+                cache_key,
+                lambda stored_at, start=start, end=end: self._window_unchanged_since(start, end, stored_at)
+            )
+            for cache_key, (start, end) in zip(cache_keys, windows)
+        ]
+        if all(cached):
+            return tuple(_stamped(result, now) for result in cached)
+            
+        tallies = tuple(_LevelTally(self._new_level_metrics()) for _ in windows)
+        with ThreadPoolExecutor(max_workers=_LEVEL_FETCH_MAX_WORKERS) as executor:
+            scans = {
+                executor.submit(
+                    self._scan_period_buckets, self._window_criteria(previous_start, current_end, group_id), current_start
+                ): (level_name, group_id)
+                for level_name, group_id in self.service_levels.items()
+            }
+            counts = {}
+            for future in as_completed(scans):
+                level_name, group_id = scans[future]
+                success, buckets, error = future.result()
+                if not success:
+                    self.logger.warning(f"Failed to get ticket counts for level {level_name}: {error}")
+                    for tally in tallies:
+                        tally.failed_levels.add(level_name)
+                    continue
+                if buckets is not None:
+                    for tally, (total, resolved, pending) in zip(tallies, buckets):
+                        tally.add(level_name, total=total, resolved=resolved, pending=pending)
+                    continue
+                # Too many tickets for a single page: count this level per window, server-side
+                for tally, (start, end) in zip(tallies, windows):
+                    criteria = self._window_criteria(start, end, group_id)
+                    counts[executor.submit(self._search_count, criteria)] = (tally, level_name, "total")
+                    for bucket, status_ids in (("resolved", self.RESOLVED_STATUS_IDS), ("pending", self.PENDING_STATUS_IDS)):
+                        bucket_criteria = criteria + [self._status_in_criterion(status_ids)]
+                        counts[executor.submit(self._search_count, bucket_criteria)] = (tally, level_name, bucket)
+                        
+            for future in as_completed(counts):
+                self._add_level_count(*counts[future], future.result())
+                
+        return tuple(
+            self._finish_level_window(tally, start, end, cache_key, now)
+            for tally, (start, end), cache_key in zip(tallies, windows, cache_keys)
+        )
+        
+    def _level_window(
+        self, start_date: Optional[str], end_date: Optional[str], now: datetime
+    ) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+        """Window for level metrics (last 30 days by default) and the error payload if a date is invalid."""
+        start_date = start_date or (now - timedelta(days=30)).strftime('%Y-%m-%d')
+        end_date = end_date or now.strftime('%Y-%m-%d')
+        for name, value in (("start_date", start_date), ("end_date", end_date)):
+            if not DateValidator.is_valid_date(value):
+                self.logger.error(f"Invalid {name} format: {value}")
+                return start_date, end_date, {
+                    "error": f"Invalid {name} format", "levels": {}, "totals": {"total": 0, "resolved": 0, "pending": 0}
+                }
+        return start_date, end_date, None
+        
+    def _level_criteria(self, start_date: str, end_date: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Window criteria per service level."""
+        return {
+            level_name: self._window_criteria(start_date, end_date, group_id)
+            for level_name, group_id in self.service_levels.items()
+        }
+        
+    def _add_level_scan(
+        self,
+        tally: _LevelTally,
+        level_name: str,
+        criteria: List[Dict[str, Any]],
+        scan: Tuple[bool, int, Optional[Tuple[int, int]], Optional[str]],
+    ) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Tally one level's ``_scan_status_buckets`` result.
+        
+        Returns the ``(bucket, criteria)`` counts still needed: resolved (status 5
+        or 6) and pending (status 1-4) for a level too large for one page.
+        """
+        success, total_count, buckets, error = scan
+        if not success:
+            self.logger.warning(f"Failed to get ticket counts for level {level_name}: {error}")
+            tally.failed_levels.add(level_name)
+            return []
+        if buckets is not None:
+            resolved, pending = buckets
+            tally.add(level_name, total=total_count, resolved=resolved, pending=pending)
+            return []
+        tally.add(level_name, total=total_count)
+        return [
+            (bucket, criteria + [self._status_in_criterion(status_ids)])
+            for bucket, status_ids in (("resolved", self.RESOLVED_STATUS_IDS), ("pending", self.PENDING_STATUS_IDS))
+        ]
+        
+    def _add_level_count(
+        self, tally: _LevelTally, level_name: str, bucket: str, count: Tuple[bool, int, Optional[str]]
+    ):
+        """Tally one ``_search_count`` result into ``bucket`` of a level."""
+        success, value, error = count
+        if success:
+            tally.add(level_name, **{bucket: value})
+        else:
+            self.logger.warning(f"Failed to get {bucket} count for level {level_name}: {error}")
+            tally.failed_levels.add(level_name)
+            
+    def _finish_level_window(
+        self, tally: _LevelTally, start_date: str, end_date: str, cache_key: str, now: datetime
+    ) -> Dict[str, Any]:
+        """Payload for a tallied window, cached unless partial."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for level_name, level_metrics in tally.levels.items():
+                self.logger.debug(
+                    "Level %s: %s total, %s resolved, %s pending",
+                    level_name, level_metrics.total, level_metrics.resolved, level_metrics.pending
+                )
+        result = self._level_result(start_date, end_date, tally.levels, tally.totals, tally.failed_levels)
+        self._cache_level_result(cache_key, result)
+        return _stamped(result, now)
+        
+    @staticmethod
+    def _level_error(error: Exception, start_date: str, end_date: str, now: datetime) -> Dict[str, Any]:
+        """Payload for a window whose level metrics failed unexpectedly."""
+        return {
+            "error": str(error),
+            "levels": {},
+            "totals": {"total": 0, "resolved": 0, "pending": 0},
+            "start_date": start_date,
+            "end_date": end_date,
+            "data_source": "error",
+            "is_mock_data": False,
+            "timestamp": now.isoformat()
+        }
+        
+    def get_metrics_by_level(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+        """Get metrics aggregated by service level with enhanced validation."""
+        now = datetime.now()
+        start_date, end_date, invalid = self._level_window(start_date, end_date, now)
+        if invalid:
+            return invalid
+        try:
             # Check cache
-            cache_key = f"metrics_by_level_{start_date}_{end_date}"
-            cached_result = self.cache_service.get_cached_data("ticket_metrics", cache_key)
+            cache_key = _make_key("metrics_by_level", start_date=start_date, end_date=end_date)
+            cached_result = self.cache_service.get_revalidated(
+                "ticket_metrics",
+                cache_key,
+                lambda stored_at: self._window_unchanged_since(start_date, end_date, stored_at)
+            )
             if cached_result:
                 self.logger.info(f"Returning cached metrics for key: {cache_key}")
-                return cached_result
+                return _stamped(cached_result, now)
                 
             self.logger.info(f"Fetching metrics by level for period: {start_date} to {end_date}")
-                
-            result = {
-                "start_date": start_date,
-                "end_date": end_date,
-                "levels": {},
-                "totals": {"total": 0, "resolved": 0, "pending": 0},
-                "data_source": "glpi",
-                "is_mock_data": False,
-                "timestamp": datetime.now().isoformat()
-            }
             
-            # Get metrics for each service level
-            for level_name, group_id in self.service_levels.items():
-                self.logger.debug(f"Processing level {level_name} (ID: {group_id})")
+            tally = _LevelTally(self._new_level_metrics())
+            base_criteria = self._level_criteria(start_date, end_date)
                 
-                level_metrics = {
-                    "total": 0,
-                    "resolved": 0, 
-                    "pending": 0,
-                    "group_id": group_id,
-                    "by_status": {}
+            # One scan per level, and the bucket counts of oversized levels as soon as
+            # their scan returns; all independent IO-bound calls, overlapped on the session pool
+            with ThreadPoolExecutor(max_workers=_LEVEL_FETCH_MAX_WORKERS) as executor:
+                scans = {
+                    executor.submit(self._scan_status_buckets, criteria): level_name
+                    for level_name, criteria in base_criteria.items()
                 }
-                
-                # Total tickets for this level
-                total_result = self.get_ticket_count(
-                    start_date=start_date,
-                    end_date=end_date,
-                    group_id=group_id,
-                    use_cache=True
-                )
-                if total_result.get("success"):
-                    level_metrics["total"] = total_result.get("count", 0)
-                else:
-                    self.logger.warning(f"Failed to get total count for level {level_name}: {total_result.get('error')}")
-                    
-                # Resolved tickets (status 5 or 6)
-                for status in ["Solucionado", "Fechado"]:
-                    resolved_result = self.get_ticket_count(
-                        start_date=start_date,
-                        end_date=end_date,
-                        group_id=group_id,
-                        status=status,
-                        use_cache=True
-                    )
-                    if resolved_result.get("success"):
-                        count = resolved_result.get("count", 0)
-                        level_metrics["resolved"] += count
-                        level_metrics["by_status"][status] = count
-                    else:
-                        level_metrics["by_status"][status] = 0
-                        
-                # Pending tickets (status 1-4)
-                for status in ["Novo", "Processando (atribuído)", "Processando (planejado)", "Pendente"]:
-                    pending_result = self.get_ticket_count(
-                        start_date=start_date,
-                        end_date=end_date,
-                        group_id=group_id,
-                        status=status,
-                        use_cache=True
-                    )
-                    if pending_result.get("success"):
-                        count = pending_result.get("count", 0)
-                        level_metrics["pending"] += count
-                        level_metrics["by_status"][status] = count
-                    else:
-                        level_metrics["by_status"][status] = 0
+                counts = {}
+                for future in as_completed(scans):
+                    level_name = scans[future]
+                    for bucket, criteria in self._add_level_scan(tally, level_name, base_criteria[level_name], future.result()):
+                        counts[executor.submit(self._search_count, criteria)] = (level_name, bucket)
                         
-                result["levels"][level_name] = level_metrics
-                
-                # Add to totals
-                result["totals"]["total"] += level_metrics["total"]
-                result["totals"]["resolved"] += level_metrics["resolved"]
-                result["totals"]["pending"] += level_metrics["pending"]
-                
-                self.logger.debug(f"Level {level_name}: {level_metrics['total']} total, {level_metrics['resolved']} resolved, {level_metrics['pending']} pending")
+                for future in as_completed(counts):
+                    self._add_level_count(tally, *counts[future], future.result())
+                    
+            return self._finish_level_window(tally, start_date, end_date, cache_key, now)
+            
+        except Exception as e:
+            self.logger.error(f"Error getting metrics by level: {e}")
+            return self._level_error(e, start_date, end_date, now)
+            
+    async def aget_metrics_by_level(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+        """Async counterpart of ``get_metrics_by_level`` for callers already in an event loop.
+        
+        The per-level scans and fallback counts run as coroutines over the HTTP
+        client's shared ``httpx.AsyncClient`` instead of a thread pool. Results share
+        the sync method's cache entries; only fresh entries are served here, since
+        revalidation probes are synchronous.
+        """
+        now = datetime.now()
+        start_date, end_date, invalid = self._level_window(start_date, end_date, now)
+        if invalid:
+            return invalid
+        try:
+            cache_key = _make_key("metrics_by_level", start_date=start_date, end_date=end_date)
+            cached_result = self.cache_service.get_cached_data("ticket_metrics", cache_key)
+            if cached_result:
+                return _stamped(cached_result, now)
                 
-            # Cache result
-            self.cache_service.set_cached_data("ticket_metrics", result, ttl=300, sub_key=cache_key)
-            self.logger.info(f"Cached metrics result with {result['totals']['total']} total tickets")
+            tally = _LevelTally(self._new_level_metrics())
+            base_criteria = self._level_criteria(start_date, end_date)
+            scans = await asyncio.gather(*map(self._ascan_status_buckets, base_criteria.values()))
             
-            return result
+            fallback = [
+                (level_name, bucket, criteria)
+                for level_name, scan in zip(base_criteria, scans)
+                for bucket, criteria in self._add_level_scan(tally, level_name, base_criteria[level_name], scan)
+            ]
+            counts = await asyncio.gather(*(self._asearch_count(criteria) for _, _, criteria in fallback))
+            for (level_name, bucket, _), count in zip(fallback, counts):
+                self._add_level_count(tally, level_name, bucket, count)
+                
+            return self._finish_level_window(tally, start_date, end_date, cache_key, now)
             
         except Exception as e:
             self.logger.error(f"Error getting metrics by level: {e}")
-            return {
-                "error": str(e), 
-                "levels": {}, 
-                "totals": {"total": 0, "resolved": 0, "pending": 0},
-                "start_date": start_date,
-                "end_date": end_date,
-                "data_source": "error",
-                "is_mock_data": False,
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._level_error(e, start_date, end_date, now)
             
     def get_technician_name(self, tech_id: str) -> str:
         """Get technician name from ID."""
-        try:
-            if not tech_id or tech_id == "0":
-                return "Não atribuído"
-                
-            # Check cache first
-            cache_key = f"tech_name_{tech_id}"
-            cached_name = self.cache_service.get_cached_data("active_technicians", cache_key)
+        if not tech_id or tech_id == "0":
+            return "Não atribuído"
+        return self.get_technician_names([tech_id]).get(str(tech_id), f"Técnico {tech_id}")
+        
+    def get_technician_names(self, tech_ids: List[str]) -> Dict[str, str]:
+        """Resolve several technician IDs to names with at most one GLPI User search.
+        
+        Cached names are served first; the remaining IDs are fetched together and
+        cached individually. IDs GLPI doesn't return map to ``"Técnico <id>"``.
+        """
+        names: Dict[str, str] = {}
+        missing: List[str] = []
+        unique_ids = list(dict.fromkeys(str(tid) for tid in tech_ids if tid and str(tid) != "0"))
+        cached_names = self.cache_service.get_cached_many(
+            "active_technicians", [f"tech_name_{tech_id}" for tech_id in unique_ids]
+        )
+        for tech_id in unique_ids:
+            cached_name = cached_names.get(f"tech_name_{tech_id}")
             if cached_name:
-                return cached_name
+                names[tech_id] = cached_name
+            else:
+                names[tech_id] = f"Técnico {tech_id}"
+                missing.append(tech_id)
                 
-            # Get from API
-            success, data, error, status_code = self.http_client.get_item("User", int(tech_id))
+        if not missing:
+            return names
             
-            if success and isinstance(data, dict):
-                # Extract name from response
-                name = data.get("name", f"Técnico {tech_id}")
-                if "firstname" in data and "realname" in data:
-                    firstname = data.get("firstname", "").strip()
-                    realname = data.get("realname", "").strip()
-                    if firstname and realname:
-                        name = f"{firstname} {realname}"
-                        
-                # Cache the name
-                self.cache_service.set_cached_data("active_technicians", name, ttl=600, sub_key=cache_key)
-                return name
-            else:
-                self.logger.warning(f"Failed to get technician name for ID {tech_id}: {error}")
-                return f"Técnico {tech_id}"
+        try:
+            params = {
+                "range": f"0-{len(missing) - 1}",
+                "forcedisplay[0]": "2",   # ID
+                "forcedisplay[1]": "1",   # Login
+                "forcedisplay[2]": "9",   # First name
+                "forcedisplay[3]": "34",  # Real name
+            }
+            for index, tech_id in enumerate(missing):
+                if index:
+                    params[f"criteria[{index}][link]"] = "OR"
+                params[f"criteria[{index}][field]"] = "2"
+                params[f"criteria[{index}][searchtype]"] = "equals"
+                params[f"criteria[{index}][value]"] = tech_id
+                
+            success, data, error, status_code = self.http_client.search("User", params)
+            if not success or not isinstance(data, dict):
+                self.logger.warning(f"Failed to get technician names for {len(missing)} IDs: {error}")
+                return names
+                
+            for row in data.get("data") or []:
+                tech_id = str(row.get("2", ""))
+                if tech_id not in names:
+                    continue
+                firstname = (row.get("9") or "").strip()
+                realname = (row.get("34") or "").strip()
+                name = f"{firstname} {realname}" if firstname and realname else row.get("1") or names[tech_id]
+                names[tech_id] = name
+                self.cache_service.set_cached_data("active_technicians", name, ttl=600, sub_key=f"tech_name_{tech_id}")
                 
         except Exception as e:
-            self.logger.error(f"Error getting technician name for {tech_id}: {e}")
-            return f"Técnico {tech_id}"
\ No newline at end of file
+            self.logger.error(f"Error getting technician names for {missing}: {e}")
+            
+        return names
@@ -5,7 +5,8 @@ GLPI Trends Service - Handles trend analysis and historical comparisons.
 Extracted from monolithic GLPIService for better separation of concerns.
 """
 import logging
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from typing import Dict, List, Optional, Any
 
 from utils.date_validator import DateValidator
@@ -13,6 +14,15 @@ from .http_client_service import GLPIHttpClientService
 from .cache_service import GLPICacheService
 from .metrics_service import GLPIMetricsService
 
+# Each interval fans out its own per-level searches; 4 intervals x 4 levels
+# keeps the total in line with the HTTP client's 16-connection pool
+_HISTORY_MAX_WORKERS = 4
+
+# Change direction by sign of the percentage change
+_DIRECTIONS = {1: "up", -1: "down", 0: "stable"}
+_NO_CHANGE = {"absolute": 0, "percentage": 0.0, "direction": "stable", "formatted": "0%"}
+_CHANGE_FROM_ZERO = {"absolute": 0, "percentage": 100.0, "direction": "up", "formatted": "+100%"}
+
 
 class GLPITrendsService:
     """Handles trend analysis and historical data comparisons."""
@@ -49,23 +59,20 @@ class GLPITrendsService:
             if cached_result:
                 return cached_result
                 
-            # Calculate previous period dates
-            current_start_dt = datetime.strptime(current_start, '%Y-%m-%d')
-            current_end_dt = datetime.strptime(current_end, '%Y-%m-%d')
-            
-            period_length = (current_end_dt - current_start_dt).days
-            
-            previous_end_dt = current_start_dt - timedelta(days=1)
-            previous_start_dt = previous_end_dt - timedelta(days=period_length)
+            # Calculate previous period dates on day ordinals
+            current_start_ord = date.fromisoformat(current_start).toordinal()
+            period_length = date.fromisoformat(current_end).toordinal() - current_start_ord
             
-            previous_start = previous_start_dt.strftime('%Y-%m-%d')
-            previous_end = previous_end_dt.strftime('%Y-%m-%d')
+            previous_end_ord = current_start_ord - 1
+            previous_start = date.fromordinal(previous_end_ord - period_length).isoformat()
+            previous_end = date.fromordinal(previous_end_ord).isoformat()
             
             self.logger.info(f"Calculating trends: Current({current_start} to {current_end}) vs Previous({previous_start} to {previous_end})")
             
-            # Get current period metrics
-            current_metrics = self.metrics_service.get_metrics_by_level(current_start, current_end)
-            previous_metrics = self.metrics_service.get_metrics_by_level(previous_start, previous_end)
+            # The periods are back to back, so both come from one scan per level
+            previous_metrics, current_metrics = self.metrics_service.get_adjacent_period_metrics(
+                previous_start, current_start, current_end
+            )
             
             if current_metrics.get("error") or previous_metrics.get("error"):
                 return {"error": "Failed to get metrics for trend calculation"}
@@ -126,7 +133,9 @@ class GLPITrendsService:
                 }
                 
             # Cache results
-            self.cache_service.set_cached_data("dashboard_metrics", trends, ttl=300, sub_key=cache_key)
+            self.cache_service.set_cached_data(
+                "dashboard_metrics", trends, ttl=self.cache_service.ttl_for_window(current_end), sub_key=cache_key
+            )
             
             return trends
             
@@ -135,60 +144,38 @@ class GLPITrendsService:
             return {"error": str(e)}
             
     def _calculate_percentage_change(self, current: int, previous: int) -> Dict[str, Any]:
-        """Calculate percentage change between two values."""
-        try:
-            if previous == 0:
-                if current == 0:
-                    return {
-                        "absolute": 0,
-                        "percentage": 0.0,
-                        "direction": "stable",
-                        "formatted": "0%"
-                    }
-                else:
-                    return {
-                        "absolute": current,
-                        "percentage": 100.0,
-                        "direction": "up",
-                        "formatted": "+100%"
-                    }
-                    
-            absolute_change = current - previous
-            percentage_change = (absolute_change / previous) * 100
-            
-            if percentage_change > 0:
-                direction = "up"
-                formatted = f"+{percentage_change:.1f}%"
-            elif percentage_change < 0:
-                direction = "down"
-                formatted = f"{percentage_change:.1f}%"
-            else:
-                direction = "stable"
-                formatted = "0%"
-                
-            return {
-                "absolute": absolute_change,
-                "percentage": round(percentage_change, 1),
-                "direction": direction,
-                "formatted": formatted
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating percentage change: {e}")
-            return {
-                "absolute": 0,
-                "percentage": 0.0,
-                "direction": "unknown",
-                "formatted": "N/A"
-            }
+        """Calculate percentage change between two values.
+        
+        Growth from a zero baseline is reported as +100%; inputs are the integer
+        counts of metrics payloads.
+        """
+        if not previous:
+            if not current:
+                return dict(_NO_CHANGE)
+            return {**_CHANGE_FROM_ZERO, "absolute": current}
             
+        absolute_change = current - previous
+        percentage_change = absolute_change / previous * 100
+        sign = (percentage_change > 0) - (percentage_change < 0)
+        return {
+            "absolute": absolute_change,
+            "percentage": round(percentage_change, 1),
+            "direction": _DIRECTIONS[sign],
+            "formatted": f"{percentage_change:+.1f}%" if sign else "0%"
+        }
+        
     def get_historical_data(
         self, 
         start_date: str, 
         end_date: str, 
-        interval_days: int = 7
+        interval_days: int = 7,
+        summary_only: bool = False
     ) -> Dict[str, Any]:
-        """Get historical data broken down by intervals."""
+        """Get historical data broken down by intervals.
+        
+        With ``summary_only`` the per-interval data points are left out (an empty
+        list) and only the summary is computed.
+        """
         try:
             # Validate inputs
             if not DateValidator.is_valid_date(start_date):
@@ -196,14 +183,16 @@ class GLPITrendsService:
             if not DateValidator.is_valid_date(end_date):
                 return {"error": "Invalid end_date"}
                 
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            start_ord = date.fromisoformat(start_date).toordinal()
+            end_ord = date.fromisoformat(end_date).toordinal()
             
-            if start_dt >= end_dt:
+            if start_ord >= end_ord:
                 return {"error": "start_date must be before end_date"}
+            if interval_days < 1:
+                return {"error": "interval_days must be positive"}
                 
             # Check cache
-            cache_key = f"historical_{start_date}_{end_date}_{interval_days}"
+            cache_key = f"historical_{start_date}_{end_date}_{interval_days}" + ("_summary" if summary_only else "")
             cached_result = self.cache_service.get_cached_data("dashboard_metrics", cache_key)
             if cached_result:
                 return cached_result
@@ -219,48 +208,49 @@ class GLPITrendsService:
                 }
             }
             
-            # Generate data points for each interval
-            current_start = start_dt
-            total_tickets = 0
+            # Generate the interval bounds first, then fetch them concurrently
+            intervals = [
+                (
+                    date.fromordinal(interval_start).isoformat(),
+                    date.fromordinal(min(interval_start + interval_days, end_ord)).isoformat()
+                )
+                for interval_start in range(start_ord, end_ord, interval_days)
+            ]
             
-            while current_start < end_dt:
-                current_end = min(current_start + timedelta(days=interval_days), end_dt)
-                
-                interval_start_str = current_start.strftime('%Y-%m-%d')
-                interval_end_str = current_end.strftime('%Y-%m-%d')
-                
-                # Get metrics for this interval
-                interval_metrics = self.metrics_service.get_metrics_by_level(
-                    interval_start_str, 
-                    interval_end_str
+            # executor.map keeps interval order, so data points stay chronological;
+            # results are folded into the summary as they are consumed
+            total_tickets = 0
+            interval_count = 0
+            data_points = historical_data["data_points"]
+            with ThreadPoolExecutor(max_workers=min(_HISTORY_MAX_WORKERS, len(intervals))) as executor:
+                interval_results = executor.map(
+                    lambda bounds: self.metrics_service.get_metrics_by_level(*bounds), intervals
                 )
-                
-                if not interval_metrics.get("error"):
+                for (interval_start_str, interval_end_str), interval_metrics in zip(intervals, interval_results):
+                    if interval_metrics.get("error"):
+                        continue
                     interval_totals = interval_metrics.get("totals", {})
-                    interval_total = interval_totals.get("total", 0)
-                    total_tickets += interval_total
+                    total_tickets += interval_totals.get("total", 0)
+                    interval_count += 1
                     
-                    historical_data["data_points"].append({
-                        "start_date": interval_start_str,
-                        "end_date": interval_end_str,
-                        "metrics": interval_totals,
-                        "levels": interval_metrics.get("levels", {})
-                    })
-                    
-                current_start = current_end
-                
+                    if not summary_only:
+                        data_points.append({
+                            "start_date": interval_start_str,
+                            "end_date": interval_end_str,
+                            "metrics": interval_totals,
+                            "levels": interval_metrics.get("levels", {})
+                        })
+                        
             # Calculate summary
-            historical_data["summary"]["total_intervals"] = len(historical_data["data_points"])
-            if historical_data["summary"]["total_intervals"] > 0:
-                historical_data["summary"]["avg_tickets_per_interval"] = (
-                    total_tickets / historical_data["summary"]["total_intervals"]
-                )
+            historical_data["summary"]["total_intervals"] = interval_count
+            if interval_count:
+                historical_data["summary"]["avg_tickets_per_interval"] = total_tickets / interval_count
                 
             # Cache results
             self.cache_service.set_cached_data(
                 "dashboard_metrics", 
                 historical_data, 
-                ttl=600, 
+                ttl=self.cache_service.ttl_for_window(end_date), 
                 sub_key=cache_key
             )
             
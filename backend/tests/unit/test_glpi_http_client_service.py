@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o GLPIHttpClientService legado."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import requests
+
+# Os serviços legados importam módulos relativos a backend/ (ex.: utils, config)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("USE_MOCK_DATA", "false")
+
+from services.legacy.authentication_service import GLPIAuthenticationService  # noqa: E402
+from services.legacy.http_client_service import GLPIHttpClientService  # noqa: E402
+
+
+class TestHttpClientSession:
+    """Testes para reuso de sessão e montagem de URL."""
+
+    def test_requests_go_through_pooled_session_to_apirest(self):
+        """Testa que as requisições usam a Session do cliente e a URL inclui apirest.php."""
+        auth_service = GLPIAuthenticationService()
+        auth_service.get_api_headers = MagicMock(return_value={"Session-Token": "token"})
+        client = GLPIHttpClientService(auth_service)
+
+        assert isinstance(client.session, requests.Session)
+
+        response = MagicMock(status_code=200, content=b'{"data": []}', headers={})
+        client.session.send = MagicMock(return_value=response)
+
+        success, data, error, status_code = client.get("search/Ticket", params={"range": "0-0"})
+
+        assert success is True
+        assert data == {"data": []}
+        prepared = client.session.send.call_args.args[0]
+        assert "apirest.php/search/Ticket" in prepared.url
+
+    def test_search_encodes_nested_criteria_as_glpi_query_keys(self):
+        """Testa que critérios aninhados viram chaves criteria[i][campo] na URL."""
+        auth_service = GLPIAuthenticationService()
+        auth_service.get_api_headers = MagicMock(return_value={"Session-Token": "token"})
+        client = GLPIHttpClientService(auth_service)
+        response = MagicMock(status_code=200, content=b'{"totalcount": 0}', headers={})
+        client.session.send = MagicMock(return_value=response)
+
+        client.search("Ticket", {
+            "criteria": [{"field": "8", "searchtype": "equals", "value": "89"}],
+            "forcedisplay": ["12"],
+        })
+
+        url = requests.utils.unquote(client.session.send.call_args.args[0].url)
+        assert "criteria[0][field]=8" in url
+        assert "criteria[0][value]=89" in url
+        assert "forcedisplay[0]=12" in url
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so the async client pools the connection between calls
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"totalcount": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ReauthHandler(BaseHTTPRequestHandler):
+    """Responde 401 na primeira requisição e 200 nas seguintes, registrando a porta do cliente."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        status = 401 if len(self.client_ports) == 1 else 200
+        body = b'["ERROR_SESSION_TOKEN_INVALID", "Sess\xc3\xa3o inv\xc3\xa1lida"]' if status == 401 else b'{"totalcount": 1}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionReuse:
+    """Testes para o reuso de conexões do pool em retentativas."""
+
+    def test_reauth_retry_reuses_the_pooled_connection(self):
+        """Testa que o corpo do 401 é drenado e a retentativa usa a mesma conexão."""
+        _ReauthHandler.client_ports = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _ReauthHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            auth_service = GLPIAuthenticationService()
+            auth_service.glpi_url = f"http://127.0.0.1:{server.server_address[1]}"
+            auth_service.get_api_headers = MagicMock(return_value={"Session-Token": "token"})
+            auth_service.authenticate = MagicMock(return_value=True)
+            client = GLPIHttpClientService(auth_service)
+
+            result = client.get("search/Ticket", params={"range": "0-0"})
+
+            assert result == (True, {"totalcount": 1}, None, 200)
+            assert len(_ReauthHandler.client_ports) == 2
+            assert len(set(_ReauthHandler.client_ports)) == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class _ReauthThenClientErrorHandler(BaseHTTPRequestHandler):
+    """Responde 401 na primeira requisição e 400 com corpo grande nas seguintes."""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = 0
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        status = 401 if self.requests_seen == 1 else 400
+        body = b"x" * 4096
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncHttpClient:
+    """Testes para o caminho assíncrono do cliente HTTP."""
+
+    def test_async_requests_work_across_event_loops(self):
+        """Testa que chamadas em asyncio.run consecutivos não reaproveitam um cliente de loop fechado."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            auth_service = GLPIAuthenticationService()
+            auth_service.glpi_url = f"http://127.0.0.1:{server.server_address[1]}"
+            auth_service.get_api_headers = MagicMock(return_value={"Session-Token": "token"})
+            client = GLPIHttpClientService(auth_service)
+
+            first = asyncio.run(client.asearch("Ticket", {"range": "0-0"}))
+            second = asyncio.run(client.asearch("Ticket", {"range": "0-0"}))
+
+            assert first == (True, {"totalcount": 1}, None, 200)
+            assert second == (True, {"totalcount": 1}, None, 200)
+            assert client._limiter._in_flight == 0
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestAuthenticationRefresh:
+    """Testes para a renovação de sessão concorrente."""
+
+    def test_concurrent_reauth_with_same_stale_token_logs_in_once(self):
+        """Testa que threads que viram o mesmo token inválido abrem uma única sessão nova."""
+        auth_service = GLPIAuthenticationService()
+        auth_service.session_token = "expirado"
+        auth_service.token_created_at = datetime.now()
+        logins = []
+
+        def perform_authentication():
+            time.sleep(0.05)  # Mantém as outras threads esperando pelo lock
+            logins.append(1)
+            auth_service.session_token = f"novo-{len(logins)}"
+            auth_service.token_created_at = datetime.now()
+            return True
+
+        auth_service._perform_authentication = perform_authentication
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(auth_service.authenticate(stale_token="expirado")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 8
+        assert len(logins) == 1
+        assert auth_service.session_token == "novo-1"
+
+    def test_async_path_shares_status_handling_with_sync(self):
+        """Testa que o caminho assíncrono reautentica fora do loop e limita o corpo do erro."""
+        _ReauthThenClientErrorHandler.requests_seen = 0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _ReauthThenClientErrorHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            auth_service = GLPIAuthenticationService()
+            auth_service.glpi_url = f"http://127.0.0.1:{server.server_address[1]}"
+            auth_service.get_api_headers = MagicMock(return_value={"Session-Token": "token"})
+            login_threads = []
+            auth_service.authenticate = lambda stale_token=None: login_threads.append(threading.current_thread()) or True
+            client = GLPIHttpClientService(auth_service)
+
+            success, data, error, status_code = asyncio.run(client.asearch("Ticket", {"range": "0-0"}))
+
+            assert (success, status_code) == (False, 400)
+            assert error == "Client error 400: " + "x" * 512
+            assert login_threads and threading.main_thread() not in login_threads
+        finally:
+            server.shutdown()
+            server.server_close()
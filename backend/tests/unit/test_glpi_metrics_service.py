@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o GLPIMetricsService legado."""
+
+import asyncio
+import os
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Os serviços legados importam módulos relativos a backend/ (ex.: utils, config)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("USE_MOCK_DATA", "false")
+
+from services.legacy.cache_service import GLPICacheService  # noqa: E402
+from services.legacy.metrics_service import GLPIMetricsService  # noqa: E402
+
+
+@pytest.fixture
+def metrics_service():
+    """Serviço de métricas com HTTP client, cache e descoberta de campos mockados."""
+    field_service = MagicMock()
+    field_service.get_field_id.return_value = None
+    cache_service = MagicMock()
+    cache_service.get_cached_data.return_value = None
+    cache_service.get_revalidated.return_value = None
+    cache_service.get_cached_many.return_value = {}
+    return GLPIMetricsService(MagicMock(), cache_service, field_service)
+
+
+class TestLevelMetrics:
+    """Testes para _get_level_metrics."""
+
+    def test_tallies_statuses_from_single_search(self, metrics_service):
+        """Testa que uma única busca retorna todos os contadores por status."""
+        rows = [{"12": 1}, {"12": 2}, {"12": "5"}, {"12": 6}, {"12": 6}]
+        metrics_service.http_client.search.return_value = (
+            True, {"totalcount": len(rows), "data": rows}, None, 200
+        )
+
+        result = metrics_service._get_level_metrics("89", "2024-01-01", "2024-01-31")
+
+        assert metrics_service.http_client.search.call_count == 1
+        assert result["total"] == 5
+        assert result["by_status"] == {"1": 1, "2": 1, "3": 0, "4": 0, "5": 1, "6": 2}
+        assert result["data_quality"]["consistency_check"] is True
+
+    def test_returns_error_payload_when_search_fails(self, metrics_service):
+        """Testa que a tupla de erro do HTTP client é tratada sem exceção."""
+        metrics_service.http_client.search.return_value = (False, None, "timeout", 408)
+
+        result = metrics_service._get_level_metrics("89")
+
+        assert result["total"] == 0
+        assert result["error"] == "Failed to fetch data: timeout"
+
+
+class TestMetricsByLevel:
+    """Testes para get_metrics_by_level."""
+
+    def test_resolved_and_pending_use_one_search_each(self, metrics_service):
+        """Testa que resolvidos e pendentes são contados com um subgrupo OR de status."""
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 5000}, None, 200)
+
+        result = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+
+        assert metrics_service.http_client.search.call_count == 3 * len(metrics_service.service_levels)
+        assert all(call.args[1]["range"] == "0-0" for call in metrics_service.http_client.search.call_args_list)
+        assert result["levels"]["N1"] == {"total": 5000, "resolved": 5000, "pending": 5000, "group_id": 89}
+        status_groups = [
+            criterion["criteria"]
+            for call in metrics_service.http_client.search.call_args_list
+            for criterion in call.args[1]["criteria"]
+            if "criteria" in criterion
+        ]
+        assert {tuple(c["value"] for c in group) for group in status_groups} == {("5", "6"), ("1", "2", "3", "4")}
+
+    def test_small_windows_are_tallied_from_one_scan_per_level(self, metrics_service):
+        """Testa que janelas que cabem em uma página usam a contagem e uma única varredura por nível."""
+        rows = [{"12": 1}, {"12": 4}, {"12": 5}, {"12": 6}, {"12": 6}]
+        metrics_service.http_client.search.return_value = (
+            True, {"totalcount": len(rows), "data": rows}, None, 200
+        )
+
+        result = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+
+        assert metrics_service.http_client.search.call_count == 2 * len(metrics_service.service_levels)
+        assert result["levels"]["N2"] == {"total": 5, "resolved": 3, "pending": 2, "group_id": 90}
+        assert result["totals"] == {"total": 20, "resolved": 12, "pending": 8}
+
+    def test_expired_result_is_revalidated_with_one_probe(self, metrics_service):
+        """Testa que um resultado expirado sem tickets modificados é reaproveitado."""
+        metrics_service.cache_service = GLPICacheService()
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 4}, None, 200)
+        first = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+        for entry in metrics_service.cache_service._cache["ticket_metrics"]["data"].values():
+            entry["timestamp"] -= entry["ttl"]
+        metrics_service.http_client.search.reset_mock()
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 0}, None, 200)
+
+        second = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+
+        assert metrics_service.http_client.search.call_count == 1
+        assert second["totals"] == first["totals"]
+
+    def test_async_variant_matches_sync_result(self, metrics_service):
+        """Testa que a variante assíncrona usa asearch e produz o mesmo resultado."""
+        rows = [{"12": 1}, {"12": 4}, {"12": 5}, {"12": 6}, {"12": 6}]
+        response = (True, {"totalcount": len(rows), "data": rows}, None, 200)
+        metrics_service.http_client.search.return_value = response
+        metrics_service.http_client.asearch = AsyncMock(return_value=response)
+
+        expected = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+        result = asyncio.run(metrics_service.aget_metrics_by_level("2024-01-01", "2024-01-31"))
+
+        assert metrics_service.http_client.asearch.await_count == 2 * len(metrics_service.service_levels)
+        assert result["levels"] == expected["levels"]
+        assert result["totals"] == expected["totals"]
+
+    def test_failed_level_marks_result_partial_and_skips_cache(self, metrics_service):
+        """Testa que falha em um nível marca o resultado como parcial e não o grava no cache."""
+        metrics_service.cache_service = GLPICacheService()
+        rows = [{"12": 1}, {"12": 5}]
+
+        def search(itemtype, params):
+            group_values = [c.get("value") for c in params["criteria"]]
+            if "89" in group_values:
+                return False, None, "Request timeout", 408
+            return True, {"totalcount": len(rows), "data": rows}, None, 200
+
+        metrics_service.http_client.search.side_effect = search
+
+        result = metrics_service.get_metrics_by_level("2024-01-01", "2024-01-31")
+
+        assert result["partial"] is True
+        assert result["failed_levels"] == ["N1"]
+        assert result["levels"]["N2"]["total"] == 2
+        assert not metrics_service.cache_service._cache["ticket_metrics"]["data"]
+
+
+class TestTechnicianNames:
+    """Testes para get_technician_names."""
+
+    def test_resolves_missing_ids_with_one_user_search(self, metrics_service):
+        """Testa que IDs fora do cache são resolvidos em uma única busca de usuários."""
+        rows = [
+            {"2": 7, "1": "jsilva", "9": "João", "34": "Silva"},
+            {"2": 8, "1": "msouza", "9": None, "34": None},
+        ]
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 2, "data": rows}, None, 200)
+
+        names = metrics_service.get_technician_names(["7", "8", "9", "7", "0"])
+
+        assert metrics_service.http_client.search.call_count == 1
+        assert names == {"7": "João Silva", "8": "msouza", "9": "Técnico 9"}
+        assert metrics_service.cache_service.set_cached_data.call_count == 2
+
+    def test_cached_names_are_read_in_one_batch(self, metrics_service):
+        """Testa que nomes em cache são lidos em lote, sem busca no GLPI."""
+        metrics_service.cache_service = GLPICacheService()
+        metrics_service.cache_service.set_cached_data("active_technicians", "Ana Lima", ttl=600, sub_key="tech_name_7")
+        metrics_service.cache_service.set_cached_data("active_technicians", "Rui Costa", ttl=600, sub_key="tech_name_8")
+
+        names = metrics_service.get_technician_names(["7", "8"])
+
+        metrics_service.http_client.search.assert_not_called()
+        assert names == {"7": "Ana Lima", "8": "Rui Costa"}
+
+
+class TestMultiStatusCount:
+    """Testes para get_ticket_count_multi_status."""
+
+    def test_counts_status_names_and_ids_in_one_search(self, metrics_service):
+        """Testa que nomes e IDs de status viram um único subgrupo OR."""
+        metrics_service._tickets_version = lambda: "v1"
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 9}, None, 200)
+
+        result = metrics_service.get_ticket_count_multi_status(
+            "2024-01-01", "2024-01-31", statuses=["Solucionado", 6], group_id=89
+        )
+
+        assert result["success"] is True
+        assert result["count"] == 9
+        assert result["status_ids"] == [5, 6]
+        assert metrics_service.http_client.search.call_count == 1
+        criteria = metrics_service.http_client.search.call_args.args[1]["criteria"]
+        assert [c["value"] for c in criteria[-1]["criteria"]] == ["5", "6"]
+
+    def test_closed_window_key_does_not_depend_on_ticket_version(self, metrics_service):
+        """Testa que janelas fechadas não embutem a versão global e são revalidadas por janela."""
+        metrics_service._tickets_version = MagicMock(return_value="v1")
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 3}, None, 200)
+
+        metrics_service.get_ticket_count_multi_status("2024-01-01", "2024-01-31", statuses=["Novo"])
+
+        metrics_service._tickets_version.assert_not_called()
+        metrics_service.cache_service.get_revalidated.assert_called_once()
+
+    def test_invalid_dates_never_poll_the_ticket_version(self, metrics_service):
+        """Testa que datas inválidas são rejeitadas sem consultar o GLPI."""
+        result = metrics_service.get_ticket_count("2024-13-45", "ontem")
+
+        assert result["success"] is False
+        metrics_service.http_client.search.assert_not_called()
+
+    def test_version_refresh_does_not_block_other_callers(self, metrics_service):
+        """Testa que, durante a consulta da versão, os demais recebem o token anterior sem esperar."""
+        metrics_service._tickets_version_token = "antigo"
+        polling = threading.Event()
+        release = threading.Event()
+
+        def slow_search(itemtype, params):
+            polling.set()
+            release.wait(5)
+            return True, {"totalcount": 2, "data": [{"19": "2024-02-01 10:00:00"}]}, None, 200
+
+        metrics_service.http_client.search.side_effect = slow_search
+        poller = threading.Thread(target=metrics_service._tickets_version)
+        poller.start()
+        try:
+            assert polling.wait(5)
+            assert metrics_service._tickets_version() == "antigo"
+        finally:
+            release.set()
+            poller.join()
+
+        assert metrics_service._tickets_version() == "2024-02-01 10:00:00|2"
+        assert metrics_service.http_client.search.call_count == 1
+
+    def test_rejects_unknown_status(self, metrics_service):
+        """Testa que status desconhecido retorna erro sem consultar o GLPI."""
+        result = metrics_service.get_ticket_count_multi_status("2024-01-01", "2024-01-31", statuses=["Arquivado"])
+
+        assert result["success"] is False
+        metrics_service.http_client.search.assert_not_called()
+
+
+class TestAdjacentPeriodMetrics:
+    """Testes para get_adjacent_period_metrics."""
+
+    def test_both_periods_come_from_one_scan_per_level(self, metrics_service):
+        """Testa que os dois períodos são separados pela data de abertura de uma única busca."""
+        rows = [
+            {"12": 1, "15": "2024-01-20 10:00:00"},
+            {"12": 6, "15": "2024-01-31 23:00:00"},
+            {"12": 5, "15": "2024-02-01 08:00:00"},
+            {"12": 2, "15": "2024-02-10 09:30:00"},
+            {"12": 6, "15": "2024-02-29 17:45:00"},
+        ]
+        metrics_service.http_client.search.return_value = (
+            True, {"totalcount": len(rows), "data": rows}, None, 200
+        )
+
+        previous, current = metrics_service.get_adjacent_period_metrics("2024-01-03", "2024-02-01", "2024-02-29")
+
+        assert metrics_service.http_client.search.call_count == 2 * len(metrics_service.service_levels)
+        assert previous["end_date"] == "2024-01-31"
+        assert previous["levels"]["N1"] == {"total": 2, "resolved": 1, "pending": 1, "group_id": 89}
+        assert current["levels"]["N1"] == {"total": 3, "resolved": 2, "pending": 1, "group_id": 89}
+        assert current["totals"] == {"total": 12, "resolved": 8, "pending": 4}
+
+    def test_oversized_level_is_counted_per_window_without_rescanning_others(self, metrics_service):
+        """Testa que só o nível grande demais vai para contagens por janela; os demais mantêm a varredura."""
+        rows = [{"12": 1, "15": "2024-01-20 10:00:00"}, {"12": 6, "15": "2024-02-10 09:30:00"}]
+
+        def search(itemtype, params):
+            if "89" in [c.get("value") for c in params["criteria"]]:
+                assert params["range"] == "0-0"
+                return True, {"totalcount": 2000}, None, 200
+            return True, {"totalcount": len(rows), "data": rows}, None, 200
+
+        metrics_service.http_client.search.side_effect = search
+
+        previous, current = metrics_service.get_adjacent_period_metrics("2024-01-03", "2024-02-01", "2024-02-29")
+
+        # 1 sonda por nível, 1 varredura por nível pequeno, 3 contagens por janela no nível grande
+        levels = len(metrics_service.service_levels)
+        assert metrics_service.http_client.search.call_count == levels + (levels - 1) + 2 * 3
+        assert previous["levels"]["N1"] == {"total": 2000, "resolved": 2000, "pending": 2000, "group_id": 89}
+        assert previous["levels"]["N2"] == {"total": 1, "resolved": 0, "pending": 1, "group_id": 90}
+        assert current["levels"]["N2"] == {"total": 1, "resolved": 1, "pending": 0, "group_id": 90}
+        assert "partial" not in previous and "partial" not in current
+
+    def test_cached_periods_skip_glpi(self, metrics_service):
+        """Testa que, com os dois períodos em cache, nenhuma busca é feita."""
+        metrics_service.cache_service = GLPICacheService()
+        metrics_service.http_client.search.return_value = (True, {"totalcount": 0, "data": []}, None, 200)
+        metrics_service.get_metrics_by_level("2024-01-03", "2024-01-31")
+        metrics_service.get_metrics_by_level("2024-02-01", "2024-02-29")
+        metrics_service.http_client.search.reset_mock()
+
+        previous, current = metrics_service.get_adjacent_period_metrics("2024-01-03", "2024-02-01", "2024-02-29")
+
+        metrics_service.http_client.search.assert_not_called()
+        assert (previous["start_date"], current["end_date"]) == ("2024-01-03", "2024-02-29")
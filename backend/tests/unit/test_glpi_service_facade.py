@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o GLPIServiceFacade legado."""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Os serviços legados importam módulos relativos a backend/ (ex.: utils, config)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("USE_MOCK_DATA", "false")
+
+from services.legacy.glpi_service_facade import GLPIServiceFacade  # noqa: E402
+
+
+@pytest.fixture
+def facade():
+    """Facade com descoberta de campos desativada e HTTP client mockado."""
+    with patch.object(GLPIServiceFacade, "discover_field_ids", return_value=True):
+        instance = GLPIServiceFacade()
+    instance.http_client = MagicMock()
+    instance._get_technician_name = lambda tech_id: f"Técnico {tech_id}"
+    instance._get_technician_names = lambda tech_ids: {tech_id: f"Técnico {tech_id}" for tech_id in tech_ids}
+    return instance
+
+
+class TestTechnicianPerformance:
+    """Testes para get_technician_performance."""
+
+    def test_returns_success_with_mocked_http_client(self, facade):
+        """Testa que o caminho principal é exercitado e agrega por técnico."""
+        tickets = [
+            {"2": 1, "12": "5", "5": "7", "3": "4"},
+            {"2": 2, "12": "6", "5": ["7", "8"], "3": "2"},
+            {"2": 3, "12": "6", "5": None, "3": "3"},
+        ]
+        facade.http_client._make_authenticated_request.return_value = (True, {"data": tickets}, None, 200)
+
+        result = facade.get_technician_performance()
+
+        assert result["success"] is True
+        assert result["source"] == "api"
+        by_id = {tech["id"]: tech for tech in result["data"]}
+        assert by_id["7"]["total_tickets"] == 2
+        assert by_id["7"]["high_priority_tickets"] == 1
+        assert by_id["8"]["resolved_tickets"] == 1
+        assert result["data"][0]["id"] == "7"
+
+    def test_returns_empty_success_when_no_ticket_has_a_technician(self, facade):
+        """Testa que tickets sem técnico não são confundidos com falha na busca."""
+        tickets = [{"2": 1, "12": "5", "5": None, "3": "4"}]
+        facade.http_client._make_authenticated_request.return_value = (True, {"data": tickets}, None, 200)
+
+        result = facade.get_technician_performance()
+
+        assert result["success"] is True
+        assert result["data"] == []
+
+    def test_returns_error_payload_when_search_fails(self, facade):
+        """Testa que falha na paginação não gera NameError."""
+        facade.http_client._make_authenticated_request.return_value = (False, None, "timeout", 408)
+
+        result = facade.get_technician_performance()
+
+        assert result["success"] is False
+        assert result["error"] == "Falha ao obter dados dos tickets"
+
+
+class TestServerFilteredMetrics:
+    """Testes para get_dashboard_metrics_with_filters com filtros no GLPI."""
+
+    def test_counts_are_exact_beyond_one_page_and_match_fallback_schema(self, facade):
+        """Testa que as contagens vêm de totalcount e o payload tem o formato do fallback."""
+        def search(itemtype, params):
+            status_values = [
+                c["value"]
+                for criterion in params["criteria"]
+                for c in criterion.get("criteria", [criterion])
+                if c.get("field") == "12"
+            ]
+            return True, {"totalcount": 1500 * len(status_values)}, None, 200
+
+        facade.http_client.search.side_effect = search
+
+        result = facade.get_dashboard_metrics_with_filters("2024-01-01", "2024-01-31", priority="Alta", level="n1")
+
+        assert set(result) >= {"start_date", "end_date", "timestamp", "totals", "by_level", "by_status", "performance", "success"}
+        assert result["totals"]["total_tickets"] == 9000
+        assert result["totals"]["resolved_tickets"] == 3000
+        assert result["totals"]["pending_tickets"] == 6000
+        assert result["by_level"] == {"N1": {"total": 9000, "resolved": 3000, "pending": 6000, "group_id": 89}}
+        assert result["performance"]["resolution_rate"] == pytest.approx(100 / 3)
+        assert all(call.args[1]["range"] == "0-0" for call in facade.http_client.search.call_args_list)
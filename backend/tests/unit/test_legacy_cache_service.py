@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Testes unitários para o GLPICacheService legado."""
+
+import os
+import sys
+from unittest.mock import patch
+
+# Os serviços legados importam módulos relativos a backend/ (ex.: utils, config)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("USE_MOCK_DATA", "false")
+
+from services.legacy.cache_service import _SUB_KEY_SWEEP_THRESHOLD, GLPICacheService  # noqa: E402
+
+
+class TestSubKeySweep:
+    """Testes para a limpeza periódica de sub-chaves expiradas."""
+
+    def test_sweep_runs_once_per_threshold_writes_even_at_threshold_size(self):
+        """Testa que um mapa estável no limiar não é varrido a cada escrita."""
+        cache = GLPICacheService()
+        for i in range(_SUB_KEY_SWEEP_THRESHOLD - 1):
+            cache._set_cache_data("metrics", i, sub_key=f"k{i}")
+
+        with patch.object(GLPICacheService, "_sweep_expired") as sweep:
+            # O mapa fica com exatamente o limiar de entradas vivas e recebe sobrescritas
+            for _ in range(_SUB_KEY_SWEEP_THRESHOLD):
+                cache._set_cache_data("metrics", 0, sub_key="last")
+
+        assert sweep.call_count == 1
+
+    def test_sweep_drops_expired_entries(self):
+        """Testa que a varredura remove entradas expiradas e mantém as vivas."""
+        cache = GLPICacheService()
+        cache._set_cache_data("metrics", "old", ttl=1, sub_key="old")
+        cache._cache["metrics"]["data"]["old"]["timestamp"] -= 10
+        for i in range(_SUB_KEY_SWEEP_THRESHOLD - 1):
+            cache._set_cache_data("metrics", i, sub_key=f"k{i}")
+
+        entries = cache._cache["metrics"]["data"]
+        assert "old" not in entries
+        assert len(entries) == _SUB_KEY_SWEEP_THRESHOLD - 1
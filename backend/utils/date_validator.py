@@ -6,11 +6,22 @@ usados em toda a aplicação, eliminando duplicação de código.
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _parses_as_date(date_str: str, date_format: str) -> bool:
+    """Memoiza a validação: os mesmos intervalos se repetem a cada requisição."""
+    try:
+        datetime.strptime(date_str, date_format)
+        return True
+    except ValueError:
+        return False
+
+
 class DateValidationError(Exception):
     """Exceção customizada para erros de validação de data."""
 
@@ -32,14 +43,10 @@ class DateValidator:
         Returns:
             bool: True se válida, False caso contrário
         """
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return False
 
-        try:
-            datetime.strptime(date_str, cls.DATE_FORMAT)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return _parses_as_date(date_str, cls.DATE_FORMAT)
 
     @classmethod
     def is_valid_date(cls, date_str: str) -> bool:
@@ -1,3 +1,4 @@
+import heapq
 import time
 import logging
 from functools import wraps
@@ -10,110 +11,154 @@ class LegacyServiceMonitor:
     """Monitor avançado para serviços legacy"""
     
     def __init__(self):
+        # Contadores, janela e erros de um método só mudam sob o lock dele
         self.metrics = defaultdict(lambda: {
             'call_count': 0,
-            'total_time': 0,
             'error_count': 0,
             'last_call': None,
             'response_times': deque(maxlen=100),  # Últimas 100 chamadas
+            'rt_sum': 0.0,  # Soma de response_times, mantida a cada registro
             'errors': deque(maxlen=50)  # Últimos 50 erros
         })
-        self.lock = threading.Lock()
+        # Um lock por método: chamadas a métodos diferentes não disputam o mesmo lock
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()  # usado só na criação de um lock novo
         self.logger = logging.getLogger('legacy_monitor')
     
     def monitor_method(self, method_name: str):
         """Decorator para monitorar métodos dos serviços legacy"""
         def decorator(func):
+            # Referências resolvidas uma vez por método decorado, não a cada chamada
+            metrics = self._metrics_for(method_name)
+            lock = self._lock_for(method_name)
+            record_time = self._record_time
+            now = time.monotonic
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = now()
                 
                 try:
                     result = func(*args, **kwargs)
-                    response_time = time.time() - start_time
-                    
-                    # Registrar sucesso
-                    self._record_success(method_name, response_time)
-                    
-                    return result
-                    
                 except Exception as e:
-                    response_time = time.time() - start_time
-                    
                     # Registrar erro
-                    self._record_error(method_name, response_time, str(e))
-                    
+                    self._record_error(method_name, now() - start_time, str(e))
                     raise
+                    
+                # Registrar sucesso (inline: é o caminho quente)
+                response_time = now() - start_time
+                last_call = datetime.now()
+                with lock:
+                    record_time(metrics, response_time)
+                    metrics['call_count'] += 1
+                    metrics['last_call'] = last_call
+                return result
             
             return wrapper
         return decorator
     
-    def _record_success(self, method_name: str, response_time: float):
-        """Registra chamada bem-sucedida"""
-        with self.lock:
-            metrics = self.metrics[method_name]
-            metrics['call_count'] += 1
-            metrics['total_time'] += response_time
-            metrics['last_call'] = datetime.now()
-            metrics['response_times'].append(response_time)
+    def _lock_for(self, method_name: str) -> threading.Lock:
+        """Retorna o lock do método, criando-o na primeira chamada"""
+        lock = self._locks.get(method_name)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.get(method_name)
+                if lock is None:
+                    lock = self._locks[method_name] = threading.Lock()
+        return lock
+    
+    def _metrics_for(self, method_name: str) -> Dict[str, Any]:
+        """Retorna as métricas do método; a criação da entrada é serializada"""
+        metrics = self.metrics.get(method_name)
+        if metrics is None:
+            with self._locks_guard:
+                metrics = self.metrics[method_name]
+        return metrics
+    
+    @staticmethod
+    def _record_time(metrics: Dict[str, Any], response_time: float):
+        """Adiciona um tempo à janela, mantendo 'rt_sum' igual à soma da janela.
+        
+        Deve ser chamada sob o lock do método: descartar o mais antigo e somar o
+        novo precisa ser uma única operação.
+        """
+        response_times = metrics['response_times']
+        if len(response_times) == response_times.maxlen:
+            metrics['rt_sum'] -= response_times[0]
+        response_times.append(response_time)
+        metrics['rt_sum'] += response_time
     
     def _record_error(self, method_name: str, response_time: float, error_msg: str):
         """Registra erro"""
-        with self.lock:
-            metrics = self.metrics[method_name]
+        metrics = self._metrics_for(method_name)
+        timestamp = datetime.now()
+        error = {
+            'timestamp': timestamp,
+            'error': error_msg,
+            'response_time': response_time
+        }
+        with self._lock_for(method_name):
+            self._record_time(metrics, response_time)
             metrics['call_count'] += 1
             metrics['error_count'] += 1
-            metrics['total_time'] += response_time
-            metrics['last_call'] = datetime.now()
-            metrics['response_times'].append(response_time)
-            metrics['errors'].append({
-                'timestamp': datetime.now(),
-                'error': error_msg,
-                'response_time': response_time
-            })
+            metrics['last_call'] = timestamp
+            metrics['errors'].append(error)
+    
+    def reset(self):
+        """Zera as métricas mantendo as entradas já referenciadas pelos decorators"""
+        for method_name, metrics in list(self.metrics.items()):
+            with self._lock_for(method_name):
+                metrics.update(call_count=0, error_count=0, last_call=None, rt_sum=0.0)
+                metrics['response_times'].clear()
+                metrics['errors'].clear()
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Retorna resumo das métricas"""
-        with self.lock:
-            summary = {}
-            
-            for method_name, metrics in self.metrics.items():
+        summary = {}
+        
+        # Snapshot da lista de métodos; cada um é lido sob o próprio lock
+        for method_name, metrics in list(self.metrics.items()):
+            with self._lock_for(method_name):
                 response_times = list(metrics['response_times'])
+                rt_sum = metrics['rt_sum']
+                call_count = metrics['call_count']
+                error_count = metrics['error_count']
+                last_call = metrics['last_call']
+                recent_errors = list(metrics['errors'])[-5:]  # Últimos 5 erros
+            
+            if response_times:
+                avg_response_time = rt_sum / len(response_times)
+                min_response_time = min(response_times)
                 
-                if response_times:
-                    avg_response_time = sum(response_times) / len(response_times)
-                    min_response_time = min(response_times)
-                    max_response_time = max(response_times)
-                    
-                    # Calcular percentis
-                    sorted_times = sorted(response_times)
-                    p95_index = int(len(sorted_times) * 0.95)
-                    p95_response_time = sorted_times[p95_index] if p95_index < len(sorted_times) else max_response_time
-                else:
-                    avg_response_time = min_response_time = max_response_time = p95_response_time = 0
-                
-                error_rate = (metrics['error_count'] / metrics['call_count'] * 100) if metrics['call_count'] > 0 else 0
-                
-                summary[method_name] = {
-                    'call_count': metrics['call_count'],
-                    'error_count': metrics['error_count'],
-                    'error_rate_percent': round(error_rate, 2),
-                    'avg_response_time': round(avg_response_time, 3),
-                    'min_response_time': round(min_response_time, 3),
-                    'max_response_time': round(max_response_time, 3),
-                    'p95_response_time': round(p95_response_time, 3),
-                    'last_call': metrics['last_call'].isoformat() if metrics['last_call'] else None,
-                    'recent_errors': [
-                        {
-                            'timestamp': error['timestamp'].isoformat(),
-                            'error': error['error'],
-                            'response_time': error['response_time']
-                        }
-                        for error in list(metrics['errors'])[-5:]  # Últimos 5 erros
-                    ]
-                }
+                # P95 = menor dos 5% maiores tempos; o primeiro deles é o máximo
+                slowest = heapq.nlargest(len(response_times) - int(len(response_times) * 0.95), response_times)
+                max_response_time = slowest[0]
+                p95_response_time = slowest[-1]
+            else:
+                avg_response_time = min_response_time = max_response_time = p95_response_time = 0
             
-            return summary
+            error_rate = (error_count / call_count * 100) if call_count > 0 else 0
+            
+            summary[method_name] = {
+                'call_count': call_count,
+                'error_count': error_count,
+                'error_rate_percent': round(error_rate, 2),
+                'avg_response_time': round(avg_response_time, 3),
+                'min_response_time': round(min_response_time, 3),
+                'max_response_time': round(max_response_time, 3),
+                'p95_response_time': round(p95_response_time, 3),
+                'last_call': last_call.isoformat() if last_call else None,
+                'recent_errors': [
+                    {
+                        'timestamp': error['timestamp'].isoformat(),
+                        'error': error['error'],
+                        'response_time': error['response_time']
+                    }
+                    for error in recent_errors
+                ]
+            }
+        
+        return summary
     
     def get_health_status(self) -> Dict[str, Any]:
         """Retorna status de saúde dos serviços"""